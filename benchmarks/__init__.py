@@ -0,0 +1 @@
+"""Mediciones de rendimiento de los generadores y las pruebas estadísticas."""
@@ -0,0 +1,56 @@
+"""
+Compara TestMethods.battery contra llamar a las cinco pruebas por separado.
+
+Uso:
+    python -m benchmarks.bench_battery [--max-n 10000000] [--repeticiones 3] [--lista]
+
+Con --lista la secuencia se pasa como lista de Python, igual que la guarda el
+menú principal; así se nota el costo de convertirla a arreglo en cada prueba.
+"""
+import argparse
+
+import numpy as np
+
+from benchmarks.bench_runs import best_time
+from tests import TestMethods
+
+
+def separate_calls(pruebas, numeros):
+    """Las cinco pruebas llamadas una por una, como desde el submenú."""
+    return {
+        "Chi-Cuadrada": pruebas.chi_squared_test(numeros),
+        "Kolmogorov-Smirnov": pruebas.kolgomorov_method(numeros),
+        "Corridas Arriba y Abajo": pruebas.up_down_method(numeros),
+        "Corridas Arriba y Abajo de la Media": pruebas.up_down_average(numeros),
+        "Huecos": pruebas.gap_test(numeros),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-n", type=int, default=10 ** 7, help="Tamaño máximo de la secuencia")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--lista", action="store_true", help="Pasar la secuencia como lista de Python")
+    args = parser.parse_args()
+
+    pruebas = TestMethods()
+    rng = np.random.default_rng(0)
+
+    print(f"{'n':>12}{'por separado (s)':>20}{'batería (s)':>14}{'aceleración':>14}")
+    n = 10 ** 3
+    while n <= args.max_n:
+        numeros = rng.random(n)
+        if args.lista:
+            numeros = numeros.tolist()
+        t_sep, separado = best_time(lambda: separate_calls(pruebas, numeros), args.repeticiones)
+        t_bat, bateria = best_time(lambda: pruebas.battery(numeros), args.repeticiones)
+        for nombre, resultado in separado.items():
+            assert resultado.statistics().keys() == bateria[nombre].statistics().keys(), nombre
+            assert resultado['aceptado'] == bateria[nombre]['aceptado'], nombre
+        print(f"{n:>12}{t_sep:>20.4f}{t_bat:>14.4f}{t_sep / t_bat:>13.1f}x")
+        del numeros, separado, bateria
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compara el cálculo vectorizado de las pruebas de corridas contra los ciclos originales.
+
+Uso:
+    python -m benchmarks.bench_runs [--max-n 100000000] [--max-loop 1000000] [--repeticiones 3]
+
+Los ciclos de Python se miden solo hasta --max-loop números porque a tamaños
+mayores tardan varios minutos.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from tests import TestMethods
+
+
+def up_down_loops(numeros):
+    """Símbolos, corridas e identificadores con los ciclos de la versión original."""
+    n = len(numeros)
+    simbolos = []
+    for i in range(1, n):
+        if numeros[i] > numeros[i-1]:
+            simbolos.append('+')
+        else:
+            simbolos.append('-')
+
+    Co = 1
+    for i in range(1, len(simbolos)):
+        if simbolos[i] != simbolos[i-1]:
+            Co += 1
+
+    corridas = [1]
+    corrida_actual = 1
+    for i in range(1, len(simbolos)):
+        if simbolos[i] != simbolos[i-1]:
+            corrida_actual += 1
+        corridas.append(corrida_actual)
+    return simbolos, Co, corridas
+
+
+def up_down_average_loops(numeros):
+    """Corridas arriba y abajo de la media con los ciclos de la versión original."""
+    n = len(numeros)
+    media = np.mean(numeros)
+    S = (numeros >= media).astype(int)
+
+    Co = 1
+    for i in range(1, n):
+        if S[i] != S[i-1]:
+            Co += 1
+
+    corridas = [1]
+    corrida_actual = 1
+    for i in range(1, n):
+        if S[i] != S[i-1]:
+            corrida_actual += 1
+        corridas.append(corrida_actual)
+    return S, Co, corridas
+
+
+def best_time(funcion, repeticiones):
+    """Mejor tiempo de `repeticiones` ejecuciones y el resultado de la última."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-n", type=int, default=10 ** 8, help="Tamaño máximo de la secuencia")
+    parser.add_argument("--max-loop", type=int, default=10 ** 6, help="Tamaño máximo para medir los ciclos")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    pruebas = TestMethods()
+    rng = np.random.default_rng(0)
+
+    print(f"{'prueba':<18}{'n':>12}{'ciclos (s)':>14}{'vectorizado (s)':>18}{'aceleración':>14}")
+    n = 10 ** 3
+    while n <= args.max_n:
+        numeros = rng.random(n)
+        media = np.mean(numeros)
+        casos = [
+            ("arriba/abajo", lambda: pruebas._up_down_runs(np.diff(numeros)), lambda: up_down_loops(numeros)),
+            ("arriba/abajo media", lambda: pruebas._above_below_runs(numeros, media),
+             lambda: up_down_average_loops(numeros)),
+        ]
+        for nombre, vectorizado, ciclos in casos:
+            t_vec, (_, co_vec, _) = best_time(vectorizado, args.repeticiones)
+            if n <= args.max_loop:
+                t_loop, (_, co_loop, _) = best_time(ciclos, 1)
+                assert co_loop == co_vec, f"{nombre}: Co distinto ({co_loop} vs {co_vec})"
+                print(f"{nombre:<18}{n:>12}{t_loop:>14.4f}{t_vec:>18.4f}{t_loop / t_vec:>13.0f}x")
+            else:
+                print(f"{nombre:<18}{n:>12}{'—':>14}{t_vec:>18.4f}{'—':>14}")
+        del numeros
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Mide cada generador de RandomGenerators y cada prueba de TestMethods a varios tamaños.
+
+Uso:
+    python -m benchmarks.bench_suite [--max-n 100000000] [--repeticiones 5] [--max-segundos 10]
+        [--casos linear_algorithm chi_squared_test ...] [--guardar base.json]
+        [--comparar base.json] [--umbral 0.25] [--min-n-comparar 10000] [--verificar-pequenos]
+
+Para cada caso y cada n = 10^3, 10^4, ... hasta --max-n reporta el rendimiento
+(números por segundo, con el mejor tiempo), la media y la desviación estándar de
+las repeticiones, y la memoria máxima reservada durante una ejecución aparte
+medida con tracemalloc. Un caso deja de crecer cuando una ejecución tarda más
+de --max-segundos o cuando llega a su propio límite (los generadores que
+devuelven listas de Python no pasan de 10^7).
+
+Con --guardar los resultados se escriben en un archivo JSON que sirve de línea
+base; con --comparar se compara contra una línea base y el programa termina con
+código 1 si algún caso perdió más de --umbral de su rendimiento. La línea base
+solo tiene sentido en la misma máquina.
+
+Como la comparación ignora los tamaños pequeños (dominados por el ruido),
+--verificar-pequenos (también incluido en --comparar) mide el algoritmo lineal
+a n = 10, 100 y 1000 contra el ciclo de Python equivalente en la misma
+corrida, sin línea base, y falla si algún caso es más lento que el límite de
+FACTOR_MAXIMO_PEQUENOS.
+"""
+import timeit
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from random_number_generators import RandomGenerators
+from tests import TestMethods
+
+# Los generadores que devuelven listas ocupan ~32 bytes por número; 10^8 no cabe en memoria
+MAX_N_LISTAS = 10 ** 7
+LCG = {"semilla": 7, "a": 69069, "c": 1, "m": 2 ** 32}
+TAMANOS_PEQUENOS = (10, 100, 1000)
+# Veces el tiempo del ciclo de Python que se tolera a n pequeño; el arreglo paga además
+# unos microsegundos fijos por crear el arreglo de NumPy
+FACTOR_MAXIMO_PEQUENOS = {"linear_algorithm": 1.5, "linear_algorithm_array": 2.0}
+
+
+def generator_cases(generadores: RandomGenerators) -> dict:
+    """{nombre: (función de n, n máximo)} de cada generador."""
+    return {
+        "linear_algorithm": (lambda n: generadores.linear_algorithm(*LCG.values(), n), MAX_N_LISTAS),
+        "linear_algorithm_array": (lambda n: generadores.linear_algorithm_array(*LCG.values(), n), None),
+        "linear_algorithm_parallel": (lambda n: generadores.linear_algorithm_parallel(*LCG.values(), n), None),
+        "mean_squares": (lambda n: generadores.mean_squares(56781234, n), MAX_N_LISTAS),
+        "middle_product": (lambda n: generadores.middle_product(56781234, 91234567, n), MAX_N_LISTAS),
+        "constant_multiplier": (lambda n: generadores.constant_multiplier(56781234, 91234567, n), MAX_N_LISTAS),
+    }
+
+
+def test_cases(pruebas: TestMethods) -> dict:
+    """{nombre: (función de la secuencia, n máximo)} de cada prueba y de la batería completa."""
+    return {
+        "chi_squared_test": (pruebas.chi_squared_test, None),
+        "kolgomorov_method": (pruebas.kolgomorov_method, None),
+        "up_down_method": (pruebas.up_down_method, None),
+        "up_down_average": (pruebas.up_down_average, None),
+        "gap_test": (pruebas.gap_test, None),
+        "battery": (pruebas.battery, None),
+    }
+
+
+def measure(funcion, repeticiones: int) -> dict:
+    """
+    Tiempos de `repeticiones` ejecuciones y la memoria máxima de una ejecución más.
+
+    Antes se hace una ejecución sin medir para que la primera importación de
+    SciPy o el cálculo de un valor crítico nuevo no cuenten como tiempo de la
+    prueba. La memoria se mide aparte porque tracemalloc hace más lentas las reservas.
+
+    Returns:
+        dict: mejor, media y desviación de los tiempos en segundos, y memoria_max en bytes
+    """
+    funcion()
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    try:
+        funcion()
+        memoria_max = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "mejor": min(tiempos),
+        "media": statistics.fmean(tiempos),
+        "desviacion": statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0,
+        "memoria_max": memoria_max,
+    }
+
+
+def run_suite(max_n: int, repeticiones: int, max_segundos: float, casos=None) -> dict:
+    """
+    Ejecuta los casos pedidos a tamaños crecientes.
+
+    Args:
+        max_n (int): Tamaño máximo de la secuencia
+        repeticiones (int): Ejecuciones cronometradas por caso y tamaño
+        max_segundos (float): Un caso deja de crecer si su mejor tiempo pasa de esto
+        casos: Nombres de los casos a ejecutar (default: todos)
+
+    Returns:
+        dict: {"nombre@n": mediciones con n y numeros_por_segundo}
+    """
+    todos = {**generator_cases(RandomGenerators()), **test_cases(TestMethods())}
+    desconocidos = set(casos or ()) - set(todos)
+    if desconocidos:
+        raise ValueError(f"Casos desconocidos: {', '.join(sorted(desconocidos))}")
+    es_prueba = set(test_cases(TestMethods()))
+
+    resultados = {}
+    print(f"{'caso':<28}{'n':>11}{'números/s':>14}{'media (s)':>12}{'desv. (s)':>12}{'memoria (MB)':>14}")
+    for nombre, (funcion, limite) in todos.items():
+        if casos and nombre not in casos:
+            continue
+        n = 10 ** 3
+        while n <= min(max_n, limite or max_n):
+            if nombre in es_prueba:
+                # Misma secuencia para un n dado sin importar qué casos se ejecuten antes:
+                # el costo del valor p de Kolmogorov depende de D
+                numeros = np.random.default_rng(n).random(n)
+                medicion = measure(lambda: funcion(numeros), repeticiones)
+                del numeros
+            else:
+                medicion = measure(lambda: funcion(n), repeticiones)
+            medicion.update(n=n, numeros_por_segundo=n / medicion["mejor"])
+            resultados[f"{nombre}@{n}"] = medicion
+            print(f"{nombre:<28}{n:>11}{medicion['numeros_por_segundo']:>14.3g}{medicion['media']:>12.4f}"
+                  f"{medicion['desviacion']:>12.4f}{medicion['memoria_max'] / 2 ** 20:>14.1f}")
+            if medicion["mejor"] > max_segundos:
+                break
+            n *= 10
+    return resultados
+
+
+def _reference_lcg(semilla: int, a: int, c: int, m: int, n: int) -> list:
+    """El algoritmo lineal paso a paso con enteros de Python, como referencia a n pequeño."""
+    numeros = []
+    for _ in range(n):
+        semilla = (a * semilla + c) % m
+        numeros.append(semilla / m)
+    return numeros
+
+
+def check_small_n(tamanos=TAMANOS_PEQUENOS) -> list:
+    """
+    Compara el algoritmo lineal a n pequeño contra _reference_lcg en la misma corrida.
+
+    Se usa el mejor de varios grupos de llamadas (timeit) para reducir el ruido
+    de tiempos de microsegundos.
+
+    Returns:
+        list: (caso, n, tiempo de referencia, tiempo del caso, factor) de cada caso
+            más lento que FACTOR_MAXIMO_PEQUENOS veces la referencia
+    """
+    generadores = RandomGenerators()
+    casos = {
+        "linear_algorithm": generadores.linear_algorithm,
+        "linear_algorithm_array": generadores.linear_algorithm_array,
+    }
+    lentos = []
+    print(f"\n{'caso':<28}{'n':>11}{'caso (µs)':>12}{'ciclo (µs)':>12}{'factor':>9}")
+    for n in tamanos:
+        argumentos = (*LCG.values(), n)
+        llamadas = max(1, 20000 // n)
+
+        def mejor(funcion):
+            return min(timeit.repeat(lambda: funcion(*argumentos), number=llamadas, repeat=7)) / llamadas
+
+        referencia = mejor(_reference_lcg)
+        for nombre, funcion in casos.items():
+            tiempo = mejor(funcion)
+            factor = tiempo / referencia
+            print(f"{nombre:<28}{n:>11}{tiempo * 1e6:>12.1f}{referencia * 1e6:>12.1f}{factor:>9.2f}")
+            if factor > FACTOR_MAXIMO_PEQUENOS[nombre]:
+                lentos.append((nombre, n, referencia, tiempo, factor))
+    return lentos
+
+
+def compare(resultados: dict, base: dict, umbral: float, min_n: int = 10 ** 4) -> list:
+    """
+    Casos que perdieron más de `umbral` (fracción) de su rendimiento respecto a la línea base.
+
+    Solo se comparan los casos presentes en ambos y con al menos `min_n`
+    números; a tamaños menores el tiempo es de microsegundos y domina el ruido.
+
+    Returns:
+        list: (caso, rendimiento base, rendimiento actual) de cada regresión
+    """
+    regresiones = []
+    for caso, medicion in resultados.items():
+        anterior = base.get(caso)
+        if anterior and medicion["n"] >= min_n and medicion["numeros_por_segundo"] < anterior["numeros_por_segundo"] * (1 - umbral):
+            regresiones.append((caso, anterior["numeros_por_segundo"], medicion["numeros_por_segundo"]))
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-n", type=int, default=10 ** 8, help="Tamaño máximo de la secuencia")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--max-segundos", type=float, default=10.0, help="Tiempo a partir del cual un caso deja de crecer")
+    parser.add_argument("--casos", nargs="+", help="Casos a ejecutar (default: todos)")
+    parser.add_argument("--guardar", help="Archivo JSON donde guardar los resultados como línea base")
+    parser.add_argument("--comparar", help="Línea base JSON contra la cual comparar")
+    parser.add_argument("--umbral", type=float, default=0.25, help="Pérdida de rendimiento tolerada (fracción)")
+    parser.add_argument("--min-n-comparar", type=int, default=10 ** 4, help="Tamaño mínimo que se compara")
+    parser.add_argument("--verificar-pequenos", action="store_true",
+                        help="Verificar el algoritmo lineal a n pequeño contra el ciclo de Python")
+    args = parser.parse_args()
+
+    resultados = run_suite(args.max_n, args.repeticiones, args.max_segundos, args.casos)
+
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": sys.version.split()[0],
+                "numpy": np.__version__,
+                "maquina": platform.platform(),
+                "resultados": resultados,
+            }, archivo, indent=2)
+        print(f"\nLínea base guardada en {args.guardar}")
+
+    fallas = False
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+        regresiones = compare(resultados, base, args.umbral, args.min_n_comparar)
+        for caso, anterior, actual in regresiones:
+            print(f"REGRESIÓN: {caso} bajó de {anterior:.3g} a {actual:.3g} números/s "
+                  f"({(1 - actual / anterior) * 100:.0f}%)")
+        fallas = bool(regresiones)
+        if not regresiones:
+            print(f"\nOK: ningún caso perdió más del {args.umbral * 100:.0f}% frente a {args.comparar}")
+
+    if args.comparar or args.verificar_pequenos:
+        lentos = check_small_n()
+        for caso, n, referencia, tiempo, factor in lentos:
+            print(f"REGRESIÓN: {caso}@{n} tarda {tiempo * 1e6:.1f} µs, {factor:.2f} veces el ciclo de Python "
+                  f"({referencia * 1e6:.1f} µs; máximo {FACTOR_MAXIMO_PEQUENOS[caso]})")
+        fallas = fallas or bool(lentos)
+        if not lentos:
+            print("\nOK: el algoritmo lineal a n pequeño no es más lento que el ciclo de Python")
+
+    if fallas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
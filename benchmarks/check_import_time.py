@@ -0,0 +1,81 @@
+"""
+Verifica que el arranque del menú no importe módulos pesados y respete un presupuesto de tiempo.
+
+Uso:
+    python -m benchmarks.check_import_time [--presupuesto-ms 150] [--repeticiones 3] [--modulo main]
+
+Importa el módulo en un intérprete nuevo con `python -X importtime`, lee el
+tiempo acumulado de cada import y termina con código 1 si aparece alguno de
+MODULOS_PESADOS o si el mejor tiempo total supera el presupuesto.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Deben cargarse solo al usarse por primera vez (ver utils.lazy)
+MODULOS_PESADOS = ("numpy", "pandas", "scipy", "tabulate")
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(modulo: str) -> dict:
+    """
+    Importa `modulo` en un proceso nuevo y devuelve {módulo importado: tiempo acumulado en µs}.
+
+    Args:
+        modulo (str): Módulo a importar, por ejemplo "main"
+
+    Returns:
+        dict: Tiempo acumulado (incluye sus dependencias) de cada módulo importado
+    """
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ_PROYECTO, capture_output=True, text=True, check=True,
+    )
+    tiempos = {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:"):
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        if acumulado.strip().isdigit():
+            tiempos[nombre.strip()] = int(acumulado)
+    return tiempos
+
+
+def heavy_modules(tiempos: dict) -> list:
+    """Paquetes de MODULOS_PESADOS de los que se importó el paquete o algún submódulo."""
+    return sorted({nombre.split(".")[0] for nombre in tiempos} & set(MODULOS_PESADOS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--presupuesto-ms", type=float, default=150.0, help="Tiempo máximo de importación")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Se usa el mejor tiempo")
+    parser.add_argument("--modulo", default="main", help="Módulo a importar")
+    args = parser.parse_args()
+
+    import_times(args.modulo)  # Calentar: compila los .pyc para no medir la compilación
+    mediciones = [import_times(args.modulo) for _ in range(args.repeticiones)]
+    mejor = min(mediciones, key=lambda tiempos: tiempos[args.modulo])
+    total_ms = mejor[args.modulo] / 1000
+
+    errores = []
+    pesados = heavy_modules(mejor)
+    if pesados:
+        errores.append(f"Se importaron módulos pesados al arrancar: {', '.join(pesados)}")
+    if total_ms > args.presupuesto_ms:
+        errores.append(f"Importar {args.modulo} tardó {total_ms:.1f} ms (presupuesto: {args.presupuesto_ms:.1f} ms)")
+
+    print(f"{'módulo':<50}{'acumulado (ms)':>16}")
+    for nombre, tiempo in sorted(mejor.items(), key=lambda item: -item[1])[:10]:
+        print(f"{nombre:<50}{tiempo / 1000:>16.1f}")
+
+    if errores:
+        for error in errores:
+            print(f"ERROR: {error}")
+        sys.exit(1)
+    print(f"\nOK: {args.modulo} se importa en {total_ms:.1f} ms sin módulos pesados")
+
+
+if __name__ == "__main__":
+    main()
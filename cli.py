@@ -0,0 +1,305 @@
+"""
+Modo por lotes: genera secuencias y las prueba sin menús, con salida JSON Lines o CSV.
+
+Uso:
+    python main.py --generador linear_algorithm --semillas 7 --a 69069 --c 1 --m 4294967296 \\
+        --cantidad 10000 --pruebas chi_squared_test kolgomorov_method --alpha 0.05
+    python main.py --generador mean_squares --semillas 5735 --cantidad 1000 --alpha 0.05 0.10 0.01
+    python main.py --trabajos trabajos.jsonl --formato csv --salida resultados.csv
+    python main.py --archivo secuencia.npy --pruebas kolgomorov_method
+    python main.py --trabajos trabajos.jsonl --metricas metricas.json --perfil corrida.prof
+
+El archivo de trabajos tiene un objeto JSON por renglón (o una lista JSON) con
+las mismas claves que los argumentos: generador, semillas, a, c, m, cantidad,
+pruebas, alpha e id opcional; con "archivo" se prueba una secuencia guardada
+en .npy en lugar de generarla. Los argumentos dados en la línea de comandos se
+usan como valores por omisión de cada trabajo.
+
+"alpha" (o --alpha) puede ser una lista de niveles de significancia: cada
+prueba se calcula una sola vez con el primero y el registro incluye además
+"decisiones" con la decisión en cada nivel; en CSV hay un renglón por nivel.
+"""
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import sys
+
+from random_number_generators import RandomGenerators, load_sequence
+from tests import TestMethods
+from utils import instrumentation
+
+# Cantidad de semillas que recibe cada generador
+GENERADORES = {
+    "mean_squares": 1,
+    "middle_product": 2,
+    "constant_multiplier": 2,
+    "linear_algorithm": 1,
+}
+PRUEBAS = ("chi_squared_test", "kolgomorov_method", "up_down_method", "up_down_average", "gap_test")
+# Nombre de cada prueba en TestMethods.battery
+NOMBRES_BATERIA = {
+    "chi_squared_test": "Chi-Cuadrada",
+    "kolgomorov_method": "Kolmogorov-Smirnov",
+    "up_down_method": "Corridas Arriba y Abajo",
+    "up_down_average": "Corridas Arriba y Abajo de la Media",
+    "gap_test": "Huecos",
+}
+# (estadístico, valor crítico) de cada prueba para las columnas del CSV
+ESTADISTICOS = {
+    "chi_squared_test": ("chi_cuadrado", "chi_critico"),
+    "kolgomorov_method": ("D", "D_critico"),
+    "up_down_method": ("Z0", "Z_critico"),
+    "up_down_average": ("Z0", "Z_critico"),
+    "gap_test": ("chi_cuadrado", "chi_critico"),
+}
+COLUMNAS_CSV = ("id", "archivo", "generador", "semillas", "parametros", "cantidad", "prueba", "alpha", "n",
+                "estadistico", "valor_critico", "p_valor", "aceptado", "conclusion", "error")
+CLAVES_TRABAJO = ("id", "archivo", "generador", "semillas", "a", "c", "m", "cantidad", "pruebas", "alpha")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argumentos del modo por lotes."""
+    parser = argparse.ArgumentParser(
+        prog="main.py", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--trabajos", help="Archivo JSON Lines (o lista JSON) con un trabajo por renglón")
+    parser.add_argument("--archivo", help="Secuencia guardada en .npy (en lugar de generarla)")
+    parser.add_argument("--generador", choices=sorted(GENERADORES))
+    parser.add_argument("--semillas", type=int, nargs="+", help="Una semilla, o dos para productos medios y multiplicador constante")
+    parser.add_argument("--a", type=int, help="Multiplicador del algoritmo lineal")
+    parser.add_argument("--c", type=int, help="Incremento del algoritmo lineal")
+    parser.add_argument("--m", type=int, help="Módulo del algoritmo lineal")
+    parser.add_argument("--cantidad", type=int, help="Cantidad de números a generar")
+    parser.add_argument("--pruebas", nargs="+", choices=PRUEBAS, default=list(PRUEBAS))
+    parser.add_argument("--alpha", type=float, nargs="+", default=[0.05],
+                        help="Niveles de significancia; el primero da el valor crítico y la conclusión")
+    parser.add_argument("--formato", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--salida", help="Archivo de salida (default: salida estándar)")
+    parser.add_argument("--metricas", help="Archivo JSON con el tiempo y la memoria de cada fase")
+    parser.add_argument("--perfil", help="Archivo donde guardar un perfil de cProfile de la corrida")
+    return parser
+
+
+def load_jobs(ruta: str):
+    """
+    Lee los trabajos de un archivo JSON Lines o de una lista JSON.
+
+    El archivo se abre al llamar la función, así que un archivo inexistente o
+    ilegible lanza OSError de inmediato; los renglones se leen al iterar.
+
+    Args:
+        ruta (str): Archivo de trabajos ("-" para la entrada estándar)
+
+    Returns:
+        Iterador de trabajos en orden: un dict por renglón, o un ValueError en
+            lugar del renglón con JSON inválido para reportarlo sin detener la corrida
+    """
+    archivo = contextlib.nullcontext(sys.stdin) if ruta == "-" else open(ruta, encoding="utf-8")
+    return _read_jobs(archivo, ruta)
+
+
+def _read_jobs(archivo, ruta: str):
+    """Trabajos de un archivo ya abierto (ver load_jobs)."""
+    with archivo as archivo:
+        try:
+            primero = archivo.read(1)
+            while primero.isspace():
+                primero = archivo.read(1)
+            if primero == "[":
+                try:
+                    trabajos = json.loads(primero + archivo.read())
+                except json.JSONDecodeError as error:
+                    yield ValueError(f"{ruta}: {error}")
+                    return
+                yield from trabajos
+                return
+            for numero, linea in enumerate(itertools.chain([primero + archivo.readline()], archivo), start=1):
+                if linea.strip():
+                    try:
+                        yield json.loads(linea)
+                    except json.JSONDecodeError as error:
+                        yield ValueError(f"Renglón {numero} de {ruta}: {error}")
+        except UnicodeDecodeError as error:
+            yield ValueError(f"{ruta} no es texto UTF-8: {error}")
+
+
+def generate(generadores: RandomGenerators, trabajo: dict):
+    """Genera la secuencia del trabajo con el generador indicado, o la lee de su archivo."""
+    if trabajo.get("archivo"):
+        return load_sequence(trabajo["archivo"], normalizar=True)[0]
+    generador, semillas, cantidad = trabajo["generador"], trabajo["semillas"], trabajo["cantidad"]
+    if generador not in GENERADORES:
+        raise ValueError(f"Generador desconocido: {generador}")
+    if len(semillas) != GENERADORES[generador]:
+        raise ValueError(f"{generador} necesita {GENERADORES[generador]} semilla(s)")
+    if cantidad is None or cantidad < 2:
+        raise ValueError("La cantidad de números debe ser al menos 2")
+
+    if generador == "linear_algorithm":
+        if None in (trabajo["a"], trabajo["c"], trabajo["m"]):
+            raise ValueError("linear_algorithm necesita a, c y m")
+        if trabajo["m"] <= 0:
+            raise ValueError("El módulo m debe ser positivo")
+        return generadores.linear_algorithm_array(semillas[0], trabajo["a"], trabajo["c"], trabajo["m"], cantidad)
+    return getattr(generadores, generador)(*semillas, cantidad, formato="float64")
+
+
+def run_job(generadores: RandomGenerators, pruebas: TestMethods, trabajo: dict) -> dict:
+    """
+    Genera la secuencia de un trabajo y le aplica las pruebas pedidas.
+
+    Args:
+        generadores (RandomGenerators): Generadores a usar
+        pruebas (TestMethods): Pruebas a usar
+        trabajo (dict): Trabajo ya completado con los valores por omisión
+
+    Returns:
+        dict: Registro con los datos del trabajo y los valores escalares de cada prueba,
+            o con la clave 'error' si el trabajo no se pudo ejecutar
+    """
+    registro = {
+        "id": trabajo["id"],
+        **({"archivo": trabajo["archivo"]} if trabajo.get("archivo") else {}),
+        "generador": trabajo["generador"],
+        "semillas": trabajo["semillas"],
+        "parametros": {clave: trabajo[clave] for clave in ("a", "c", "m") if trabajo[clave] is not None},
+        "cantidad": trabajo["cantidad"],
+    }
+    try:
+        nombres = list(dict.fromkeys(trabajo["pruebas"]))
+        desconocidas = [nombre for nombre in nombres if nombre not in PRUEBAS]
+        if desconocidas:
+            raise ValueError(f"Pruebas desconocidas: {', '.join(desconocidas)}")
+
+        numeros = generate(generadores, trabajo)
+        alphas = trabajo["alpha"]
+        if not alphas:
+            raise ValueError("Se necesita al menos un nivel de significancia")
+        alpha = alphas[0]
+        if len(nombres) > 1:
+            # Varias pruebas: una sola conversión y cálculos intermedios compartidos
+            bateria = pruebas.battery(numeros, alpha=alpha)
+            resultados = {nombre: bateria[NOMBRES_BATERIA[nombre]] for nombre in nombres}
+        else:
+            resultados = {nombre: getattr(pruebas, nombre)(numeros, alpha=alpha) for nombre in nombres}
+        registro["pruebas"] = {
+            nombre: {**resultado.scalars(("p_valor",)), "decisiones": resultado.decisions(alphas)}
+            for nombre, resultado in resultados.items()
+        }
+    except Exception as error:
+        # Un trabajo inválido (incluso con un error inesperado) nunca detiene la corrida
+        registro["error"] = str(error) or type(error).__name__
+    return registro
+
+
+def csv_rows(registro: dict):
+    """
+    Renglones del CSV de un registro: uno por prueba y nivel de significancia (o uno con el error).
+
+    El valor crítico y la conclusión corresponden al primer nivel; los demás
+    renglones solo llevan su decisión.
+    """
+    comunes = {
+        "id": registro["id"],
+        "archivo": registro.get("archivo", ""),
+        "generador": registro["generador"],
+        "semillas": " ".join(str(semilla) for semilla in registro["semillas"] or []),
+        "parametros": json.dumps(registro["parametros"]) if registro["parametros"] else "",
+        "cantidad": registro["cantidad"],
+    }
+    if "error" in registro:
+        yield {**comunes, "error": registro["error"]}
+        return
+    for nombre, valores in registro["pruebas"].items():
+        estadistico, critico = ESTADISTICOS[nombre]
+        prueba = {
+            **comunes,
+            "prueba": nombre,
+            "n": valores.get("n"),
+            "estadistico": valores.get(estadistico),
+            "p_valor": valores.get("p_valor"),
+        }
+        yield {
+            **prueba,
+            "alpha": valores.get("alpha"),
+            "valor_critico": valores.get(critico),
+            "aceptado": valores.get("aceptado"),
+            "conclusion": valores.get("conclusion"),
+        }
+        for alpha, aceptado in valores["decisiones"].items():
+            if alpha != valores.get("alpha"):
+                yield {**prueba, "alpha": alpha, "aceptado": aceptado}
+
+
+def _complete_job(trabajo: dict, omisiones: dict, numero: int) -> dict:
+    """Completa un trabajo con los valores por omisión y normaliza sus semillas."""
+    if not isinstance(trabajo, dict):
+        raise ValueError(f"El trabajo {numero} no es un objeto JSON")
+    desconocidas = set(trabajo) - set(CLAVES_TRABAJO) - {"semilla"}
+    if desconocidas:
+        raise ValueError(f"Claves desconocidas en el trabajo {numero}: {', '.join(sorted(desconocidas))}")
+    completo = {**omisiones, **trabajo}
+    if "semilla" in completo:
+        completo["semillas"] = [completo.pop("semilla")]
+    if isinstance(completo.get("pruebas"), str):
+        completo["pruebas"] = [completo["pruebas"]]
+    if isinstance(completo.get("alpha"), (int, float)):
+        completo["alpha"] = [completo["alpha"]]
+    completo["semillas"] = list(completo.get("semillas") or [])
+    completo["id"] = completo.get("id", numero)
+    return completo
+
+
+def run_batch(argumentos=None) -> int:
+    """
+    Ejecuta el modo por lotes.
+
+    Args:
+        argumentos (list): Argumentos de la línea de comandos (default: sys.argv[1:])
+
+    Returns:
+        int: Código de salida; 1 si algún trabajo terminó con error
+    """
+    parser = build_parser()
+    args = parser.parse_args(argumentos)
+    omisiones = {
+        "archivo": args.archivo, "generador": args.generador, "semillas": args.semillas, "a": args.a, "c": args.c, "m": args.m,
+        "cantidad": args.cantidad, "pruebas": args.pruebas, "alpha": args.alpha,
+    }
+    if args.trabajos:
+        try:
+            trabajos = load_jobs(args.trabajos)
+        except OSError as error:
+            parser.error(f"No se pudo leer el archivo de trabajos {args.trabajos}: {error.strerror or error}")
+    elif args.generador or args.archivo:
+        trabajos = [{}]
+    else:
+        parser.error("Se necesita --generador, --archivo o --trabajos")
+
+    generadores, pruebas = RandomGenerators(), TestMethods()
+    errores = 0
+    with instrumentation.session(args.metricas, args.perfil), \
+            (contextlib.nullcontext(sys.stdout) if args.salida is None
+             else open(args.salida, "w", encoding="utf-8", newline="")) as salida:
+        escritor = None
+        if args.formato == "csv":
+            escritor = csv.DictWriter(salida, fieldnames=COLUMNAS_CSV)
+            escritor.writeheader()
+        # Los avisos que imprimen las pruebas no deben mezclarse con la salida de datos
+        with contextlib.redirect_stdout(sys.stderr):
+            for numero, trabajo in enumerate(trabajos, start=1):
+                try:
+                    if isinstance(trabajo, ValueError):
+                        raise trabajo
+                    registro = run_job(generadores, pruebas, _complete_job(trabajo, omisiones, numero))
+                except (ValueError, TypeError) as error:
+                    registro = {"id": numero, "generador": None, "semillas": None, "parametros": {},
+                                "cantidad": None, "error": str(error)}
+                errores += "error" in registro
+                if escritor is None:
+                    salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                else:
+                    escritor.writerows(csv_rows(registro))
+    return 1 if errores else 0
@@ -1,14 +1,19 @@
 """
 Proyecto: Generador y Pruebas de Números Aleatorios
 Menú principal para interactuar con generadores y métodos de prueba
+
+Con la variable de entorno SIMULACION_METRICAS=metricas.json se mide el tiempo
+y la memoria de cada fase (generación, pruebas, tablas, despliegue) y se
+guardan al salir; con SIMULACION_PERFIL=corrida.prof se captura además cProfile.
 """
-from random_number_generators import RandomGenerators
+from random_number_generators import RandomGenerators, save_sequence, load_sequence
 from tests import TestMethods
 from utils import (
-    get_valid_seed, get_alpha, show_generator_table, 
+    get_valid_seed, get_alpha, show_generator_table, show_lcg_period,
     clear_screen, show_test_results, get_n, get_n_kolgomorov
 )
-from tabulate import tabulate
+from utils import instrumentation
+import os
 import sys
 from utils.utils import get_n_kolgomorov
 
@@ -19,6 +24,7 @@ class MenuPrincipal:
         self.numeros_generados = None
         self.metodo_usado = None
         self.semilla_actual = None
+        self.parametros_actuales = {}
         
     def show_main_menu(self):
         """Muestra el menú principal del programa"""
@@ -31,7 +37,10 @@ class MenuPrincipal:
         print("2. Productos medios")
         print("3. Multiplicador constante")
         print("4. Algoritmo lineal")
+        print("4a. Analizar periodo del algoritmo lineal")
         print("5. Probar los métodos (Submenú)")
+        print("5a. Guardar los números generados (.npy)")
+        print("5b. Cargar números guardados (.npy)")
         print("6. Salir")
         print("=" * 60)
         
@@ -41,15 +50,17 @@ class MenuPrincipal:
         semilla = get_valid_seed()
         cantidad = get_n()
         
-        self.numeros_generados = self.generadores.mean_squares(semilla, cantidad)
+        self.numeros_generados = self.generadores.mean_squares(semilla, cantidad, formato="float64")
         self.metodo_usado = "Cuadrados Medios"
         self.semilla_actual = semilla
+        self.parametros_actuales = {}
+        ciclo = self.generadores.detect_cycle("mean_squares", semilla, numeros=self.numeros_generados)
         
         show_generator_table(
             numeros=self.numeros_generados,
             metodo="Cuadrados Medios",
             semilla=semilla,
-            parametros={"Cantidad": cantidad}
+            parametros={"Cantidad": cantidad, **self.describe_cycle(ciclo)}
         )
         
     def execute_middle_product(self):
@@ -60,17 +71,27 @@ class MenuPrincipal:
         semilla_2 = get_valid_seed()
         cantidad = get_n()
         
-        self.numeros_generados = self.generadores.middle_product(semilla_1, semilla_2, cantidad)
+        self.numeros_generados = self.generadores.middle_product(semilla_1, semilla_2, cantidad, formato="float64")
         self.metodo_usado = "Productos Medios"
         self.semilla_actual = (semilla_1, semilla_2)
+        self.parametros_actuales = {}
+        ciclo = self.generadores.detect_cycle(
+            "middle_product", semilla_1, semilla_2, numeros=self.numeros_generados
+        )
         
         show_generator_table(
             numeros=self.numeros_generados,
             metodo="Productos Medios",
             semilla=f"{semilla_1}, {semilla_2}",
-            parametros={"Cantidad": cantidad}
+            parametros={"Cantidad": cantidad, **self.describe_cycle(ciclo)}
         )
         
+    def describe_cycle(self, ciclo):
+        """Describe la cola y el periodo de la secuencia para la tabla del generador"""
+        if ciclo is None:
+            return {"Periodo": "Sin repetición en los números generados"}
+        return {"Cola": ciclo["cola"], "Periodo": ciclo["periodo"]}
+        
     def execute_constant_multiplier(self):
         """Ejecuta el método de multiplicador constante"""
         print("\n--- Método de Multiplicador Constante ---")
@@ -79,9 +100,10 @@ class MenuPrincipal:
         semilla_2 = get_valid_seed()
         cantidad = get_n()
         
-        self.numeros_generados = self.generadores.constant_multiplier(semilla_1, semilla_2, cantidad)
+        self.numeros_generados = self.generadores.constant_multiplier(semilla_1, semilla_2, cantidad, formato="float64")
         self.metodo_usado = "Multiplicador Constante"
         self.semilla_actual = (semilla_1, semilla_2)
+        self.parametros_actuales = {}
         
         show_generator_table(
             numeros=self.numeros_generados,
@@ -99,9 +121,10 @@ class MenuPrincipal:
         m = int(input("Ingresa el módulo (m): "))
         cantidad = get_n()
         
-        self.numeros_generados = self.generadores.linear_algorithm(semilla, a, c, m, cantidad)
+        self.numeros_generados = self.generadores.linear_algorithm(semilla, a, c, m, cantidad, formato="float64")
         self.metodo_usado = "Algoritmo Lineal"
         self.semilla_actual = semilla
+        self.parametros_actuales = {"a": a, "c": c, "m": m}
         
         show_generator_table(
             numeros=self.numeros_generados,
@@ -110,6 +133,55 @@ class MenuPrincipal:
             parametros={"a": a, "c": c, "m": m, "Cantidad": cantidad}
         )
         
+    def execute_lcg_period(self):
+        """Analiza el periodo del algoritmo lineal congruencial sin generar la secuencia"""
+        print("\n--- Periodo del Algoritmo Lineal Congruencial ---")
+        semilla = int(input("Ingresa la semilla (X0): "))
+        a = int(input("Ingresa el multiplicador (a): "))
+        c = int(input("Ingresa el incremento (c): "))
+        m = int(input("Ingresa el módulo (m): "))
+        
+        show_lcg_period(self.generadores.lcg_period(semilla, a, c, m))
+        
+    def has_numbers(self) -> bool:
+        """Indica si hay una secuencia generada o cargada (lista, arreglo o np.memmap)"""
+        return self.numeros_generados is not None and len(self.numeros_generados) > 0
+        
+    def save_numbers(self):
+        """Guarda los números generados en un archivo .npy con sus metadatos"""
+        print("\n--- Guardar números generados ---")
+        if not self.has_numbers():
+            print("No hay números generados para guardar.")
+            return
+        ruta = input("Ruta del archivo (.npy): ").strip()
+        metadatos = {
+            "generador": self.metodo_usado,
+            "semillas": list(self.semilla_actual) if isinstance(self.semilla_actual, tuple) else [self.semilla_actual],
+            "parametros": self.parametros_actuales,
+        }
+        try:
+            ruta = save_sequence(ruta, self.numeros_generados, metadatos)
+        except (OSError, ValueError) as error:
+            print(f"Error al guardar: {error}")
+            return
+        print(f"Se guardaron {len(self.numeros_generados)} números en {ruta}")
+        
+    def load_numbers(self):
+        """Carga una secuencia guardada (mapeada en memoria, sin leerla completa)"""
+        print("\n--- Cargar números guardados ---")
+        ruta = input("Ruta del archivo (.npy): ").strip()
+        try:
+            numeros, metadatos = load_sequence(ruta, normalizar=True)
+        except (OSError, ValueError) as error:
+            print(f"Error al cargar: {error}")
+            return
+        self.numeros_generados = numeros
+        self.metodo_usado = metadatos.get("generador", f"Archivo {ruta}")
+        semillas = metadatos.get("semillas") or [None]
+        self.semilla_actual = tuple(semillas) if len(semillas) > 1 else semillas[0]
+        self.parametros_actuales = metadatos.get("parametros", {})
+        print(f"Se cargaron {len(numeros)} números ({self.metodo_usado})")
+        
     def show_test_submenu(self):
         """Muestra el submenú de pruebas"""
         while True:
@@ -118,7 +190,7 @@ class MenuPrincipal:
             print("### Menú de pruebas estadísticas ###")
             print("=" * 60)
             
-            if self.numeros_generados:
+            if self.has_numbers():
                 print(f"Números generados disponibles: {len(self.numeros_generados)}")
                 print(f"Método usado: {self.metodo_usado}")
             else:
@@ -132,7 +204,8 @@ class MenuPrincipal:
             print("4. Prueba de corridas arriba y abajo de la media")
             print("\n-- INDEPENDENCIA --")
             print("5. Prueba de huecos")
-            print("\n6. Volver al menú principal")
+            print("\n6. Ejecutar todas las pruebas")
+            print("7. Volver al menú principal")
             print("=" * 60)
             
             opcion = input("Selecciona una opción: ")
@@ -148,6 +221,8 @@ class MenuPrincipal:
             elif opcion == "5":
                 self.execute_gaps()
             elif opcion == "6":
+                self.execute_battery()
+            elif opcion == "7":
                 break
             else:
                 print("Opción inválida")
@@ -158,13 +233,13 @@ class MenuPrincipal:
         print("\n--- Prueba Chi-Cuadrada (x²) ---")
         alpha = get_alpha()
         
-        if self.numeros_generados:
+        if self.has_numbers():
             usar_generados = input("¿Usar números ya generados? (s/n): ").lower()
             numeros = self.numeros_generados if usar_generados == 's' else None
         else:
             numeros = None
             
-        n = len(numeros) if numeros else get_n()
+        n = len(numeros) if numeros is not None else get_n()
         
         resultados = self.pruebas.chi_squared_test(numeros=numeros, n=n, alpha=alpha)
         show_test_results(resultados, "Chi-Cuadrada")
@@ -175,24 +250,14 @@ class MenuPrincipal:
         print("\n--- Prueba Kolmogorov-Smirnov ---")
         alpha = get_alpha()
         
-        if self.numeros_generados and len(self.numeros_generados) > 20:
-            print("ERROR: El método Kolmogorov-Smirnov solo soporta máximo 20 números.")
-            print("Por favor, genera una nueva secuencia con 20 o menos números.")
-            input("Presiona Enter para continuar...")
-            return
-            
-        if self.numeros_generados:
+        if self.has_numbers():
             usar_generados = input("¿Usar números ya generados? (s/n): ").lower()
             numeros = self.numeros_generados if usar_generados == 's' else None
         else:
             numeros = None
             
-        n = len(numeros) if numeros else get_n_kolgomorov()
+        n = len(numeros) if numeros is not None else get_n_kolgomorov()
         
-        if n > 20:
-            print("ERROR: Solo se permiten máximo 20 números. Usando 20 por defecto.")
-            n = 20
-            
         resultados = self.pruebas.kolgomorov_method(numeros=numeros, alpha=alpha, n=n)
         show_test_results(resultados, "Kolmogorov-Smirnov")
         input("\nPresiona Enter para continuar...")
@@ -202,13 +267,13 @@ class MenuPrincipal:
         print("\n--- Prueba de Corridas Arriba y Abajo ---")
         alpha = get_alpha()
         
-        if self.numeros_generados:
+        if self.has_numbers():
             usar_generados = input("¿Usar números ya generados? (s/n): ").lower()
             numeros = self.numeros_generados if usar_generados == 's' else None
         else:
             numeros = None
             
-        n = len(numeros) if numeros else get_n()
+        n = len(numeros) if numeros is not None else get_n()
         
         resultados = self.pruebas.up_down_method(numeros=numeros, n=n, alpha=alpha)
         show_test_results(resultados, "Corridas Arriba y Abajo")
@@ -219,16 +284,20 @@ class MenuPrincipal:
         print("\n--- Prueba de Corridas Arriba y Abajo de la Media ---")
         alpha = get_alpha()
         
-        if self.numeros_generados:
+        if self.has_numbers():
             usar_generados = input("¿Usar números ya generados? (s/n): ").lower()
             numeros = self.numeros_generados if usar_generados == 's' else None
         else:
             numeros = None
             
-        n = len(numeros) if numeros else get_n()
+        n = len(numeros) if numeros is not None else get_n()
         
-        resultados = self.pruebas.up_down_average(numeros=numeros, n=n, alpha=alpha)
-        show_test_results(resultados, "Corridas Arriba y Abajo de la Media")
+        try:
+            resultados = self.pruebas.up_down_average(numeros=numeros, n=n, alpha=alpha)
+        except ValueError as error:
+            print(f"Error: {error}")
+        else:
+            show_test_results(resultados, "Corridas Arriba y Abajo de la Media")
         input("\nPresiona Enter para continuar...")
         
     def execute_gaps(self):
@@ -236,18 +305,40 @@ class MenuPrincipal:
         print("\n--- Prueba de Huecos ---")
         alpha = get_alpha()
         
-        if self.numeros_generados:
+        if self.has_numbers():
             usar_generados = input("¿Usar números ya generados? (s/n): ").lower()
             numeros = self.numeros_generados if usar_generados == 's' else None
         else:
             numeros = None
             
-        n = len(numeros) if numeros else get_n()
+        n = len(numeros) if numeros is not None else get_n()
         
         resultados = self.pruebas.gap_test(numeros=numeros, n=n, alpha=alpha)
         show_test_results(resultados, "Huecos")
         input("\nPresiona Enter para continuar...")
         
+    def execute_battery(self):
+        """Ejecuta las cinco pruebas sobre la misma secuencia"""
+        print("\n--- Todas las pruebas ---")
+        alpha = get_alpha()
+        
+        if self.has_numbers():
+            usar_generados = input("¿Usar números ya generados? (s/n): ").lower()
+            numeros = self.numeros_generados if usar_generados == 's' else None
+        else:
+            numeros = None
+            
+        n = len(numeros) if numeros is not None else get_n()
+        
+        try:
+            bateria = self.pruebas.battery(numeros=numeros, n=n, alpha=alpha)
+        except ValueError as error:
+            print(f"Error: {error}")
+        else:
+            for nombre, resultados in bateria.items():
+                show_test_results(resultados, nombre)
+        input("\nPresiona Enter para continuar...")
+        
     def execute(self):
         """Ejecuta el programa principal"""
         while True:
@@ -266,8 +357,17 @@ class MenuPrincipal:
             elif opcion == "4":
                 self.execute_linear_algorithm()
                 input("\nPresiona Enter para continuar...")
+            elif opcion.lower() == "4a":
+                self.execute_lcg_period()
+                input("\nPresiona Enter para continuar...")
             elif opcion == "5":
                 self.show_test_submenu()
+            elif opcion.lower() == "5a":
+                self.save_numbers()
+                input("\nPresiona Enter para continuar...")
+            elif opcion.lower() == "5b":
+                self.load_numbers()
+                input("\nPresiona Enter para continuar...")
             elif opcion == "6":
                 print("\nBye.")
                 sys.exit(0)
@@ -277,10 +377,14 @@ class MenuPrincipal:
 
 
 def main():
-    """Función principal del programa"""
+    """Función principal del programa; con argumentos ejecuta el modo por lotes (ver cli.py)"""
+    if len(sys.argv) > 1:
+        from cli import run_batch
+        sys.exit(run_batch(sys.argv[1:]))
     try:
-        menu = MenuPrincipal()
-        menu.execute()
+        with instrumentation.session(os.environ.get("SIMULACION_METRICAS"), os.environ.get("SIMULACION_PERFIL")):
+            menu = MenuPrincipal()
+            menu.execute()
     except KeyboardInterrupt:
         print("\n\n¡Programa interrumpido por el usuario!")
         sys.exit(0)
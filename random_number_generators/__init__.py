@@ -1,5 +1,20 @@
 from random_number_generators.random_generators import RandomGenerators
+from random_number_generators.lcg import lcg_skip, lcg_jump
+from random_number_generators.streams import RandomStream
+from random_number_generators.cycles import PeriodicSequenceError
+from random_number_generators.mean_squares_index import MeanSquaresIndex
+from random_number_generators.storage import save_sequence, save_blocks, load_sequence
+from random_number_generators.formats import FORMATOS_SALIDA
 
 __all__ = [
     "RandomGenerators",
+    "RandomStream",
+    "PeriodicSequenceError",
+    "MeanSquaresIndex",
+    "lcg_skip",
+    "lcg_jump",
+    "save_sequence",
+    "save_blocks",
+    "load_sequence",
+    "FORMATOS_SALIDA",
 ]
\ No newline at end of file
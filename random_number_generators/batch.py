@@ -0,0 +1,202 @@
+""" Generación por lotes: muchas semillas avanzan juntas como carriles de NumPy. """
+from __future__ import annotations
+
+from utils.lazy import lazy_import
+
+from random_number_generators.lcg import MODULO_MAXIMO_VECTORIZADO, MODULO_MAXIMO_FLOTANTE
+from random_number_generators.middle_digits import (
+    middle_square_params, middle_product_params, fits_uint64,
+    middle_product_states, constant_multiplier_states
+)
+
+np = lazy_import("numpy")
+
+
+def mean_squares_lanes(semillas, cantidad_numeros: int) -> tuple:
+    """
+    Avanza cuadrados medios para todas las semillas a la vez.
+
+    Cada carril usa la longitud de su propia semilla, así que se pueden
+    mezclar semillas de distinta cantidad de dígitos.
+
+    Args:
+        semillas: Semillas iniciales (enteros no negativos)
+        cantidad_numeros (int): Cantidad de estados por semilla
+
+    Returns:
+        tuple: (estados de forma (semillas x cantidad_numeros), longitudes por carril)
+    """
+    semillas = _check_seeds(semillas)
+    longitudes = [len(str(semilla)) for semilla in semillas]
+    parametros = [middle_square_params(longitud) for longitud in longitudes]
+    tipo = _lane_dtype(longitudes)
+
+    valores = np.array(semillas, dtype=tipo)
+    divisores = np.array([divisor for divisor, _ in parametros], dtype=tipo)
+    modulos = np.array([modulo for _, modulo in parametros], dtype=tipo)
+
+    salida = np.empty((cantidad_numeros, len(semillas)), dtype=tipo)
+    for j in range(cantidad_numeros):
+        valores = valores * valores // divisores % modulos
+        salida[j] = valores
+    return np.ascontiguousarray(salida.T), longitudes
+
+
+def middle_product_lanes(semillas_1, semillas_2, cantidad_numeros: int) -> tuple:
+    """
+    Avanza productos medios para todos los pares de semillas a la vez.
+
+    Los dos primeros pasos se calculan por carril con enteros exactos (el
+    producto inicial puede tener más de 2 * longitud dígitos); desde ahí
+    todos los estados tienen a lo más `longitud` dígitos y se vectorizan.
+
+    Args:
+        semillas_1: Primeras semillas (enteros no negativos)
+        semillas_2: Segundas semillas (enteros no negativos)
+        cantidad_numeros (int): Cantidad de estados por par
+
+    Returns:
+        tuple: (estados de forma (pares x cantidad_numeros), longitudes por carril)
+    """
+    semillas_1, semillas_2 = _check_seeds(semillas_1), _check_seeds(semillas_2)
+    if len(semillas_1) != len(semillas_2):
+        raise ValueError("Se necesita la misma cantidad de primeras y segundas semillas")
+
+    longitudes = [len(str(semilla)) for semilla in semillas_1]
+    tipo = _lane_dtype(longitudes)
+    iniciales = min(2, cantidad_numeros)
+    primeros = [middle_product_states(s1, s2, longitud, iniciales)
+                for s1, s2, longitud in zip(semillas_1, semillas_2, longitudes)]
+
+    salida = np.empty((cantidad_numeros, len(semillas_1)), dtype=tipo)
+    salida[:iniciales] = np.array(primeros, dtype=tipo).reshape(len(semillas_1), iniciales).T
+    if cantidad_numeros > iniciales:
+        divisores, modulos = _product_params(longitudes, tipo)
+        anteriores, actuales = salida[0].copy(), salida[1].copy()
+        for j in range(iniciales, cantidad_numeros):
+            anteriores, actuales = actuales, anteriores * actuales // divisores % modulos
+            salida[j] = actuales
+    return np.ascontiguousarray(salida.T), longitudes
+
+
+def constant_multiplier_lanes(constantes, semillas, cantidad_numeros: int) -> tuple:
+    """
+    Avanza multiplicador constante para todos los pares (constante, semilla) a la vez.
+
+    Args:
+        constantes: Multiplicadores constantes (primeras semillas, enteros no negativos)
+        semillas: Segundas semillas (enteros no negativos)
+        cantidad_numeros (int): Cantidad de estados por par
+
+    Returns:
+        tuple: (estados de forma (pares x cantidad_numeros), longitudes por carril)
+    """
+    constantes, semillas = _check_seeds(constantes), _check_seeds(semillas)
+    if len(constantes) != len(semillas):
+        raise ValueError("Se necesita la misma cantidad de primeras y segundas semillas")
+
+    longitudes = [len(str(constante)) for constante in constantes]
+    tipo = _lane_dtype(longitudes)
+    iniciales = min(1, cantidad_numeros)
+    primeros = [constant_multiplier_states(constante, semilla, longitud, iniciales)
+                for constante, semilla, longitud in zip(constantes, semillas, longitudes)]
+
+    salida = np.empty((cantidad_numeros, len(constantes)), dtype=tipo)
+    salida[:iniciales] = np.array(primeros, dtype=tipo).reshape(len(constantes), iniciales).T
+    if cantidad_numeros > iniciales:
+        divisores, modulos = _product_params(longitudes, tipo)
+        factores = np.array(constantes, dtype=tipo)
+        valores = salida[0].copy()
+        for j in range(iniciales, cantidad_numeros):
+            valores = factores * valores // divisores % modulos
+            salida[j] = valores
+    return np.ascontiguousarray(salida.T), longitudes
+
+
+def linear_algorithm_lanes(semillas, a, c, m, cantidad_numeros: int) -> np.ndarray:
+    """
+    Avanza el algoritmo lineal para todas las semillas a la vez.
+
+    a, c y m pueden ser escalares o arreglos del mismo tamaño que `semillas`.
+    Se usa uint64 si todos los módulos son <= 2**32 y enteros exactos en otro caso.
+
+    Args:
+        semillas: Semillas iniciales
+        a: Multiplicador(es)
+        c: Incremento(s)
+        m: Módulo(s)
+        cantidad_numeros (int): Cantidad de estados por semilla
+
+    Returns:
+        np.ndarray: Estados de forma (semillas x cantidad_numeros)
+    """
+    semillas = [int(semilla) for semilla in np.asarray(semillas, dtype=object).ravel().tolist()]
+    carriles = len(semillas)
+    a, c, m = (_broadcast(valor, carriles) for valor in (a, c, m))
+
+    # El primer paso es exacto para cualquier semilla, a y c
+    primeros = [(ai * semilla + ci) % mi for semilla, ai, ci, mi in zip(semillas, a, c, m)]
+    vectorizable = all(0 < mi <= MODULO_MAXIMO_VECTORIZADO for mi in m)
+    tipo = np.uint64 if vectorizable else object
+    if vectorizable:
+        a = [ai % mi for ai, mi in zip(a, m)]
+        c = [ci % mi for ci, mi in zip(c, m)]
+
+    salida = np.empty((cantidad_numeros, carriles), dtype=tipo)
+    if cantidad_numeros > 0:
+        multiplicadores, incrementos, modulos = (np.array(valor, dtype=tipo) for valor in (a, c, m))
+        valores = np.array(primeros, dtype=tipo)
+        salida[0] = valores
+        for j in range(1, cantidad_numeros):
+            valores = (multiplicadores * valores + incrementos) % modulos
+            salida[j] = valores
+    return np.ascontiguousarray(salida.T)
+
+
+def normalize_lanes(estados: np.ndarray, escalas) -> np.ndarray:
+    """
+    Divide cada fila de estados entre su escala, igual que `estado / escala` en Python.
+
+    Args:
+        estados (np.ndarray): Estados de forma (carriles x cantidad)
+        escalas: Divisor de cada carril (10**longitud o m)
+
+    Returns:
+        np.ndarray: Números en float64 de la misma forma
+    """
+    escalas = [int(escala) for escala in escalas]
+    if estados.dtype != object and all(0 < escala <= MODULO_MAXIMO_FLOTANTE for escala in escalas):
+        return estados.astype(np.float64) / np.array(escalas, dtype=np.float64)[:, None]
+
+    salida = np.empty(estados.shape, dtype=np.float64)
+    for fila, escala in enumerate(escalas):
+        salida[fila] = [estado / escala for estado in estados[fila].tolist()]
+    return salida
+
+
+def _check_seeds(semillas) -> list:
+    semillas = [int(semilla) for semilla in np.asarray(semillas, dtype=object).ravel().tolist()]
+    if any(semilla < 0 for semilla in semillas):
+        raise ValueError("Las semillas de los lotes deben ser enteros no negativos")
+    return semillas
+
+
+def _lane_dtype(longitudes: list):
+    """uint64 si todos los productos de estados caben sin desbordarse; object en otro caso."""
+    return np.uint64 if all(fits_uint64(longitud) for longitud in longitudes) else object
+
+
+def _product_params(longitudes: list, tipo) -> tuple:
+    parametros = [middle_product_params(longitud) for longitud in longitudes]
+    divisores = np.array([divisor for divisor, _, _ in parametros], dtype=tipo)
+    modulos = np.array([modulo for _, modulo, _ in parametros], dtype=tipo)
+    return divisores, modulos
+
+
+def _broadcast(valor, carriles: int) -> list:
+    valores = [int(v) for v in np.asarray(valor, dtype=object).ravel().tolist()]
+    if len(valores) == 1:
+        return valores * carriles
+    if len(valores) != carriles:
+        raise ValueError("a, c y m deben ser escalares o tener un valor por semilla")
+    return valores
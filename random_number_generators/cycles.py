@@ -0,0 +1,165 @@
+""" Detección de ciclos (algoritmo de Brent) para la familia de dígitos medios. """
+from typing import Callable, Optional
+
+from utils.lazy import lazy_import
+
+from random_number_generators.middle_digits import (
+    middle_square_params, middle_product_params, _middle_digits_product_str
+)
+
+np = lazy_import("numpy")
+
+AL_CICLAR_OPCIONES = ("detener", "error")
+
+
+class PeriodicSequenceError(ValueError):
+    """Se lanza cuando una secuencia se vuelve periódica antes de completar la cantidad pedida."""
+
+    def __init__(self, cola: int, periodo: int) -> None:
+        super().__init__(
+            f"La secuencia se vuelve periódica en el número {cola + 1} con periodo {periodo}"
+        )
+        self.cola = cola
+        self.periodo = periodo
+
+
+def brent_cycle(f: Callable, x0, max_pasos: Optional[int] = None) -> Optional[tuple]:
+    """
+    Encuentra la cola y el periodo de la órbita x0, f(x0), f(f(x0)), ...
+
+    Usa el algoritmo de Brent, que solo guarda dos estados (memoria O(1)).
+
+    Args:
+        f: Función de transición del generador
+        x0: Estado inicial de la órbita
+        max_pasos: Límite de evaluaciones de f en la primera fase (None sin límite)
+
+    Returns:
+        tuple: (cola, periodo), o None si se alcanzó max_pasos sin encontrar el ciclo
+    """
+    potencia = periodo = 1
+    tortuga = x0
+    liebre = f(x0)
+    pasos = 1
+    while tortuga != liebre:
+        if max_pasos is not None and pasos >= max_pasos:
+            return None
+        if potencia == periodo:
+            tortuga = liebre
+            potencia *= 2
+            periodo = 0
+        liebre = f(liebre)
+        periodo += 1
+        pasos += 1
+
+    # La liebre se adelanta un periodo completo y ambas avanzan hasta encontrarse
+    tortuga = liebre = x0
+    for _ in range(periodo):
+        liebre = f(liebre)
+    cola = 0
+    while tortuga != liebre:
+        tortuga = f(tortuga)
+        liebre = f(liebre)
+        cola += 1
+    return cola, periodo
+
+
+def mean_squares_cycle(semilla_inicial: int, max_numeros: Optional[int] = None) -> Optional[tuple]:
+    """
+    Calcula la cola y el periodo de la secuencia generada por cuadrados medios.
+
+    La cola es el índice (desde 0) del primer número que se repite periódicamente.
+
+    Args:
+        semilla_inicial (int): Semilla inicial
+        max_numeros (int): Solo buscar ciclos que aparezcan dentro de esta cantidad de números
+
+    Returns:
+        tuple: (cola, periodo), o None si la secuencia no se repite dentro de max_numeros
+    """
+    divisor, modulo = middle_square_params(len(str(semilla_inicial)))
+
+    def siguiente(valor):
+        return valor * valor // divisor % modulo
+
+    resultado = brent_cycle(siguiente, siguiente(semilla_inicial), _max_pasos(max_numeros))
+    return _within(resultado, max_numeros)
+
+
+def middle_product_cycle(semilla_1: int, semilla_2: int, max_numeros: Optional[int] = None) -> Optional[tuple]:
+    """
+    Calcula la cola y el periodo de la secuencia generada por productos medios.
+
+    El estado es el par de las dos últimas semillas; la cola se reporta sobre
+    la secuencia de números generados (índice desde 0).
+
+    Args:
+        semilla_1 (int): Primera semilla
+        semilla_2 (int): Segunda semilla
+        max_numeros (int): Solo buscar ciclos que aparezcan dentro de esta cantidad de números
+
+    Returns:
+        tuple: (cola, periodo), o None si la secuencia no se repite dentro de max_numeros
+    """
+    longitud = len(str(semilla_1))
+    divisor, modulo, limite = middle_product_params(longitud)
+
+    def siguiente(par):
+        anterior, actual = par
+        producto = anterior * actual
+        if 0 <= producto < limite:
+            return actual, producto // divisor % modulo
+        return actual, _middle_digits_product_str(producto, longitud)
+
+    resultado = brent_cycle(siguiente, siguiente((semilla_1, semilla_2)), _max_pasos(max_numeros))
+    if resultado is None:
+        return None
+
+    # El par (y_{k-1}, y_k) se repite desde k = cola + 1, así que los números
+    # generados ya se repiten desde y_cola (salvo y_0, que no forma parte de la salida)
+    cola, periodo = resultado
+    return _within((max(cola - 1, 0), periodo), max_numeros)
+
+
+def has_repeats(valores) -> bool:
+    """True si algún valor aparece más de una vez (ordenar es más rápido que np.unique)."""
+    ordenados = np.sort(valores)
+    return bool(np.any(ordenados[1:] == ordenados[:-1]))
+
+
+def may_contain_cycle(metodo: str, numeros) -> bool:
+    """
+    Revisa con operaciones vectorizadas si los números generados pueden contener un ciclo.
+
+    Un ciclo dentro de los números de cuadrados medios repite un número; uno
+    de productos medios repite un par de números consecutivos (o el último
+    número, si el ciclo se cierra justo al final). Si no hay repetidos no hace
+    falta recorrer la secuencia con Brent.
+
+    Args:
+        metodo (str): "mean_squares" o "middle_product"
+        numeros: Números (o estados) generados, en orden
+
+    Returns:
+        bool: False solo si es seguro que no hay ciclo dentro de los números
+    """
+    numeros = np.asarray(numeros)
+    if metodo != "middle_product" or numeros.size < 2:
+        return has_repeats(numeros)
+    # Cada par (anterior, actual) como un solo entero a partir de los códigos de sus números
+    distintos, codigos = np.unique(numeros, return_inverse=True)
+    pares = codigos[:-1].astype(np.int64) * distintos.size + codigos[1:]
+    return has_repeats(pares) or bool(np.any(numeros[:-1] == numeros[-1]))
+
+
+def _max_pasos(max_numeros: Optional[int]) -> Optional[int]:
+    """Pasos suficientes para que Brent encuentre cualquier ciclo con cola + periodo <= max_numeros."""
+    return None if max_numeros is None else 4 * max_numeros + 4
+
+
+def _within(resultado: Optional[tuple], max_numeros: Optional[int]) -> Optional[tuple]:
+    """Descarta ciclos que no alcanzan a repetirse dentro de max_numeros números."""
+    if resultado is None or max_numeros is None:
+        return resultado
+    cola, periodo = resultado
+    return resultado if cola + periodo < max_numeros else None
@@ -0,0 +1,52 @@
+""" Formatos de salida de los generadores: lista de Python, arreglo flotante o estados enteros. """
+from __future__ import annotations
+from typing import Callable
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# "lista" es el formato original; los demás devuelven un arreglo de NumPy de ese dtype
+FORMATOS_SALIDA = ("lista", "float64", "float32", "uint32", "uint64")
+# Estados por bloque al convertir a float32, para no tener la copia float64 completa
+TAMANO_BLOQUE_FLOAT32 = 1 << 16
+
+
+def check_format(formato: str) -> str:
+    if formato not in FORMATOS_SALIDA:
+        raise ValueError(f"Formato desconocido: {formato}. Use uno de {', '.join(FORMATOS_SALIDA)}")
+    return formato
+
+
+def format_output(estados, escala: int, normalizar: Callable, formato: str):
+    """
+    Convierte los estados de un generador al formato pedido.
+
+    Args:
+        estados: Lista o arreglo con los estados enteros generados
+        escala (int): Divisor de los estados (10**longitud o m); todos los estados son menores
+        normalizar: Función (estados) -> np.ndarray float64 con estado / escala exacto
+        formato (str): Uno de FORMATOS_SALIDA
+
+    Returns:
+        list o np.ndarray: Lista de floats ("lista"), números entre 0 y 1 en
+            float64/float32, o los estados en uint32/uint64 (divídalos entre
+            `escala` para obtener los números)
+    """
+    check_format(formato)
+    if formato == "lista":
+        return normalizar(estados).tolist()
+    if formato == "float64":
+        return normalizar(estados)
+    if formato == "float32":
+        salida = np.empty(len(estados), dtype=np.float32)
+        for inicio in range(0, len(estados), TAMANO_BLOQUE_FLOAT32):
+            salida[inicio:inicio + TAMANO_BLOQUE_FLOAT32] = normalizar(estados[inicio:inicio + TAMANO_BLOQUE_FLOAT32])
+        return salida
+
+    tipo = np.dtype(formato)
+    if escala - 1 > np.iinfo(tipo).max:
+        raise ValueError(f"Los estados pueden llegar a {escala - 1} y no caben en {formato}; use uint64 o float64")
+    if isinstance(estados, np.ndarray):
+        return estados.astype(tipo, copy=False)
+    return np.array(estados, dtype=tipo)
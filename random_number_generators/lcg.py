@@ -0,0 +1,197 @@
+""" Motor del algoritmo lineal congruencial con salto adelante y bloques vectorizados. """
+from __future__ import annotations
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Con m <= 2**32 el producto a * x + c (a, c, x < m) cabe en uint64 sin desbordarse
+MODULO_MAXIMO_VECTORIZADO = 2 ** 32
+# Con m potencia de dos <= 2**64 el desbordamiento de uint64 ya reduce módulo 2**64 y basta x & (m - 1)
+MODULO_MAXIMO_POTENCIA_DOS = 2 ** 64
+# Con m <= 2**53 los estados y el módulo son exactos en float64
+MODULO_MAXIMO_FLOTANTE = 2 ** 53
+CARRILES_POR_DEFECTO = 1024
+
+
+def lcg_skip(a: int, c: int, m: int, k: int) -> tuple:
+    """
+    Calcula el mapa afín de k pasos del algoritmo lineal.
+
+    Devuelve (A, C) tales que x_{n+k} = (A * x_n + C) % m, es decir
+    A = a^k y C = c * (a^k - 1) / (a - 1) reducidos módulo m. Se obtiene por
+    duplicación en O(log k) multiplicaciones, sin dividir entre (a - 1).
+
+    Args:
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        k (int): Cantidad de pasos a saltar (k >= 0)
+
+    Returns:
+        tuple: (A, C) del mapa de k pasos
+    """
+    if k < 0:
+        raise ValueError("La cantidad de pasos debe ser no negativa")
+
+    A, C = 1 % m, 0
+    a_potencia, c_potencia = a % m, c % m
+    while k > 0:
+        if k & 1:
+            A, C = (A * a_potencia) % m, (C * a_potencia + c_potencia) % m
+        c_potencia = (c_potencia * (a_potencia + 1)) % m
+        a_potencia = (a_potencia * a_potencia) % m
+        k >>= 1
+    return A, C
+
+
+def lcg_jump(semilla: int, a: int, c: int, m: int, k: int) -> int:
+    """
+    Devuelve el estado que se obtiene tras avanzar k pasos desde la semilla.
+
+    Args:
+        semilla (int): Estado inicial
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        k (int): Cantidad de pasos
+
+    Returns:
+        int: Estado x_k
+    """
+    A, C = lcg_skip(a, c, m, k)
+    return (A * semilla + C) % m
+
+
+def is_power_of_two_modulus(m: int) -> bool:
+    """True si m es una potencia de dos que se puede operar en uint64 con desbordamiento y máscara."""
+    return 0 < m <= MODULO_MAXIMO_POTENCIA_DOS and m & (m - 1) == 0
+
+
+def lcg_states(semilla: int, a: int, c: int, m: int, cantidad_numeros: int,
+               carriles: int = CARRILES_POR_DEFECTO) -> np.ndarray:
+    """
+    Genera los estados x_1, ..., x_n del algoritmo lineal en un arreglo contiguo.
+
+    Los estados se acomodan en una matriz de (filas x carriles): la primera
+    fila se calcula paso a paso y cada fila siguiente se obtiene de la anterior
+    con el mapa de `carriles` pasos, así cada operación de NumPy avanza todos
+    los carriles a la vez. Si m es una potencia de dos hasta 2**64 (por
+    ejemplo 2**48 o 2**64) se deja desbordar uint64 y se aplica la máscara
+    m - 1; si m es otro módulo mayor que 2**32 se usan enteros exactos de Python.
+
+    Args:
+        semilla (int): Semilla inicial
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        cantidad_numeros (int): Cantidad de estados a generar
+        carriles (int): Cantidad de carriles por fila (default: 1024)
+
+    Returns:
+        np.ndarray: Estados en uint64 (u object si m no cabe en uint64)
+    """
+    if cantidad_numeros <= 0:
+        return np.empty(0, dtype=np.uint64)
+
+    # El primer paso es exacto para cualquier semilla, a y c
+    primer_estado = (a * semilla + c) % m
+
+    potencia_dos = is_power_of_two_modulus(m)
+    if not (0 < m <= MODULO_MAXIMO_VECTORIZADO or potencia_dos):
+        return _lcg_states_exact(primer_estado, a, c, m, cantidad_numeros)
+
+    a, c = a % m, c % m
+    carriles = max(1, min(carriles, cantidad_numeros))
+    # La primera fila con enteros de Python y una sola conversión: asignar escalares uno por uno es más lento
+    primera_fila = _lcg_state_list(primer_estado, a, c, m, carriles)
+    if cantidad_numeros <= carriles:
+        return np.array(primera_fila, dtype=np.uint64)
+
+    filas = -(-cantidad_numeros // carriles)
+    bloque = np.empty((filas, carriles), dtype=np.uint64)
+    bloque[0] = primera_fila
+
+    A, C = lcg_skip(a, c, m, carriles)
+    A, C = np.uint64(A), np.uint64(C)
+    if potencia_dos:
+        # El producto y la suma se reducen solos módulo 2**64; la máscara reduce módulo m
+        mascara = np.uint64(m - 1)
+        for i in range(1, filas):
+            fila = bloque[i]
+            np.multiply(bloque[i - 1], A, out=fila)
+            np.add(fila, C, out=fila)
+            np.bitwise_and(fila, mascara, out=fila)
+        return bloque.reshape(-1)[:cantidad_numeros]
+
+    modulo = np.uint64(m)
+    for i in range(1, filas):
+        fila = bloque[i]
+        np.multiply(bloque[i - 1], A, out=fila)
+        np.add(fila, C, out=fila)
+        np.remainder(fila, modulo, out=fila)
+
+    return bloque.reshape(-1)[:cantidad_numeros]
+
+
+def _lcg_state_list(estado: int, a: int, c: int, m: int, cantidad_numeros: int) -> list:
+    """Lista de cantidad_numeros estados desde `estado` (incluido), paso a paso."""
+    estados = []
+    for _ in range(cantidad_numeros):
+        estados.append(estado)
+        estado = (a * estado + c) % m
+    return estados
+
+
+def lcg_list(semilla: int, a: int, c: int, m: int, cantidad_numeros: int) -> list:
+    """
+    Números x_i / m del algoritmo lineal como lista de Python, paso a paso.
+
+    Para secuencias cortas es más rápido que pasar por NumPy y da los mismos números.
+
+    Args:
+        semilla (int): Semilla inicial
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        cantidad_numeros (int): Cantidad de números a generar
+
+    Returns:
+        list: Números entre 0 y 1
+    """
+    numeros = []
+    for _ in range(cantidad_numeros):
+        semilla = (a * semilla + c) % m
+        numeros.append(semilla / m)
+    return numeros
+
+
+def lcg_normalize(estados: np.ndarray, m: int) -> np.ndarray:
+    """
+    Convierte los estados a números en [0, 1) idénticos a `estado / m` en Python.
+
+    Args:
+        estados (np.ndarray): Estados generados
+        m (int): Módulo
+
+    Returns:
+        np.ndarray: Números normalizados en float64
+    """
+    if estados.dtype != object and (0 < m <= MODULO_MAXIMO_FLOTANTE or is_power_of_two_modulus(m)):
+        # Ambos operandos son exactos en float64 y la división se redondea igual; con m potencia
+        # de dos el estado se redondea al convertirlo y dividir entre m ya no redondea
+        return estados.astype(np.float64) / float(m)
+    return np.array([estado / m for estado in estados.tolist()], dtype=np.float64)
+
+
+def _lcg_states_exact(primer_estado: int, a: int, c: int, m: int, cantidad_numeros: int) -> np.ndarray:
+    """Genera los estados paso a paso con enteros exactos de Python."""
+    estados = [primer_estado]
+    estado = primer_estado
+    for _ in range(cantidad_numeros - 1):
+        estado = (a * estado + c) % m
+        estados.append(estado)
+
+    if 0 < m <= 2 ** 64:
+        return np.array(estados, dtype=np.uint64)
+    return np.array(estados, dtype=object)
@@ -0,0 +1,184 @@
+""" Análisis del periodo del algoritmo lineal sin recorrer la secuencia. """
+import math
+import random
+from functools import reduce
+
+from random_number_generators.lcg import lcg_jump
+
+# Con estas bases Miller-Rabin es determinista para n < 3.3 * 10**24
+BASES_MILLER_RABIN = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+PRIMOS_PEQUENOS = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+# Generador propio para no alterar el estado global de `random`
+_ALEATORIO = random.Random(0)
+
+
+def is_prime(n: int) -> bool:
+    """Prueba de primalidad de Miller-Rabin (determinista para n < 3.3 * 10**24)."""
+    if n < 2:
+        return False
+    for p in PRIMOS_PEQUENOS:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in BASES_MILLER_RABIN:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def factorize(n: int) -> dict:
+    """
+    Factoriza n en primos con división por primos pequeños y rho de Pollard-Brent.
+
+    Args:
+        n (int): Entero positivo
+
+    Returns:
+        dict: {primo: exponente}
+    """
+    factores = {}
+    for p in PRIMOS_PEQUENOS:
+        while n % p == 0:
+            factores[p] = factores.get(p, 0) + 1
+            n //= p
+
+    pendientes = [n] if n > 1 else []
+    while pendientes:
+        n = pendientes.pop()
+        if is_prime(n):
+            factores[n] = factores.get(n, 0) + 1
+            continue
+        divisor = _pollard_brent(n)
+        pendientes.extend((divisor, n // divisor))
+    return factores
+
+
+def carmichael(factores: dict) -> int:
+    """Función de Carmichael λ(m) a partir de la factorización de m."""
+    valores = []
+    for p, e in factores.items():
+        if p == 2 and e >= 3:
+            valores.append(2 ** (e - 2))
+        else:
+            valores.append(p ** (e - 1) * (p - 1))
+    return reduce(math.lcm, valores, 1)
+
+
+def hull_dobell(a: int, c: int, m: int, factores: dict = None) -> dict:
+    """
+    Evalúa las condiciones de Hull-Dobell para periodo completo m.
+
+    Args:
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        factores (dict): Factorización de m (se calcula si no se da)
+
+    Returns:
+        dict: {condición: se cumple}
+    """
+    factores = factorize(m) if factores is None else factores
+    return {
+        "c y m son primos relativos": math.gcd(c, m) == 1,
+        "a - 1 es divisible entre todos los primos de m": all((a - 1) % p == 0 for p in factores),
+        "a - 1 es divisible entre 4 si m lo es": m % 4 != 0 or (a - 1) % 4 == 0,
+    }
+
+
+def lcg_period(semilla: int, a: int, c: int, m: int) -> dict:
+    """
+    Calcula exactamente la cola y el periodo de la secuencia del algoritmo lineal.
+
+    Si se cumplen las condiciones de Hull-Dobell el periodo es m. En otro caso
+    se usa que f^N es la identidad sobre los ciclos con N = m * λ(m): se parte
+    de N y se eliminan sus factores primos mientras f^(N/p) siga fijando el
+    estado, comprobándolo con salto adelante. La cola es a lo más el mayor
+    exponente de los primos que dividen a mcd(a, m).
+
+    Args:
+        semilla (int): Semilla inicial
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+
+    Returns:
+        dict: periodo, cola (índice desde 0 del primer número periódico de la
+            secuencia generada), periodo_completo, condiciones de Hull-Dobell y método usado
+    """
+    if m <= 0:
+        raise ValueError("El módulo debe ser positivo")
+
+    factores = factorize(m)
+    condiciones = hull_dobell(a, c, m, factores)
+    periodo_completo = all(condiciones.values())
+    resultado = {
+        "semilla": semilla, "a": a, "c": c, "m": m,
+        "condiciones": condiciones,
+        "periodo_completo": periodo_completo,
+    }
+    if periodo_completo:
+        resultado.update(periodo=m, cola=0, metodo="Hull-Dobell")
+        return resultado
+
+    a, c = a % m, c % m
+    primero = (a * semilla + c) % m
+    cola_maxima = max((e for p, e in factores.items() if a % p == 0), default=0)
+    en_ciclo = lcg_jump(primero, a, c, m, cola_maxima)
+
+    lambda_m = carmichael(factores)
+    candidatos = dict(factores)
+    for p, e in factorize(lambda_m).items():
+        candidatos[p] = candidatos.get(p, 0) + e
+
+    periodo = m * lambda_m
+    for p in candidatos:
+        while periodo % p == 0 and lcg_jump(en_ciclo, a, c, m, periodo // p) == en_ciclo:
+            periodo //= p
+
+    cola, estado = 0, primero
+    while lcg_jump(estado, a, c, m, periodo) != estado:
+        estado = (a * estado + c) % m
+        cola += 1
+
+    resultado.update(periodo=periodo, cola=cola, metodo="Orden multiplicativo")
+    return resultado
+
+
+def _pollard_brent(n: int) -> int:
+    """Encuentra un divisor no trivial de un n compuesto (rho de Pollard con la variante de Brent)."""
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = _ALEATORIO.randrange(1, n), _ALEATORIO.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
@@ -0,0 +1,196 @@
+""" Índice precalculado del grafo funcional de cuadrados medios para semillas cortas. """
+from __future__ import annotations
+import os
+from functools import lru_cache
+from typing import Optional
+
+from utils.cache import cache_dir
+from utils.lazy import lazy_import
+
+from random_number_generators.middle_digits import mean_squares_successors, normalize_digits
+
+np = lazy_import("numpy")
+
+# Con hasta 6 dígitos el espacio de estados tiene a lo más 10**6 elementos
+LONGITUDES_INDEXABLES = range(2, 7)
+DIRECTORIO_CACHE_POR_DEFECTO = cache_dir("mean_squares_index")
+
+
+class MeanSquaresIndex():
+    """
+    Grafo funcional completo de cuadrados medios para semillas de `longitud` dígitos.
+
+    Para cada estado x en [0, 10**longitud) guarda:
+        sucesor[x]: estado siguiente
+        cola[x]: pasos desde x hasta entrar a un ciclo
+        ciclo[x]: identificador del ciclo al que llega x
+    y para cada ciclo su periodo en `periodos`.
+    """
+
+    def __init__(self, longitud: int, sucesor: np.ndarray, cola: np.ndarray,
+                 ciclo: np.ndarray, periodos: np.ndarray) -> None:
+        self.longitud = longitud
+        self.sucesor = sucesor
+        self.cola = cola
+        self.ciclo = ciclo
+        self.periodos = periodos
+        self._sucesor_lista = None
+
+    @classmethod
+    def build(cls, longitud: int) -> "MeanSquaresIndex":
+        """
+        Calcula el índice recorriendo todo el espacio de estados.
+
+        Los estados que no están en un ciclo se eliminan por capas (los que no
+        tienen predecesores primero); lo que queda son los ciclos. Después se
+        propagan cola e identificador de ciclo recorriendo las capas al revés.
+
+        Args:
+            longitud (int): Cantidad de dígitos de las semillas
+
+        Returns:
+            MeanSquaresIndex: Índice calculado
+        """
+        if longitud not in LONGITUDES_INDEXABLES:
+            raise ValueError(f"Solo se indexan semillas de {LONGITUDES_INDEXABLES.start} "
+                             f"a {LONGITUDES_INDEXABLES.stop - 1} dígitos")
+
+        total = 10 ** longitud
+        sucesor = mean_squares_successors(np.arange(total), longitud).astype(np.uint32)
+
+        grado = np.bincount(sucesor, minlength=total)
+        capas = []
+        frontera = np.flatnonzero(grado == 0)
+        while frontera.size:
+            capas.append(frontera)
+            destinos = sucesor[frontera]
+            np.subtract.at(grado, destinos, 1)
+            candidatos = np.unique(destinos)
+            frontera = candidatos[grado[candidatos] == 0]
+
+        cola = np.zeros(total, dtype=np.uint32)
+        ciclo = np.full(total, -1, dtype=np.int32)
+        en_ciclo = np.ones(total, dtype=bool)
+        for capa in capas:
+            en_ciclo[capa] = False
+
+        periodos = []
+        sucesor_lista = sucesor.tolist()
+        for estado in np.flatnonzero(en_ciclo).tolist():
+            if ciclo[estado] >= 0:
+                continue
+            identificador = len(periodos)
+            periodo = 0
+            while ciclo[estado] < 0:
+                ciclo[estado] = identificador
+                estado = sucesor_lista[estado]
+                periodo += 1
+            periodos.append(periodo)
+
+        for capa in reversed(capas):
+            destinos = sucesor[capa]
+            cola[capa] = cola[destinos] + 1
+            ciclo[capa] = ciclo[destinos]
+
+        return cls(longitud, sucesor, cola, ciclo, np.array(periodos, dtype=np.uint32))
+
+    @classmethod
+    def load(cls, longitud: int, directorio: Optional[str] = None) -> "MeanSquaresIndex":
+        """
+        Carga el índice desde disco o lo calcula y lo guarda si no existe.
+
+        Args:
+            longitud (int): Cantidad de dígitos de las semillas
+            directorio (str): Carpeta de caché (default: ~/.cache/proyecto_simulacion/mean_squares_index)
+
+        Returns:
+            MeanSquaresIndex: Índice listo para consultar
+        """
+        ruta = cls.cache_path(longitud, directorio)
+        if os.path.exists(ruta):
+            with np.load(ruta) as datos:
+                return cls(longitud, datos["sucesor"], datos["cola"], datos["ciclo"], datos["periodos"])
+
+        indice = cls.build(longitud)
+        indice.save(ruta)
+        return indice
+
+    @staticmethod
+    def cache_path(longitud: int, directorio: Optional[str] = None) -> str:
+        """Ruta del archivo de caché para una longitud de semilla."""
+        return os.path.join(directorio or DIRECTORIO_CACHE_POR_DEFECTO, f"mean_squares_{longitud}.npz")
+
+    def save(self, ruta: str) -> None:
+        """Guarda los arreglos del índice en un archivo .npz."""
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        np.savez(ruta, sucesor=self.sucesor, cola=self.cola, ciclo=self.ciclo, periodos=self.periodos)
+
+    def cycle(self, semilla_inicial: int) -> tuple:
+        """
+        Cola y periodo de la secuencia generada desde la semilla, con la misma
+        convención que `cycles.mean_squares_cycle`.
+
+        Args:
+            semilla_inicial (int): Semilla de `longitud` dígitos
+
+        Returns:
+            tuple: (cola, periodo)
+        """
+        primero = int(self.sucesor[self._check_seed(semilla_inicial)])
+        return int(self.cola[primero]), int(self.periodos[self.ciclo[primero]])
+
+    def states(self, semilla_inicial: int, cantidad_numeros: int) -> np.ndarray:
+        """
+        Estados generados desde la semilla, obtenidos solo con consultas al índice.
+
+        Se recorren a lo más cola + periodo estados; el resto de la secuencia
+        repite el ciclo.
+
+        Args:
+            semilla_inicial (int): Semilla de `longitud` dígitos
+            cantidad_numeros (int): Cantidad de estados a generar
+
+        Returns:
+            np.ndarray: Estados en uint32
+        """
+        estado = self._check_seed(semilla_inicial)
+        if cantidad_numeros <= 0:
+            return np.empty(0, dtype=np.uint32)
+        if self._sucesor_lista is None:
+            self._sucesor_lista = self.sucesor.tolist()
+
+        cola, periodo = self.cycle(semilla_inicial)
+        recorrido = []
+        for _ in range(min(cantidad_numeros, cola + periodo)):
+            estado = self._sucesor_lista[estado]
+            recorrido.append(estado)
+        recorrido = np.array(recorrido, dtype=np.uint32)
+        if cantidad_numeros <= recorrido.size:
+            return recorrido
+
+        repeticion = np.resize(recorrido[cola:], cantidad_numeros - cola)
+        return np.concatenate([recorrido[:cola], repeticion])
+
+    def generate(self, semilla_inicial: int, cantidad_numeros: int) -> np.ndarray:
+        """
+        Números de cuadrados medios desde la semilla, idénticos a `RandomGenerators.mean_squares`.
+
+        Args:
+            semilla_inicial (int): Semilla de `longitud` dígitos
+            cantidad_numeros (int): Cantidad de números a generar
+
+        Returns:
+            np.ndarray: Números en float64 entre 0 y 1
+        """
+        return normalize_digits(self.states(semilla_inicial, cantidad_numeros), self.longitud)
+
+    def _check_seed(self, semilla_inicial: int) -> int:
+        if semilla_inicial < 0 or len(str(semilla_inicial)) != self.longitud:
+            raise ValueError(f"La semilla debe ser un entero positivo de {self.longitud} dígitos")
+        return semilla_inicial
+
+
+@lru_cache(maxsize=None)
+def load_index(longitud: int, directorio: Optional[str] = None) -> MeanSquaresIndex:
+    """Devuelve el índice de una longitud, cargado una sola vez por proceso."""
+    return MeanSquaresIndex.load(longitud, directorio)
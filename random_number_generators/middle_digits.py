@@ -0,0 +1,175 @@
+""" Recurrencias de dígitos medios (cuadrados medios, productos medios y multiplicador constante). """
+from __future__ import annotations
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Con 10**longitud <= 2**53 los estados son exactos en float64
+LONGITUD_MAXIMA_FLOTANTE = 15
+
+
+def middle_square_params(longitud: int) -> tuple:
+    """
+    Precalcula las potencias de diez para extraer los dígitos medios de un cuadrado.
+
+    El cuadrado de un estado de `longitud` dígitos se completa a 2 * longitud
+    dígitos; los dígitos medios son (cuadrado // divisor) % modulo.
+
+    Args:
+        longitud (int): Cantidad de dígitos de la semilla inicial
+
+    Returns:
+        tuple: (divisor, modulo)
+    """
+    ancho = 2 * (longitud // 2)
+    if ancho == 0:
+        raise ValueError("La semilla debe tener al menos dos dígitos")
+    return 10 ** (longitud - longitud // 2), 10 ** ancho
+
+
+def middle_product_params(longitud: int) -> tuple:
+    """
+    Precalcula las potencias de diez para extraer los dígitos medios de un producto.
+
+    Para productos menores que `limite` (a lo más 2 * longitud dígitos) los
+    dígitos medios son (producto // divisor) % modulo.
+
+    Args:
+        longitud (int): Cantidad de dígitos de la primera semilla
+
+    Returns:
+        tuple: (divisor, modulo, limite)
+    """
+    return 10 ** (longitud // 2), 10 ** longitud, 10 ** (2 * longitud)
+
+
+def fits_uint64(longitud: int) -> bool:
+    """Indica si el producto de dos estados de `longitud` dígitos cabe en uint64."""
+    return (10 ** longitud - 1) ** 2 < 2 ** 64
+
+
+def mean_squares_states(valor: int, longitud: int, cantidad_numeros: int) -> list:
+    """
+    Avanza el método de cuadrados medios y devuelve los estados generados.
+
+    Args:
+        valor (int): Estado actual
+        longitud (int): Cantidad de dígitos de la semilla inicial
+        cantidad_numeros (int): Cantidad de estados a generar
+
+    Returns:
+        list: Estados enteros generados, en orden
+    """
+    estados = []
+    if cantidad_numeros <= 0:
+        return estados
+
+    divisor, modulo = middle_square_params(longitud)
+    for _ in range(cantidad_numeros):
+        valor = valor * valor // divisor % modulo
+        estados.append(valor)
+    return estados
+
+
+def mean_squares_successors(valores: np.ndarray, longitud: int) -> np.ndarray:
+    """
+    Aplica un paso de cuadrados medios a todo un arreglo de estados.
+
+    Usa aritmética uint64 cuando el cuadrado cabe sin desbordarse y enteros
+    exactos de Python (dtype object) en otro caso.
+
+    Args:
+        valores (np.ndarray): Estados actuales
+        longitud (int): Cantidad de dígitos de la semilla inicial
+
+    Returns:
+        np.ndarray: Estados siguientes
+    """
+    divisor, modulo = middle_square_params(longitud)
+    if fits_uint64(longitud):
+        valores = np.asarray(valores, dtype=np.uint64)
+        return valores * valores // np.uint64(divisor) % np.uint64(modulo)
+    valores = np.asarray(valores, dtype=object)
+    return valores * valores // divisor % modulo
+
+
+def middle_product_states(semilla_1: int, semilla_2: int, longitud: int, cantidad_numeros: int) -> list:
+    """
+    Avanza el método de productos medios y devuelve los estados generados.
+
+    Args:
+        semilla_1 (int): Penúltimo estado
+        semilla_2 (int): Último estado
+        longitud (int): Cantidad de dígitos de la primera semilla
+        cantidad_numeros (int): Cantidad de estados a generar
+
+    Returns:
+        list: Estados enteros generados, en orden
+    """
+    estados = []
+    divisor, modulo, limite = middle_product_params(longitud)
+    for _ in range(cantidad_numeros):
+        producto = semilla_1 * semilla_2
+        if 0 <= producto < limite:
+            nueva_semilla = producto // divisor % modulo
+        else:
+            nueva_semilla = _middle_digits_product_str(producto, longitud)
+        estados.append(nueva_semilla)
+        semilla_1, semilla_2 = semilla_2, nueva_semilla
+    return estados
+
+
+def constant_multiplier_states(constante: int, semilla: int, longitud: int, cantidad_numeros: int) -> list:
+    """
+    Avanza el método de multiplicador constante y devuelve los estados generados.
+
+    Args:
+        constante (int): Multiplicador constante (primera semilla)
+        semilla (int): Último estado
+        longitud (int): Cantidad de dígitos de la constante
+        cantidad_numeros (int): Cantidad de estados a generar
+
+    Returns:
+        list: Estados enteros generados, en orden
+    """
+    estados = []
+    divisor, modulo, limite = middle_product_params(longitud)
+    for _ in range(cantidad_numeros):
+        producto = constante * semilla
+        if 0 <= producto < limite:
+            semilla = producto // divisor % modulo
+        else:
+            semilla = _middle_digits_product_str(producto, longitud)
+        estados.append(semilla)
+    return estados
+
+
+def normalize_digits(estados: list, longitud: int) -> np.ndarray:
+    """
+    Convierte los estados a números en [0, 1) idénticos a `estado / 10**longitud` en Python.
+
+    Args:
+        estados (list): Estados enteros generados
+        longitud (int): Cantidad de dígitos usada para normalizar
+
+    Returns:
+        np.ndarray: Números normalizados en float64
+    """
+    escala = 10 ** longitud
+    if longitud <= LONGITUD_MAXIMA_FLOTANTE:
+        return np.array(estados, dtype=np.float64) / float(escala)
+    return np.array([estado / escala for estado in estados], dtype=np.float64)
+
+
+def _middle_digits_product_str(producto: int, longitud: int) -> int:
+    """
+    Extrae los dígitos centrales de un producto a partir de su representación en texto.
+
+    Solo se usa cuando el producto no cabe en 2 * longitud dígitos o es
+    negativo (posible únicamente con las semillas iniciales).
+    """
+    e = str(producto).zfill(2 * longitud)
+    inicio = (len(e) // 2) - (longitud // 2)
+    fin = inicio + longitud
+    return int(e[inicio:fin])
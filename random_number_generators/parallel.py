@@ -0,0 +1,118 @@
+""" División de una secuencia del algoritmo lineal entre procesos usando salto adelante. """
+from __future__ import annotations
+import os
+from typing import Optional
+
+from utils.lazy import lazy_import
+
+from random_number_generators.lcg import lcg_states, lcg_normalize, lcg_skip, lcg_jump
+
+np = lazy_import("numpy")
+# multiprocessing tarda en importarse y solo se usa al repartir entre procesos
+futures = lazy_import("concurrent.futures")
+shared_memory = lazy_import("multiprocessing.shared_memory")
+
+# Por debajo de esta cantidad el costo de arrancar procesos supera la ganancia
+MINIMO_PARALELO = 1 << 20
+# Cada proceso genera su bloque en tramos para acotar la memoria temporal
+TAMANO_TRAMO = 1 << 22
+
+
+def linear_algorithm_parallel(semilla: int, a: int, c: int, m: int, cantidad_numeros: int,
+                              procesos: Optional[int] = None, estados: bool = False) -> np.ndarray:
+    """
+    Genera la secuencia del algoritmo lineal repartiéndola entre varios procesos.
+
+    La secuencia se divide en bloques contiguos; cada proceso obtiene el
+    estado inicial de su bloque con salto adelante en O(log n) y escribe su
+    parte directamente en un búfer de memoria compartida. El resultado es
+    idéntico a la secuencia serial.
+
+    Args:
+        semilla (int): Semilla inicial
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        cantidad_numeros (int): Cantidad de números a generar
+        procesos (int): Cantidad de procesos (default: os.cpu_count())
+        estados (bool): Si es True devuelve los estados enteros en lugar de x_i / m
+
+    Returns:
+        np.ndarray: Números en float64 entre 0 y 1, o estados en uint64
+    """
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or cantidad_numeros < MINIMO_PARALELO or (estados and not 0 < m <= 2 ** 64):
+        secuencia = lcg_states(semilla, a, c, m, cantidad_numeros)
+        return secuencia if estados else lcg_normalize(secuencia, m)
+
+    tipo = np.uint64 if estados else np.float64
+    memoria = shared_memory.SharedMemory(create=True, size=cantidad_numeros * np.dtype(tipo).itemsize)
+    try:
+        limites = np.linspace(0, cantidad_numeros, procesos + 1).astype(np.int64).tolist()
+        with futures.ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            tareas = [
+                ejecutor.submit(_fill_block, memoria.name, cantidad_numeros, tipo, inicio, fin,
+                                lcg_jump(semilla, a, c, m, inicio), a, c, m)
+                for inicio, fin in zip(limites[:-1], limites[1:]) if fin > inicio
+            ]
+            for tarea in tareas:
+                tarea.result()
+        compartido = np.ndarray((cantidad_numeros,), dtype=tipo, buffer=memoria.buf)
+        secuencia = compartido.copy()
+        del compartido
+        return secuencia
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+def linear_algorithm_leapfrog(semilla: int, a: int, c: int, m: int, flujo: int, total_flujos: int,
+                              cantidad_numeros: int, estados: bool = False) -> np.ndarray:
+    """
+    Devuelve el subflujo intercalado `flujo` de `total_flujos` de una misma secuencia.
+
+    El subflujo j toma x_{j+1}, x_{j+1+k}, x_{j+1+2k}, ... con k = total_flujos,
+    que a su vez es un algoritmo lineal con multiplicador a^k e incremento
+    c (a^k - 1) / (a - 1). Los subflujos 0..k-1 no se traslapan y juntos
+    reconstruyen la secuencia original.
+
+    Args:
+        semilla (int): Semilla inicial
+        a (int): Multiplicador
+        c (int): Incremento
+        m (int): Módulo
+        flujo (int): Índice del subflujo (0 <= flujo < total_flujos)
+        total_flujos (int): Cantidad de subflujos
+        cantidad_numeros (int): Cantidad de números del subflujo
+        estados (bool): Si es True devuelve los estados enteros en lugar de x_i / m
+
+    Returns:
+        np.ndarray: Números en float64 entre 0 y 1, o estados
+    """
+    if not 0 <= flujo < total_flujos:
+        raise ValueError("El subflujo debe cumplir 0 <= flujo < total_flujos")
+    if cantidad_numeros <= 0:
+        secuencia = np.empty(0, dtype=np.uint64)
+    else:
+        primero = lcg_jump(semilla, a, c, m, flujo + 1)
+        a_salto, c_salto = lcg_skip(a, c, m, total_flujos)
+        resto = lcg_states(primero, a_salto, c_salto, m, cantidad_numeros - 1)
+        tipo = np.uint64 if 0 < m <= 2 ** 64 else object
+        secuencia = np.concatenate([np.array([primero], dtype=tipo), resto.astype(tipo)])
+    return secuencia if estados else lcg_normalize(secuencia, m)
+
+
+def _fill_block(nombre_memoria: str, total: int, tipo, inicio: int, fin: int,
+                estado: int, a: int, c: int, m: int) -> None:
+    """Genera x_{inicio+1}..x_{fin} desde x_inicio y los escribe en la memoria compartida."""
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        salida = np.ndarray((total,), dtype=tipo, buffer=memoria.buf)
+        for tramo in range(inicio, fin, TAMANO_TRAMO):
+            cantidad = min(TAMANO_TRAMO, fin - tramo)
+            bloque = lcg_states(estado, a, c, m, cantidad)
+            estado = int(bloque[-1])
+            salida[tramo:tramo + cantidad] = bloque if tipo == np.uint64 else lcg_normalize(bloque, m)
+        del salida
+    finally:
+        memoria.close()
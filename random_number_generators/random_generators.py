@@ -1,12 +1,37 @@
 """ Módulo que contiene diferentes métodos para generar números pseudoaleatorios. """
-from typing import List
+from __future__ import annotations
+from typing import List, Optional, Union
 
+from utils.instrumentation import instrument_methods
+from utils.lazy import lazy_import
+
+from random_number_generators.lcg import CARRILES_POR_DEFECTO, lcg_list, lcg_states, lcg_normalize
+from random_number_generators.batch import (
+    mean_squares_lanes, middle_product_lanes, constant_multiplier_lanes, linear_algorithm_lanes, normalize_lanes
+)
+from random_number_generators.middle_digits import (
+    mean_squares_states, middle_product_states, constant_multiplier_states, normalize_digits
+)
+from random_number_generators.cycles import (
+    mean_squares_cycle, middle_product_cycle, may_contain_cycle, PeriodicSequenceError, AL_CICLAR_OPCIONES
+)
+from random_number_generators.formats import format_output
+from random_number_generators.lcg_period import lcg_period
+from random_number_generators.mean_squares_index import load_index
+from random_number_generators.parallel import linear_algorithm_parallel, linear_algorithm_leapfrog
+from random_number_generators.storage import save_blocks
+from random_number_generators.streams import RandomStream, TAMANO_BLOQUE_POR_DEFECTO
+
+np = lazy_import("numpy")
+
+@instrument_methods("generar")
 class RandomGenerators():
     
     def __init__(self) -> None:
         pass
 
-    def linear_algorithm(self, semilla: int, a: int, c: int, m: int, cantidad_numeros: int) -> List:
+    def linear_algorithm(self, semilla: int, a: int, c: int, m: int, cantidad_numeros: int,
+                         formato: str = "lista") -> Union[List, np.ndarray]:
         """
         Genera una lista de números pseudoaleatorios usando el método de algoritmo lineal.
 
@@ -16,53 +41,159 @@ class RandomGenerators():
             c (int): Incremento
             m (int): Módulo
             cantidad_numeros (int): Cantidad de números a generar
+            formato (str): "lista" (default), "float64" o "float32" para un arreglo de
+                NumPy, o "uint32"/"uint64" para los estados enteros (ver formats.format_output)
 
         returns: 
-            list: Lista de números pseudoaleatorios entre 0 y 1
+            list o np.ndarray: Números pseudoaleatorios entre 0 y 1 en el formato pedido
+        """
+        if formato == "lista" and cantidad_numeros <= CARRILES_POR_DEFECTO:
+            # Una sola fila de carriles: el ciclo de Python evita convertir a NumPy y de regreso
+            return lcg_list(semilla, a, c, m, cantidad_numeros)
+        estados = lcg_states(semilla, a, c, m, cantidad_numeros)
+        return format_output(estados, m, lambda bloque: lcg_normalize(bloque, m), formato)
+
+    def linear_algorithm_array(self, semilla: int, a: int, c: int, m: int, cantidad_numeros: int,
+                               estados: bool = False) -> np.ndarray:
+        """
+        Genera la secuencia del algoritmo lineal como un arreglo contiguo de NumPy.
+
+        Usa el motor de salto adelante por bloques (ver `lcg.lcg_states`), que
+        produce exactamente la misma secuencia que el cálculo paso a paso.
+
+        Args:
+            semilla (int): Semilla inicial
+            a (int): Multiplicador
+            c (int): Incremento
+            m (int): Módulo
+            cantidad_numeros (int): Cantidad de números a generar
+            estados (bool): Si es True devuelve los estados enteros x_i en lugar de x_i / m
+
+        Returns:
+            np.ndarray: Números en float64 entre 0 y 1, o estados en uint64
+        """
+        if not estados and cantidad_numeros <= CARRILES_POR_DEFECTO:
+            # Una sola fila de carriles: una conversión de la lista en lugar de estados y división
+            return np.array(lcg_list(semilla, a, c, m, cantidad_numeros), dtype=np.float64)
+        secuencia_estados = lcg_states(semilla, a, c, m, cantidad_numeros)
+        if estados:
+            return secuencia_estados
+        return lcg_normalize(secuencia_estados, m)
+    
+    def linear_algorithm_parallel(self, semilla: int, a: int, c: int, m: int, cantidad_numeros: int,
+                                  procesos: Optional[int] = None, estados: bool = False) -> np.ndarray:
+        """
+        Genera la secuencia del algoritmo lineal usando varios procesos.
+
+        Cada proceso calcula un bloque contiguo desde su estado inicial (salto
+        adelante) y lo escribe en memoria compartida; el resultado es idéntico
+        a linear_algorithm_array.
+
+        Args:
+            semilla (int): Semilla inicial
+            a (int): Multiplicador
+            c (int): Incremento
+            m (int): Módulo
+            cantidad_numeros (int): Cantidad de números a generar
+            procesos (int): Cantidad de procesos (default: todos los núcleos)
+            estados (bool): Si es True devuelve los estados enteros en lugar de x_i / m
+
+        Returns:
+            np.ndarray: Números en float64 entre 0 y 1, o estados en uint64
+        """
+        return linear_algorithm_parallel(semilla, a, c, m, cantidad_numeros, procesos, estados)
+
+    def linear_algorithm_leapfrog(self, semilla: int, a: int, c: int, m: int, flujo: int,
+                                  total_flujos: int, cantidad_numeros: int, estados: bool = False) -> np.ndarray:
+        """
+        Devuelve un subflujo intercalado (leapfrog) de la secuencia del algoritmo lineal.
+
+        El subflujo `flujo` toma uno de cada `total_flujos` números empezando en
+        el número flujo + 1, así varias simulaciones independientes pueden usar
+        subflujos sin traslape de una misma (a, c, m, semilla).
+
+        Args:
+            semilla (int): Semilla inicial
+            a (int): Multiplicador
+            c (int): Incremento
+            m (int): Módulo
+            flujo (int): Índice del subflujo (0 <= flujo < total_flujos)
+            total_flujos (int): Cantidad de subflujos
+            cantidad_numeros (int): Cantidad de números del subflujo
+            estados (bool): Si es True devuelve los estados enteros en lugar de x_i / m
+
+        Returns:
+            np.ndarray: Números en float64 entre 0 y 1, o estados
         """
-        secuencia_aleatoria = []
+        return linear_algorithm_leapfrog(semilla, a, c, m, flujo, total_flujos, cantidad_numeros, estados)
+    
+    def lcg_period(self, semilla: int, a: int, c: int, m: int) -> dict:
+        """
+        Calcula analíticamente la cola y el periodo del algoritmo lineal, sin generar la secuencia.
+
+        Usa las condiciones de Hull-Dobell para detectar periodo completo y, si
+        no se cumplen, el orden de la transformación a partir de la
+        factorización de m. Responde en milisegundos para módulos de 64 bits.
 
-        for _ in range(cantidad_numeros):
-            nueva_semilla = (a * semilla + c) % m
-            numero_normalizado = nueva_semilla / m
-            secuencia_aleatoria.append(numero_normalizado)
+        Args:
+            semilla (int): Semilla inicial
+            a (int): Multiplicador
+            c (int): Incremento
+            m (int): Módulo
 
-            semilla = nueva_semilla
-        return secuencia_aleatoria
+        Returns:
+            dict: periodo, cola, periodo_completo, condiciones de Hull-Dobell y método usado
+        """
+        return lcg_period(semilla, a, c, m)
     
-    def mean_squares(self, semilla_inicial: int, cantidad_numeros: int) -> List:
+    def mean_squares(self, semilla_inicial: int, cantidad_numeros: int, al_ciclar: Optional[str] = None,
+                     formato: str = "lista") -> Union[List, np.ndarray]:
         """
         Genera una lista de números pseudoaleatorios usando el método de cuadrados medios.
         
         Args:
             semilla_inicial (int): Semilla inicial con cantidad par de dígitos
             cantidad_numeros (int): Cantidad de números a generar
+            al_ciclar (str): None para generar siempre cantidad_numeros, "detener" para
+                cortar la secuencia al completar su primer periodo o "error" para lanzar
+                PeriodicSequenceError si se vuelve periódica
+            formato (str): "lista" (default), "float64" o "float32" para un arreglo de
+                NumPy, o "uint32"/"uint64" para los estados enteros (ver formats.format_output)
         
         Returns:
-            list: Lista de números pseudoaleatorios entre 0 y 1
+            list o np.ndarray: Números pseudoaleatorios entre 0 y 1 en el formato pedido
         """
-        secuencia_aleatoria = []
-        valor_actual = semilla_inicial
+        if al_ciclar is not None and cantidad_numeros > 0:
+            ciclo = mean_squares_cycle(semilla_inicial, cantidad_numeros)
+            cantidad_numeros = self._limit_to_cycle(ciclo, al_ciclar, cantidad_numeros)
+
         longitud_digitos = len(str(semilla_inicial))
-        
-        for i in range(cantidad_numeros):
-            cuadrado = valor_actual ** 2
-            cuadrado_str = str(cuadrado).zfill(2 * longitud_digitos)
-            
-            # Extraer los dígitos del medio
-            punto_medio = len(cuadrado_str) // 2
-            inicio = punto_medio - longitud_digitos // 2
-            fin = punto_medio + longitud_digitos // 2
-            digitos_medios = cuadrado_str[inicio:fin]
-            
-            # Actualizar valor actual y normalizar
-            valor_actual = int(digitos_medios)
-            numero_normalizado = valor_actual / (10 ** longitud_digitos)
-            secuencia_aleatoria.append(numero_normalizado)
-        
-        return secuencia_aleatoria
+        estados = mean_squares_states(semilla_inicial, longitud_digitos, cantidad_numeros)
+        return self._format_digits(estados, longitud_digitos, formato)
+    
+    def mean_squares_indexed(self, semilla_inicial: int, cantidad_numeros: int,
+                             directorio_cache: Optional[str] = None, formato: str = "lista") -> Union[List, np.ndarray]:
+        """
+        Genera la misma lista que mean_squares consultando el grafo funcional precalculado.
+
+        Solo para semillas de 2 a 6 dígitos. El índice se calcula una vez, se
+        guarda en disco y después cada secuencia se arma sin aritmética.
+
+        Args:
+            semilla_inicial (int): Semilla inicial de 2 a 6 dígitos
+            cantidad_numeros (int): Cantidad de números a generar
+            directorio_cache (str): Carpeta donde se guardan los índices (opcional)
+            formato (str): "lista" (default), "float64" o "float32" para un arreglo de
+                NumPy, o "uint32"/"uint64" para los estados enteros (ver formats.format_output)
+
+        Returns:
+            list o np.ndarray: Números pseudoaleatorios entre 0 y 1 en el formato pedido
+        """
+        indice = load_index(len(str(semilla_inicial)), directorio_cache)
+        return self._format_digits(indice.states(semilla_inicial, cantidad_numeros), indice.longitud, formato)
     
-    def constant_multiplier(self, semilla_1: int, semilla_2: int, cantidad_numeros: int) -> List:
+    def constant_multiplier(self, semilla_1: int, semilla_2: int, cantidad_numeros: int,
+                            formato: str = "lista") -> Union[List, np.ndarray]:
         """
         Genera una lista de números pseudoaleatorios usando el método de multiplicador constante.
         
@@ -70,32 +201,18 @@ class RandomGenerators():
             semilla_1 (int): Primera semilla con cantidad par de dígitos
             semilla_2 (int): Segunda semilla con cantidad par de dígitos
             cantidad_numeros (int): Cantidad de números a generar
+            formato (str): "lista" (default), "float64" o "float32" para un arreglo de
+                NumPy, o "uint32"/"uint64" para los estados enteros (ver formats.format_output)
         
         Returns:
-            list: Lista de números pseudoaleatorios entre 0 y 1
+            list o np.ndarray: Números pseudoaleatorios entre 0 y 1 en el formato pedido
         """
-        secuencia_aleatoria = []
         longitud_digitos = len(str(semilla_1))
-        
-        for i in range(cantidad_numeros):
-            producto = semilla_1 * semilla_2
-            e = str(producto).zfill(2 * longitud_digitos)
-            
-            # Extraer los dígitos del medio
-            inicio = (len(e) // 2) - (longitud_digitos // 2)
-            fin = inicio + longitud_digitos
-            digitos_medios = e[inicio:fin]
-
-            nueva_semilla = int(digitos_medios)
-            numero_normalizado = nueva_semilla / (10 ** longitud_digitos)
-            secuencia_aleatoria.append(numero_normalizado)
-            
-            # Actualizar valores de las semillas
-            semilla_2 = nueva_semilla
-        
-        return secuencia_aleatoria
+        estados = constant_multiplier_states(semilla_1, semilla_2, longitud_digitos, cantidad_numeros)
+        return self._format_digits(estados, longitud_digitos, formato)
     
-    def middle_product(self, semilla_1: int, semilla_2: int, cantidad_numeros: int) -> List:
+    def middle_product(self, semilla_1: int, semilla_2: int, cantidad_numeros: int,
+                       al_ciclar: Optional[str] = None, formato: str = "lista") -> Union[List, np.ndarray]:
         """
         Genera una lista de números pseudoaleatorios usando el método de productos medios.
         
@@ -103,27 +220,203 @@ class RandomGenerators():
             semilla_1 (int): Primera semilla con cantidad par de dígitos
             semilla_2 (int): Segunda semilla con cantidad par de dígitos
             cantidad_numeros (int): Cantidad de números a generar
+            al_ciclar (str): None, "detener" o "error" (ver mean_squares)
+            formato (str): Formato de salida (ver mean_squares)
         
         Returns:
-            list: Lista de números pseudoaleatorios entre 0 y 1
+            list o np.ndarray: Números pseudoaleatorios entre 0 y 1 en el formato pedido
         """
-        secuencia_aleatoria = []
+        if al_ciclar is not None and cantidad_numeros > 0:
+            ciclo = middle_product_cycle(semilla_1, semilla_2, cantidad_numeros)
+            cantidad_numeros = self._limit_to_cycle(ciclo, al_ciclar, cantidad_numeros)
+
         longitud_digitos = len(str(semilla_1))
-        
-        for i in range(cantidad_numeros):
-            producto = semilla_1 * semilla_2
-            e = str(producto).zfill(2 * longitud_digitos)
-            
-            # Extraer los dígitos del medio
-            inicio = (len(e) // 2) - (longitud_digitos // 2)
-            fin = inicio + longitud_digitos
-            digitos_medios = e[inicio:fin]
-
-            nueva_semilla = int(digitos_medios)
-            numero_normalizado = nueva_semilla / (10 ** longitud_digitos)
-            secuencia_aleatoria.append(numero_normalizado)
-            
-            # Actualizar valores de las semillas
-            semilla_1, semilla_2 = semilla_2, nueva_semilla
-        
-        return secuencia_aleatoria
\ No newline at end of file
+        estados = middle_product_states(semilla_1, semilla_2, longitud_digitos, cantidad_numeros)
+        return self._format_digits(estados, longitud_digitos, formato)
+
+    def mean_squares_batch(self, semillas, cantidad_numeros: int, estados: bool = False) -> np.ndarray:
+        """
+        Genera cuadrados medios para muchas semillas a la vez.
+
+        Todas las semillas avanzan juntas como carriles de NumPy, así que el
+        costo es un solo ciclo de cantidad_numeros pasos vectorizados.
+
+        Args:
+            semillas: Arreglo o lista de semillas iniciales
+            cantidad_numeros (int): Cantidad de números por semilla
+            estados (bool): Si es True devuelve los estados enteros en lugar de normalizarlos
+
+        Returns:
+            np.ndarray: Matriz (semillas x cantidad_numeros); la fila i es mean_squares(semillas[i], ...)
+        """
+        secuencias, longitudes = mean_squares_lanes(semillas, cantidad_numeros)
+        if estados:
+            return secuencias
+        return normalize_lanes(secuencias, [10 ** longitud for longitud in longitudes])
+
+    def middle_product_batch(self, semillas_1, semillas_2, cantidad_numeros: int,
+                             estados: bool = False) -> np.ndarray:
+        """
+        Genera productos medios para muchos pares de semillas a la vez.
+
+        Args:
+            semillas_1: Primeras semillas
+            semillas_2: Segundas semillas
+            cantidad_numeros (int): Cantidad de números por par
+            estados (bool): Si es True devuelve los estados enteros en lugar de normalizarlos
+
+        Returns:
+            np.ndarray: Matriz (pares x cantidad_numeros)
+        """
+        secuencias, longitudes = middle_product_lanes(semillas_1, semillas_2, cantidad_numeros)
+        if estados:
+            return secuencias
+        return normalize_lanes(secuencias, [10 ** longitud for longitud in longitudes])
+
+    def constant_multiplier_batch(self, semillas_1, semillas_2, cantidad_numeros: int,
+                                  estados: bool = False) -> np.ndarray:
+        """
+        Genera multiplicador constante para muchos pares de semillas a la vez.
+
+        Args:
+            semillas_1: Constantes (primeras semillas)
+            semillas_2: Segundas semillas
+            cantidad_numeros (int): Cantidad de números por par
+            estados (bool): Si es True devuelve los estados enteros en lugar de normalizarlos
+
+        Returns:
+            np.ndarray: Matriz (pares x cantidad_numeros)
+        """
+        secuencias, longitudes = constant_multiplier_lanes(semillas_1, semillas_2, cantidad_numeros)
+        if estados:
+            return secuencias
+        return normalize_lanes(secuencias, [10 ** longitud for longitud in longitudes])
+
+    def linear_algorithm_batch(self, semillas, a, c, m, cantidad_numeros: int,
+                               estados: bool = False) -> np.ndarray:
+        """
+        Genera el algoritmo lineal para muchas semillas (y parámetros) a la vez.
+
+        Args:
+            semillas: Semillas iniciales
+            a: Multiplicador, escalar o uno por semilla
+            c: Incremento, escalar o uno por semilla
+            m: Módulo, escalar o uno por semilla
+            cantidad_numeros (int): Cantidad de números por semilla
+            estados (bool): Si es True devuelve los estados enteros en lugar de normalizarlos
+
+        Returns:
+            np.ndarray: Matriz (semillas x cantidad_numeros)
+        """
+        secuencias = linear_algorithm_lanes(semillas, a, c, m, cantidad_numeros)
+        if estados:
+            return secuencias
+        modulos = np.broadcast_to(np.asarray(m, dtype=object), (secuencias.shape[0],))
+        return normalize_lanes(secuencias, modulos.tolist())
+
+    def detect_cycle(self, metodo: str, *semillas: int, max_numeros: Optional[int] = None,
+                     numeros=None) -> Optional[dict]:
+        """
+        Calcula la cola y el periodo de la secuencia de un método de dígitos medios.
+
+        Usa el algoritmo de Brent, con memoria O(1) y O(cola + periodo) pasos.
+
+        Args:
+            metodo (str): "mean_squares" o "middle_product"
+            *semillas (int): Semillas en el mismo orden que en el método
+            max_numeros (int): Solo buscar ciclos que aparezcan dentro de esta cantidad de números
+            numeros: Números ya generados con esas semillas (opcional). Si se dan,
+                max_numeros es por omisión su cantidad y Brent solo se ejecuta si
+                contienen repetidos (ver cycles.may_contain_cycle)
+
+        Returns:
+            dict: {'cola': índice del primer número periódico, 'periodo': longitud del ciclo},
+                o None si no hay repetición dentro de max_numeros
+        """
+        detectores = {
+            "mean_squares": mean_squares_cycle,
+            "middle_product": middle_product_cycle,
+        }
+        if metodo not in detectores:
+            raise ValueError(f"Método sin detección de ciclos: {metodo}. Opciones: {', '.join(detectores)}")
+
+        if numeros is not None:
+            if max_numeros is None:
+                max_numeros = len(numeros)
+            if max_numeros <= len(numeros) and not may_contain_cycle(metodo, numeros[:max_numeros]):
+                return None
+        ciclo = detectores[metodo](*semillas, max_numeros=max_numeros)
+        if ciclo is None:
+            return None
+        cola, periodo = ciclo
+        return {"cola": cola, "periodo": periodo}
+
+    def _format_digits(self, estados, longitud_digitos: int, formato: str):
+        """Estados de un método de dígitos medios en el formato pedido; la escala es 10**longitud."""
+        return format_output(estados, 10 ** longitud_digitos,
+                             lambda bloque: normalize_digits(bloque, longitud_digitos), formato)
+
+    def _limit_to_cycle(self, ciclo: Optional[tuple], al_ciclar: str, cantidad_numeros: int) -> int:
+        """Aplica el modo al_ciclar y devuelve cuántos números se deben generar."""
+        if al_ciclar not in AL_CICLAR_OPCIONES:
+            raise ValueError(f"Opción al_ciclar inválida: {al_ciclar}. Opciones: {', '.join(AL_CICLAR_OPCIONES)}")
+        if ciclo is None:
+            return cantidad_numeros
+
+        cola, periodo = ciclo
+        if al_ciclar == "error":
+            raise PeriodicSequenceError(cola, periodo)
+        return cola + periodo
+
+    def stream(self, metodo: str, tamano_bloque: int = TAMANO_BLOQUE_POR_DEFECTO,
+               cantidad_numeros: Optional[int] = None, **parametros) -> RandomStream:
+        """
+        Genera la secuencia de un método como un flujo de bloques de NumPy.
+
+        Solo se conserva el estado de la recurrencia entre bloques, así que se
+        pueden producir secuencias más grandes que la memoria disponible.
+
+        Args:
+            metodo (str): "mean_squares", "middle_product", "constant_multiplier" o "linear_algorithm"
+            tamano_bloque (int): Cantidad de números por bloque
+            cantidad_numeros (int): Total de números a producir (None para un flujo sin fin)
+            **parametros: Semillas y parámetros con los mismos nombres que en cada método
+
+        Returns:
+            RandomStream: Iterador de bloques float64 entre 0 y 1
+        """
+        return RandomStream.start(metodo, tamano_bloque, cantidad_numeros, **parametros)
+
+    def resume_stream(self, estado: dict) -> RandomStream:
+        """
+        Reanuda un flujo desde un estado guardado con `RandomStream.state()`.
+
+        Args:
+            estado (dict): Estado guardado del flujo
+
+        Returns:
+            RandomStream: Iterador que continúa la secuencia donde se quedó
+        """
+        return RandomStream.from_state(estado)
+
+    def generate_to_file(self, ruta: str, metodo: str, cantidad_numeros: int,
+                         tamano_bloque: int = TAMANO_BLOQUE_POR_DEFECTO, **parametros) -> str:
+        """
+        Genera una secuencia por bloques y la escribe directo en un archivo .npy.
+
+        La secuencia nunca está completa en memoria. Junto al archivo se
+        guardan los metadatos (método, parámetros y cantidad) para leerla
+        después con `load_sequence`, que la devuelve mapeada en memoria.
+
+        Args:
+            ruta (str): Archivo de salida (se agrega .npy si falta)
+            metodo (str): "mean_squares", "middle_product", "constant_multiplier" o "linear_algorithm"
+            cantidad_numeros (int): Total de números a generar
+            tamano_bloque (int): Cantidad de números por bloque
+            **parametros: Semillas y parámetros con los mismos nombres que en cada método
+
+        Returns:
+            str: Ruta del archivo .npy escrito
+        """
+        flujo = self.stream(metodo, tamano_bloque, cantidad_numeros, **parametros)
+        return save_blocks(ruta, flujo, cantidad_numeros, {"generador": metodo, "parametros": parametros})
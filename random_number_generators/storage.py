@@ -0,0 +1,126 @@
+""" Guardado y lectura de secuencias en formato binario .npy con un archivo de metadatos. """
+from __future__ import annotations
+import json
+import os
+from typing import Optional
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def _npy_path(ruta: str) -> str:
+    """np.save agrega .npy si falta; se hace aquí para conocer la ruta final."""
+    return ruta if ruta.endswith(".npy") else ruta + ".npy"
+
+
+def metadata_path(ruta: str) -> str:
+    """Ruta del archivo de metadatos de una secuencia: secuencia.npy -> secuencia.npy.json."""
+    return _npy_path(ruta) + ".json"
+
+
+def _write_metadata(ruta: str, cantidad_numeros: int, dtype: np.dtype, metadatos: Optional[dict]) -> None:
+    """Escribe los metadatos junto con la cantidad de números y el tipo de dato."""
+    registro = dict(metadatos or {})
+    registro.update(n=int(cantidad_numeros), dtype=str(dtype))
+    with open(metadata_path(ruta), "w", encoding="utf-8") as archivo:
+        json.dump(registro, archivo, ensure_ascii=False, indent=2)
+
+
+def _check_dtype(dtype) -> np.dtype:
+    """Solo se guardan flotantes (números entre 0 y 1) o enteros sin signo (estados)."""
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "fu":
+        raise ValueError(f"Tipo de dato no soportado: {dtype}. Use float64/float32 o uint32/uint64")
+    return dtype
+
+
+def save_sequence(ruta: str, numeros, metadatos: Optional[dict] = None, dtype=None) -> str:
+    """
+    Guarda una secuencia completa en un archivo .npy y sus metadatos en un .json al lado.
+
+    Args:
+        ruta (str): Archivo de salida (se agrega .npy si falta)
+        numeros: Lista o arreglo con la secuencia (números entre 0 y 1 o estados enteros)
+        metadatos (dict): Generador, semillas, parámetros, escala de los estados, etc.
+        dtype: Tipo de dato del archivo (default: el del arreglo, float64 para listas)
+
+    Returns:
+        str: Ruta del archivo .npy escrito
+    """
+    arreglo = np.asarray(numeros)
+    dtype = _check_dtype(dtype or (arreglo.dtype if arreglo.dtype.kind in "fu" else np.float64))
+    if dtype.kind == "u" and arreglo.size and (arreglo.min() < 0 or arreglo.max() > np.iinfo(dtype).max):
+        raise ValueError(f"Los estados no caben en {dtype}")
+
+    ruta = _npy_path(ruta)
+    np.save(ruta, arreglo.astype(dtype, copy=False).ravel())
+    _write_metadata(ruta, arreglo.size, dtype, metadatos)
+    return ruta
+
+
+def save_blocks(ruta: str, bloques, cantidad_numeros: int, metadatos: Optional[dict] = None,
+                dtype=None) -> str:
+    """
+    Escribe una secuencia que llega por bloques directamente a un .npy mapeado en memoria.
+
+    Solo un bloque está en memoria a la vez, así que se pueden guardar
+    secuencias más grandes que la RAM.
+
+    Args:
+        ruta (str): Archivo de salida (se agrega .npy si falta)
+        bloques: Iterable de arreglos (por ejemplo un RandomStream)
+        cantidad_numeros (int): Total de números a escribir
+        metadatos (dict): Generador, semillas, parámetros, etc.
+        dtype: Tipo de dato del archivo (default: float64)
+
+    Returns:
+        str: Ruta del archivo .npy escrito
+    """
+    ruta = _npy_path(ruta)
+    dtype = _check_dtype(dtype or np.float64)
+    salida = np.lib.format.open_memmap(ruta, mode="w+", dtype=dtype, shape=(cantidad_numeros,))
+    try:
+        escritos = 0
+        for bloque in bloques:
+            if escritos == cantidad_numeros:
+                break
+            bloque = np.asarray(bloque).ravel()[:cantidad_numeros - escritos]
+            salida[escritos:escritos + bloque.size] = bloque
+            escritos += bloque.size
+        salida.flush()
+    finally:
+        del salida
+    if escritos < cantidad_numeros:
+        os.remove(ruta)
+        raise ValueError(f"Los bloques solo tenían {escritos} de {cantidad_numeros} números")
+    _write_metadata(ruta, cantidad_numeros, dtype, metadatos)
+    return ruta
+
+
+def load_sequence(ruta: str, mmap: bool = True, normalizar: bool = False) -> tuple:
+    """
+    Lee una secuencia guardada con save_sequence o save_blocks.
+
+    Args:
+        ruta (str): Archivo .npy
+        mmap (bool): Si es True el arreglo se mapea en memoria (solo lectura) sin leerlo completo
+        normalizar (bool): Si el archivo tiene estados enteros y los metadatos traen
+            'escala', devuelve estados / escala en float64 (esto sí lee todo el archivo)
+
+    Returns:
+        tuple: (arreglo, metadatos); metadatos es {} si no hay archivo .json
+    """
+    ruta = _npy_path(ruta)
+    arreglo = np.load(ruta, mmap_mode="r" if mmap else None)
+    ruta_metadatos = metadata_path(ruta)
+    metadatos = {}
+    if os.path.exists(ruta_metadatos):
+        with open(ruta_metadatos, encoding="utf-8") as archivo:
+            metadatos = json.load(archivo)
+
+    if normalizar and arreglo.dtype.kind == "u":
+        if "escala" not in metadatos:
+            raise ValueError("Los metadatos no indican la escala para normalizar los estados")
+        arreglo = arreglo / float(metadatos["escala"])
+    return arreglo, metadatos
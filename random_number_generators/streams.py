@@ -0,0 +1,141 @@
+""" Generación por flujo: produce las secuencias en bloques de NumPy con memoria constante. """
+from __future__ import annotations
+from typing import Optional
+
+from utils.lazy import lazy_import
+
+from random_number_generators.lcg import lcg_states, lcg_normalize
+from random_number_generators.middle_digits import (
+    mean_squares_states, middle_product_states, constant_multiplier_states, normalize_digits
+)
+
+np = lazy_import("numpy")
+
+TAMANO_BLOQUE_POR_DEFECTO = 65536
+
+
+def _start_linear_algorithm(semilla: int, a: int, c: int, m: int) -> dict:
+    return {"semilla": semilla, "a": a, "c": c, "m": m}
+
+
+def _advance_linear_algorithm(estado: dict, cantidad: int) -> np.ndarray:
+    estados = lcg_states(estado["semilla"], estado["a"], estado["c"], estado["m"], cantidad)
+    estado["semilla"] = int(estados[-1])
+    return lcg_normalize(estados, estado["m"])
+
+
+def _start_mean_squares(semilla_inicial: int) -> dict:
+    return {"valor": semilla_inicial, "longitud": len(str(semilla_inicial))}
+
+
+def _advance_mean_squares(estado: dict, cantidad: int) -> np.ndarray:
+    estados = mean_squares_states(estado["valor"], estado["longitud"], cantidad)
+    estado["valor"] = estados[-1]
+    return normalize_digits(estados, estado["longitud"])
+
+
+def _start_middle_product(semilla_1: int, semilla_2: int) -> dict:
+    return {"semilla_1": semilla_1, "semilla_2": semilla_2, "longitud": len(str(semilla_1))}
+
+
+def _advance_middle_product(estado: dict, cantidad: int) -> np.ndarray:
+    estados = middle_product_states(estado["semilla_1"], estado["semilla_2"], estado["longitud"], cantidad)
+    estado["semilla_1"] = estados[-2] if cantidad > 1 else estado["semilla_2"]
+    estado["semilla_2"] = estados[-1]
+    return normalize_digits(estados, estado["longitud"])
+
+
+def _start_constant_multiplier(semilla_1: int, semilla_2: int) -> dict:
+    return {"semilla_1": semilla_1, "semilla_2": semilla_2, "longitud": len(str(semilla_1))}
+
+
+def _advance_constant_multiplier(estado: dict, cantidad: int) -> np.ndarray:
+    estados = constant_multiplier_states(estado["semilla_1"], estado["semilla_2"], estado["longitud"], cantidad)
+    estado["semilla_2"] = estados[-1]
+    return normalize_digits(estados, estado["longitud"])
+
+
+METODOS = {
+    "linear_algorithm": (_start_linear_algorithm, _advance_linear_algorithm),
+    "mean_squares": (_start_mean_squares, _advance_mean_squares),
+    "middle_product": (_start_middle_product, _advance_middle_product),
+    "constant_multiplier": (_start_constant_multiplier, _advance_constant_multiplier),
+}
+
+
+class RandomStream():
+    """
+    Iterador que entrega la secuencia de un generador en bloques de float64.
+
+    Entre bloques solo se guarda el estado de la recurrencia, por lo que la
+    memoria usada no depende de la longitud total de la secuencia. El estado
+    se obtiene con `state()` y se puede reanudar con `RandomStream.from_state`.
+    """
+
+    def __init__(self, metodo: str, estado: dict, tamano_bloque: int = TAMANO_BLOQUE_POR_DEFECTO,
+                 restantes: Optional[int] = None) -> None:
+        if metodo not in METODOS:
+            raise ValueError(f"Método desconocido: {metodo}. Opciones: {', '.join(METODOS)}")
+        if tamano_bloque <= 0:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+
+        self.metodo = metodo
+        self.estado = dict(estado)
+        self.tamano_bloque = tamano_bloque
+        self.restantes = restantes
+        self.generados = 0
+
+    @classmethod
+    def start(cls, metodo: str, tamano_bloque: int = TAMANO_BLOQUE_POR_DEFECTO,
+              cantidad_numeros: Optional[int] = None, **parametros) -> "RandomStream":
+        """
+        Crea un flujo desde las semillas y parámetros del método.
+
+        Args:
+            metodo: str - Nombre del método de RandomGenerators
+            tamano_bloque: int - Cantidad de números por bloque
+            cantidad_numeros: int - Total de números a producir (None para un flujo sin fin)
+            **parametros: Semillas y parámetros con los mismos nombres que en RandomGenerators
+
+        Returns:
+            RandomStream: Flujo listo para iterar
+        """
+        if metodo not in METODOS:
+            raise ValueError(f"Método desconocido: {metodo}. Opciones: {', '.join(METODOS)}")
+        iniciar, _ = METODOS[metodo]
+        return cls(metodo, iniciar(**parametros), tamano_bloque, cantidad_numeros)
+
+    @classmethod
+    def from_state(cls, estado: dict) -> "RandomStream":
+        """Reanuda un flujo desde el diccionario devuelto por `state()`."""
+        flujo = cls(estado["metodo"], estado["estado"], estado["tamano_bloque"], estado["restantes"])
+        flujo.generados = estado.get("generados", 0)
+        return flujo
+
+    def state(self) -> dict:
+        """Devuelve el estado actual del flujo (solo enteros y cadenas, serializable a JSON)."""
+        return {
+            "metodo": self.metodo,
+            "estado": dict(self.estado),
+            "tamano_bloque": self.tamano_bloque,
+            "restantes": self.restantes,
+            "generados": self.generados,
+        }
+
+    def __iter__(self) -> "RandomStream":
+        return self
+
+    def __next__(self) -> np.ndarray:
+        cantidad = self.tamano_bloque
+        if self.restantes is not None:
+            cantidad = min(cantidad, self.restantes)
+        if cantidad <= 0:
+            raise StopIteration
+
+        _, avanzar = METODOS[self.metodo]
+        bloque = avanzar(self.estado, cantidad)
+
+        self.generados += cantidad
+        if self.restantes is not None:
+            self.restantes -= cantidad
+        return bloque
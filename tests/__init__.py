@@ -1,5 +1,13 @@
 from tests.tests_methods import TestMethods
+from tests.results import TestResult
+from tests.parallel import battery_parallel
+from tests.accumulators import ChiSquaredAccumulator, KolmogorovAccumulator, GapAccumulator
 
 __all__ = [
     "TestMethods",
+    "TestResult",
+    "battery_parallel",
+    "ChiSquaredAccumulator",
+    "KolmogorovAccumulator",
+    "GapAccumulator",
 ]
\ No newline at end of file
@@ -0,0 +1,372 @@
+"""Acumuladores para ejecutar pruebas sobre secuencias que llegan por bloques."""
+from __future__ import annotations
+
+from utils.lazy import lazy_import
+
+from tests.critical_values import chi2_critical, chi2_p_value, ks_critical, ks_p_value
+from tests.results import TestResult
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# 2**20 intervalos: los bordes j / 2**20 y los productos x * 2**20 son exactos
+INTERVALOS_KOLMOGOROV = 1 << 20
+# Los huecos de esta longitud o más se agrupan en una sola categoría
+MAX_HUECO = 4
+# Tamaño de los bloques en que se recorre una secuencia ya en memoria
+TAMANO_BLOQUE = 1 << 20
+
+
+def _bin_indices(valores: np.ndarray, bins: np.ndarray) -> np.ndarray:
+    """
+    Índice del intervalo [bins[j], bins[j+1]) de cada valor dentro de [0, 1].
+
+    Usa floor(x * k) y corrige el redondeo contra los bordes reales, igual que
+    np.histogram: 1.0 cae en el último intervalo.
+    """
+    intervalos = bins.size - 1
+    indices = (valores * intervalos).astype(np.intp)
+    indices[indices == intervalos] -= 1
+
+    # Corregir el redondeo de x * k contra los bordes reales de los intervalos
+    indices[valores < bins[indices]] -= 1
+    indices[(valores >= bins[indices + 1]) & (indices != intervalos - 1)] += 1
+    return indices
+
+
+def _chi_square(fo, fe, alpha: float) -> tuple:
+    """Devuelve (chi_cuadrado, chi_critico, grados_libertad, aceptado); ignora las categorías con fe = 0."""
+    chi_cuadrado = sum(((o - e) ** 2) / e if e > 0 else 0 for o, e in zip(fo, fe))
+    grados_libertad = len(fo) - 1
+    chi_critico = chi2_critical(alpha, grados_libertad)
+    aceptado = chi_cuadrado < chi_critico
+    return chi_cuadrado, chi_critico, grados_libertad, aceptado
+
+
+def gap_lengths(numeros, a: float, b: float) -> np.ndarray:
+    """
+    Longitudes de los huecos entre números que caen en [a, b).
+
+    El primer hueco se cuenta desde el inicio de la secuencia y los números
+    después del último acierto no forman hueco.
+    """
+    aciertos = np.flatnonzero((numeros >= a) & (numeros < b))
+    return np.diff(aciertos, prepend=-1) - 1
+
+
+class ChiSquaredAccumulator():
+    """
+    Prueba Chi-Cuadrada de uniformidad calculada bloque por bloque.
+
+    Solo guarda las frecuencias observadas de cada intervalo, así que la
+    secuencia completa nunca tiene que estar en memoria. Los intervalos se
+    asignan igual que np.histogram sobre np.linspace(0, 1, intervalos + 1):
+    los valores fuera de [0, 1] no se cuentan y 1.0 cae en el último intervalo.
+    """
+
+    def __init__(self, intervalos: int) -> None:
+        if intervalos <= 0:
+            raise ValueError("El número de intervalos debe ser positivo")
+        self.intervalos = intervalos
+        self.bins = np.linspace(0, 1, intervalos + 1)
+        self.fo = np.zeros(intervalos, dtype=np.int64)
+        self.n = 0
+
+    def update(self, bloque) -> None:
+        """
+        Agrega un bloque de números a las frecuencias observadas.
+
+        Args:
+            bloque: Arreglo o lista de números
+        """
+        bloque = np.asarray(bloque, dtype=np.float64).ravel()
+        self.n += bloque.size
+
+        bloque = bloque[(bloque >= 0) & (bloque <= 1)]
+        self.fo += np.bincount(_bin_indices(bloque, self.bins), minlength=self.intervalos)
+
+    def update_sorted(self, ordenados: np.ndarray) -> None:
+        """
+        Agrega un bloque ya ordenado usando búsquedas binarias en los bordes.
+
+        Cuesta O(intervalos * log n) en lugar de recorrer el bloque.
+
+        Args:
+            ordenados: Arreglo ordenado de menor a mayor
+        """
+        self.n += ordenados.size
+        posiciones = np.searchsorted(ordenados, self.bins, side='left')
+        posiciones[-1] = np.searchsorted(ordenados, self.bins[-1], side='right')
+        self.fo += np.diff(posiciones)
+
+    def finalize(self, alpha: float = 0.05, numeros=None) -> TestResult:
+        """
+        Calcula el estadístico, el valor crítico y la tabla de frecuencias.
+
+        Args:
+            alpha: float - Nivel de significancia
+            numeros: Secuencia completa, solo si se quiere incluir en el resultado
+
+        Returns:
+            TestResult: con los mismos campos que TestMethods.chi_squared_test
+                ('numeros' solo si se proporcionó)
+        """
+        if self.n == 0:
+            raise ValueError("No se han agregado números a la prueba")
+
+        intervalos, bins, n = self.intervalos, self.bins, self.n
+        fo = self.fo.copy()
+        fe = n / intervalos
+
+        chi_cuadrado = np.sum(((fo - fe) ** 2) / fe)
+        grados_libertad = intervalos - 1
+        chi_critico = chi2_critical(alpha, grados_libertad)
+
+        aceptado = chi_cuadrado < chi_critico
+        conclusion = "Los números son uniformes" if aceptado else "Los números no son uniformes"
+
+        def tabla_freq():
+            return pd.DataFrame({
+                'Intervalo': [f"[{bins[i]:.2f}, {bins[i+1]:.2f})" for i in range(intervalos)],
+                'FO (Observada)': fo,
+                'FE (Esperada)': [fe] * intervalos,
+                '(FO-FE)²/FE': [((o - fe) ** 2) / fe for o in fo]
+            })
+
+        valores = {} if numeros is None else {'numeros': numeros}
+        valores.update({
+            'n': n,
+            'intervalos': intervalos,
+            'chi_cuadrado': chi_cuadrado,
+            'chi_critico': chi_critico,
+            'grados_libertad': grados_libertad,
+            'alpha': alpha,
+            'aceptado': aceptado,
+            'conclusion': conclusion,
+            'fo': fo,
+            'fe': fe
+        })
+        return TestResult(valores, {
+            'p_valor': lambda: chi2_p_value(chi_cuadrado, grados_libertad),
+            'tabla_frecuencias': tabla_freq
+        }, decision=(chi_cuadrado, lambda nivel: chi2_critical(nivel, grados_libertad)))
+
+
+class KolmogorovAccumulator():
+    """
+    Prueba de Kolmogorov-Smirnov aproximada, calculada bloque por bloque.
+
+    En lugar de ordenar la secuencia se cuentan los números en intervalos
+    fijos de [0, 1]. En cada borde e_j se conoce exactamente F_n(e_j), así
+    que D queda acotado: la cota inferior es el mayor |F_n(e_j) - e_j| y la
+    superior supone el peor caso dentro de cada intervalo. La diferencia
+    entre ambas es a lo más 1/intervalos más la fracción de números del
+    intervalo más poblado.
+    """
+
+    def __init__(self, intervalos: int = INTERVALOS_KOLMOGOROV) -> None:
+        if intervalos <= 0:
+            raise ValueError("El número de intervalos debe ser positivo")
+        self.intervalos = intervalos
+        self.bins = np.linspace(0, 1, intervalos + 1)
+        self.frecuencias = np.zeros(intervalos, dtype=np.int64)
+        self.debajo = 0   # números < 0
+        self.encima = 0   # números > 1
+        self.n = 0
+
+    def update(self, bloque) -> None:
+        """
+        Agrega un bloque de números a las frecuencias.
+
+        Args:
+            bloque: Arreglo o lista de números
+        """
+        bloque = np.asarray(bloque, dtype=np.float64).ravel()
+        self.n += bloque.size
+        self.debajo += int(np.count_nonzero(bloque < 0))
+        self.encima += int(np.count_nonzero(bloque > 1))
+
+        bloque = bloque[(bloque >= 0) & (bloque <= 1)]
+        self.frecuencias += np.bincount(_bin_indices(bloque, self.bins), minlength=self.intervalos)
+
+    def finalize(self, alpha: float = 0.05) -> TestResult:
+        """
+        Calcula las cotas de D, el valor crítico y el valor p.
+
+        Args:
+            alpha: float - Nivel de significancia
+
+        Returns:
+            TestResult: con D_inferior, D_superior, cota_error, D (punto medio),
+                D_critico, p_valor y la decisión
+        """
+        if self.n == 0:
+            raise ValueError("No se han agregado números a la prueba")
+
+        n, bins = self.n, self.bins
+        # acumulados[j] = cantidad de números < bins[j]; el último incluye los iguales a 1
+        acumulados = self.debajo + np.concatenate(([0], np.cumsum(self.frecuencias)))
+        F_n = acumulados / n
+
+        # Fuera de [0, 1] la diferencia se conoce exactamente
+        fuera = max(self.debajo, self.encima) / n
+        D_inferior = max(float(np.max(np.abs(F_n - bins))), fuera)
+        D_superior = max(float(np.max(F_n[1:] - bins[:-1])),
+                         float(np.max(bins[1:] - F_n[:-1])), fuera)
+        D = (D_inferior + D_superior) / 2
+
+        D_critico = ks_critical(alpha, n)
+
+        concluyente = D_superior < D_critico or D_inferior >= D_critico
+        aceptado = D < D_critico
+        conclusion = "Los números son uniformes" if aceptado else "Los números no son uniformes"
+        if not concluyente:
+            conclusion += " (no concluyente: D_critico queda entre las cotas de D, aumente los intervalos)"
+
+        return TestResult({
+            'n': n,
+            'intervalos': self.intervalos,
+            'D_inferior': D_inferior,
+            'D_superior': D_superior,
+            'cota_error': D_superior - D_inferior,
+            'D': D,
+            'D_critico': D_critico,
+            'alpha': alpha,
+            'aceptado': aceptado,
+            'concluyente': concluyente,
+            'conclusion': conclusion,
+        }, {
+            'p_valor': lambda: ks_p_value(D, n),
+        }, decision=(D, lambda nivel: ks_critical(nivel, n)))
+
+
+class GapAccumulator():
+    """
+    Prueba de huecos para varios intervalos [a, b) en una sola pasada.
+
+    Cada bloque se compara contra todos los intervalos a la vez y por cada
+    intervalo solo se guarda la posición del último acierto (para continuar
+    el hueco en el siguiente bloque) y la frecuencia de cada longitud, con
+    las longitudes >= max_hueco agrupadas.
+    """
+
+    def __init__(self, intervalos, max_hueco: int = MAX_HUECO) -> None:
+        """
+        Args:
+            intervalos: Lista de pares (a, b)
+            max_hueco: int - Longitud desde la que los huecos se agrupan en "≥max_hueco"
+        """
+        if max_hueco <= 0:
+            raise ValueError("La longitud máxima de hueco debe ser positiva")
+        self.intervalos = [(a, b) for a, b in intervalos]
+        if not self.intervalos:
+            raise ValueError("Se necesita al menos un intervalo (a, b)")
+        limites = np.array(self.intervalos, dtype=np.float64)
+        if np.any(limites[:, 0] >= limites[:, 1]):
+            raise ValueError("Cada intervalo debe cumplir a < b")
+        self.a = limites[:, :1]
+        self.b = limites[:, 1:]
+        self.max_hueco = max_hueco
+        self.ultimo = np.full(len(self.intervalos), -1, dtype=np.int64)
+        self.frecuencias = np.zeros((len(self.intervalos), max_hueco + 1), dtype=np.int64)
+        self.mayor_hueco = np.full(len(self.intervalos), -1, dtype=np.int64)
+        self.n = 0
+
+    def update(self, bloque) -> None:
+        """
+        Agrega un bloque de números a las frecuencias de huecos de todos los intervalos.
+
+        Args:
+            bloque: Arreglo o lista de números
+        """
+        bloque = np.asarray(bloque, dtype=np.float64).ravel()
+        self.update_mask((bloque >= self.a) & (bloque < self.b))
+
+    def update_mask(self, dentro: np.ndarray) -> None:
+        """
+        Agrega un bloque dado por su máscara de aciertos ya calculada.
+
+        Args:
+            dentro: Arreglo booleano de forma (intervalos, tamaño del bloque)
+        """
+        for j, fila in enumerate(dentro):
+            aciertos = np.flatnonzero(fila) + self.n
+            if aciertos.size == 0:
+                continue
+            huecos = np.diff(aciertos, prepend=self.ultimo[j]) - 1
+            self.ultimo[j] = aciertos[-1]
+            self.mayor_hueco[j] = max(self.mayor_hueco[j], huecos.max())
+            self.frecuencias[j] += np.bincount(np.minimum(huecos, self.max_hueco), minlength=self.max_hueco + 1)
+        self.n += dentro.shape[1]
+
+    def finalize(self, alpha: float = 0.05, numeros=None) -> list:
+        """
+        Calcula la prueba de cada intervalo.
+
+        Args:
+            alpha: float - Nivel de significancia
+            numeros: Secuencia completa, solo si se quiere incluir en los resultados
+                (agrega 'numeros' y la lista perezosa 'huecos')
+
+        Returns:
+            list: Un TestResult por intervalo, en el orden en que se dieron
+        """
+        return [self._result(j, alpha, numeros) for j in range(len(self.intervalos))]
+
+    def _result(self, j: int, alpha: float, numeros) -> TestResult:
+        """Resultado de la prueba de huecos para el intervalo j."""
+        a, b = self.intervalos[j]
+        p = b - a
+        frecuencias = self.frecuencias[j]
+        total_huecos = int(frecuencias.sum())
+        mayor = int(self.mayor_hueco[j])
+
+        valores = {} if numeros is None else {'numeros': numeros}
+        perezosos = {} if numeros is None else {'huecos': lambda: gap_lengths(numeros, a, b)}
+        valores.update({'n': self.n, 'alpha': alpha, 'a': a, 'b': b, 'p': p})
+
+        if total_huecos == 0:
+            valores.update({
+                'aceptado': False,
+                'conclusion': "No se encontraron suficientes huecos para la prueba",
+                'total_huecos': 0
+            })
+            return TestResult(valores, perezosos)
+
+        # Una categoría por longitud observada, agrupando las >= max_hueco
+        K = self.max_hueco
+        if mayor < K:
+            categorias_str = [str(i) for i in range(mayor + 1)]
+            fo = frecuencias[:mayor + 1].tolist()
+            fe = [total_huecos * p * (1 - p) ** i for i in range(mayor + 1)]
+        else:
+            categorias_str = [str(i) for i in range(K)] + [f"≥{K}"]
+            fo = frecuencias.tolist()
+            fe = [total_huecos * p * (1 - p) ** i for i in range(K)] + [total_huecos * (1 - p) ** K]
+
+        chi_cuadrado, chi_critico, grados_libertad, aceptado = _chi_square(fo, fe, alpha)
+        conclusion = "Los números son independientes" if aceptado else "Los números no son independientes"
+
+        def tabla():
+            return pd.DataFrame({
+                'Longitud Hueco': categorias_str,
+                'FO (Observada)': fo,
+                'FE (Esperada)': [f"{e:.4f}" for e in fe],
+                '(FO-FE)²/FE': [f"{((o - e) ** 2) / e if e > 0 else 0:.4f}" for o, e in zip(fo, fe)]
+            })
+
+        valores.update({
+            'total_huecos': total_huecos,
+            'max_hueco': K,
+            'fo': fo,
+            'fe': fe,
+            'chi_cuadrado': chi_cuadrado,
+            'chi_critico': chi_critico,
+            'grados_libertad': grados_libertad,
+            'aceptado': aceptado,
+            'conclusion': conclusion,
+        })
+        perezosos['p_valor'] = lambda: chi2_p_value(chi_cuadrado, grados_libertad)
+        perezosos['tabla_huecos'] = tabla
+        return TestResult(valores, perezosos,
+                          decision=(chi_cuadrado, lambda nivel: chi2_critical(nivel, grados_libertad)))
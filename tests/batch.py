@@ -0,0 +1,302 @@
+"""
+Pruebas por lotes: la misma prueba sobre muchas secuencias de igual tamaño a la vez.
+
+Cada función recibe un arreglo 2-D (secuencias × n) y calcula los
+estadísticos de todas las secuencias con operaciones de NumPy a lo largo del
+eje 1, sin DataFrames ni un TestResult por secuencia. El resultado es un solo
+TestResult cuyos estadísticos, valores p y 'aceptado' son arreglos con un
+elemento por secuencia; decisions(alphas) devuelve también un arreglo por alpha.
+Los valores p se calculan al consultarlos (importan SciPy); las decisiones
+usan solo los valores críticos memorizados.
+"""
+from __future__ import annotations
+import math
+
+from utils.lazy import lazy_import
+
+from tests.accumulators import MAX_HUECO, _bin_indices
+from tests.critical_values import chi2_critical, ks_critical, norm_critical, scipy_special, scipy_stats
+from tests.results import TestResult
+
+np = lazy_import("numpy")
+
+
+def _as_matrix(numeros) -> np.ndarray:
+    """Secuencias como arreglo float64 de forma (secuencias, n)."""
+    numeros = np.asarray(numeros, dtype=np.float64)
+    if numeros.ndim != 2:
+        raise ValueError(f"Se esperaba un arreglo 2-D (secuencias × n) y se recibió uno de {numeros.ndim} dimensiones")
+    if numeros.shape[1] < 2:
+        raise ValueError("Cada secuencia debe tener al menos 2 números")
+    return numeros
+
+
+def _chi2_p_values(chi_cuadrado: np.ndarray, grados_libertad) -> np.ndarray:
+    """Valores p de chi-cuadrada por secuencia; NaN donde no hay grados de libertad."""
+    grados_libertad = np.broadcast_to(grados_libertad, chi_cuadrado.shape)
+    return np.where(grados_libertad > 0, scipy_special().chdtrc(np.maximum(grados_libertad, 1), chi_cuadrado), np.nan)
+
+
+def _norm_p_values(Z0: np.ndarray) -> np.ndarray:
+    """Valores p de dos colas de la normal estándar, P(|Z| >= |z|)."""
+    return scipy_special().erfc(np.abs(Z0) / math.sqrt(2))
+
+
+def _chi2_criticals(grados_libertad: np.ndarray):
+    """Función alpha -> valor crítico de cada secuencia, para grados de libertad distintos por secuencia."""
+    unicos, posiciones = np.unique(grados_libertad, return_inverse=True)
+
+    def critico(alpha: float) -> np.ndarray:
+        return np.array([chi2_critical(alpha, g) if g > 0 else np.nan for g in unicos.tolist()])[posiciones]
+    return critico
+
+
+def chi_squared_batch(numeros, alpha: float = 0.05, intervalos=None) -> TestResult:
+    """
+    Chi-Cuadrada de uniformidad para cada secuencia (renglón) de `numeros`.
+
+    Los intervalos se asignan igual que en TestMethods.chi_squared_test y
+    las frecuencias de todas las secuencias salen de un solo np.bincount.
+
+    Args:
+        numeros: Arreglo 2-D (secuencias × n)
+        alpha: float - Nivel de significancia
+        intervalos: int - Número de intervalos (default: regla de la raíz cuadrada de n)
+
+    Returns:
+        TestResult: chi_cuadrado, p_valor y aceptado por secuencia; fo de forma
+            (secuencias, intervalos); chi_critico, grados_libertad y fe comunes
+    """
+    numeros = _as_matrix(numeros)
+    secuencias, n = numeros.shape
+    if intervalos is None:
+        intervalos = max(5, int(np.ceil(np.sqrt(n))))
+    elif intervalos <= 0:
+        raise ValueError("El número de intervalos debe ser positivo")
+    if n < intervalos:
+        intervalos = max(5, min(n, int(np.ceil(np.sqrt(n)))))
+        print(f"Advertencia: Ajustando número de intervalos a {intervalos} debido al tamaño de muestra")
+
+    # Igual que ChiSquaredAccumulator: los valores fuera de [0, 1] no se cuentan pero sí cuentan en n
+    validos = (numeros >= 0) & (numeros <= 1)
+    filas = np.nonzero(validos)[0]
+    indices = _bin_indices(numeros[validos], np.linspace(0, 1, intervalos + 1))
+    fo = np.bincount(filas * intervalos + indices, minlength=secuencias * intervalos).reshape(secuencias, intervalos)
+
+    fe = n / intervalos
+    chi_cuadrado = np.sum((fo - fe) ** 2, axis=1) / fe
+    grados_libertad = intervalos - 1
+    chi_critico = chi2_critical(alpha, grados_libertad)
+    return TestResult({
+        'n': n,
+        'secuencias': secuencias,
+        'intervalos': intervalos,
+        'chi_cuadrado': chi_cuadrado,
+        'chi_critico': chi_critico,
+        'grados_libertad': grados_libertad,
+        'alpha': alpha,
+        'aceptado': chi_cuadrado < chi_critico,
+        'fo': fo,
+        'fe': fe,
+    }, {
+        'p_valor': lambda: _chi2_p_values(chi_cuadrado, grados_libertad),
+    }, decision=(chi_cuadrado, lambda nivel: chi2_critical(nivel, grados_libertad)))
+
+
+def kolgomorov_batch(numeros, alpha: float = 0.05) -> TestResult:
+    """
+    Kolmogorov-Smirnov de uniformidad en [0, 1] para cada secuencia de `numeros`.
+
+    Args:
+        numeros: Arreglo 2-D (secuencias × n)
+        alpha: float - Nivel de significancia
+
+    Returns:
+        TestResult: D_plus, D_minus, D, p_valor y aceptado por secuencia; D_critico común.
+            La distribución exacta de D para 'p_valor' cuesta cerca de 1 ms por
+            secuencia, mucho más que la prueba y la decisión
+    """
+    numeros = _as_matrix(numeros)
+    secuencias, n = numeros.shape
+    ordenados = np.sort(numeros, axis=1)
+
+    D_plus = np.max(np.arange(1, n + 1) / n - ordenados, axis=1)
+    D_minus = np.max(ordenados - np.arange(0, n) / n, axis=1)
+    D = np.maximum(D_plus, D_minus)
+
+    D_critico = ks_critical(alpha, n)
+    return TestResult({
+        'n': n,
+        'secuencias': secuencias,
+        'D_plus': D_plus,
+        'D_minus': D_minus,
+        'D': D,
+        'D_critico': D_critico,
+        'alpha': alpha,
+        'aceptado': D < D_critico,
+    }, {
+        'p_valor': lambda: scipy_stats().kstwo.sf(D, n),
+    }, decision=(D, lambda nivel: ks_critical(nivel, n)))
+
+
+def _runs(simbolos: np.ndarray) -> np.ndarray:
+    """Cantidad de corridas de cada renglón de símbolos."""
+    return 1 + np.count_nonzero(simbolos[:, 1:] != simbolos[:, :-1], axis=1)
+
+
+def up_down_batch(numeros, alpha: float = 0.05) -> TestResult:
+    """
+    Corridas arriba y abajo para cada secuencia de `numeros`.
+
+    Args:
+        numeros: Arreglo 2-D (secuencias × n)
+        alpha: float - Nivel de significancia
+
+    Returns:
+        TestResult: Co, Z0, p_valor y aceptado por secuencia; mu_Co, sigma_Co y Z_critico comunes
+    """
+    numeros = _as_matrix(numeros)
+    secuencias, n = numeros.shape
+    Co = _runs(np.diff(numeros, axis=1) > 0)
+
+    mu_Co = (2 * n - 1) / 3
+    varianza_Co = (16 * n - 29) / 90
+    sigma_Co = np.sqrt(varianza_Co)
+    Z0 = np.abs(Co - mu_Co) / sigma_Co
+
+    Z_critico = norm_critical(alpha)
+    return TestResult({
+        'n': n,
+        'secuencias': secuencias,
+        'Co': Co,
+        'mu_Co': mu_Co,
+        'varianza_Co': varianza_Co,
+        'sigma_Co': sigma_Co,
+        'Z0': Z0,
+        'Z_critico': Z_critico,
+        'alpha': alpha,
+        'aceptado': Z0 < Z_critico,
+    }, {
+        'p_valor': lambda: _norm_p_values(Z0),
+    }, decision=(Z0, norm_critical))
+
+
+def up_down_average_batch(numeros, alpha: float = 0.05) -> TestResult:
+    """
+    Corridas arriba y abajo de la media para cada secuencia de `numeros`.
+
+    Cada secuencia se compara contra su propia media.
+
+    Args:
+        numeros: Arreglo 2-D (secuencias × n)
+        alpha: float - Nivel de significancia
+
+    Returns:
+        TestResult: n0, n1, Co, mu_Co, sigma_Co, Z0, p_valor y aceptado por secuencia; Z_critico común
+    """
+    numeros = _as_matrix(numeros)
+    secuencias, n = numeros.shape
+    S = numeros >= np.mean(numeros, axis=1, keepdims=True)
+    Co = _runs(S)
+
+    n1 = np.count_nonzero(S, axis=1)
+    n0 = n - n1
+    # En flotantes: 2 * n0 * n1 * (2 * n0 * n1 - n) desborda int64 desde n ~ 10^5
+    producto = 2.0 * n0 * n1
+    mu_Co = producto / n + 0.5
+    varianza_Co = producto * (producto - n) / (n ** 2 * (n - 1))
+    sigma_Co = np.sqrt(varianza_Co)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Una secuencia constante tiene varianza 0 (o -0.0) y queda con Z0 infinito (se rechaza)
+        Z0 = np.abs((Co - mu_Co) / sigma_Co)
+
+    Z_critico = norm_critical(alpha)
+    return TestResult({
+        'n': n,
+        'secuencias': secuencias,
+        'n0': n0,
+        'n1': n1,
+        'Co': Co,
+        'mu_Co': mu_Co,
+        'varianza_Co': varianza_Co,
+        'sigma_Co': sigma_Co,
+        'Z0': Z0,
+        'Z_critico': Z_critico,
+        'alpha': alpha,
+        'aceptado': Z0 < Z_critico,
+    }, {
+        'p_valor': lambda: _norm_p_values(Z0),
+    }, decision=(Z0, norm_critical))
+
+
+def gap_batch(numeros, alpha: float = 0.05, a: float = 0.3, b: float = 0.7, max_hueco: int = MAX_HUECO) -> TestResult:
+    """
+    Prueba de huecos en [a, b) para cada secuencia de `numeros`.
+
+    Los huecos de todas las secuencias salen de las posiciones de los
+    aciertos de la matriz completa y sus frecuencias de un solo np.bincount.
+    Las categorías de cada secuencia son las mismas que en TestMethods.gap_test
+    (una por longitud observada, agrupando las >= max_hueco), así que los
+    grados de libertad pueden variar entre secuencias.
+
+    Args:
+        numeros: Arreglo 2-D (secuencias × n)
+        alpha: float - Nivel de significancia
+        a: float - Límite inferior del intervalo
+        b: float - Límite superior del intervalo
+        max_hueco: int - Los huecos de esta longitud o más se agrupan
+
+    Returns:
+        TestResult: total_huecos, grados_libertad, chi_cuadrado, chi_critico,
+            p_valor y aceptado por secuencia; frecuencias de forma (secuencias, max_hueco + 1).
+            Las secuencias sin huecos quedan con chi_cuadrado NaN y se rechazan
+    """
+    if max_hueco <= 0:
+        raise ValueError("La longitud máxima de hueco debe ser positiva")
+    if a >= b:
+        raise ValueError("El intervalo debe cumplir a < b")
+    numeros = _as_matrix(numeros)
+    secuencias, n = numeros.shape
+    K = max_hueco
+    p = b - a
+
+    filas, columnas = np.nonzero((numeros >= a) & (numeros < b))
+    # Hueco desde el acierto anterior de la misma secuencia, o desde el inicio en el primero
+    huecos = np.diff(columnas, prepend=-1) - 1
+    primeros = np.ones(filas.size, dtype=bool)
+    primeros[1:] = filas[1:] != filas[:-1]
+    huecos[primeros] = columnas[primeros]
+    frecuencias = np.bincount(filas * (K + 1) + np.minimum(huecos, K),
+                              minlength=secuencias * (K + 1)).reshape(secuencias, K + 1)
+    total_huecos = frecuencias.sum(axis=1)
+
+    # La última categoría con huecos: la longitud mayor, o K si hubo huecos >= K
+    grados_libertad = K - np.argmax(frecuencias[:, ::-1] > 0, axis=1)
+    grados_libertad[total_huecos == 0] = 0
+    categorias = np.arange(K + 1)
+    probabilidades = np.append(p * (1 - p) ** categorias[:K], (1 - p) ** K)
+    fe = total_huecos[:, np.newaxis] * probabilidades
+    # La última categoría de cada secuencia es la longitud observada, no la cola >= K, si es menor que K
+    usadas = (categorias <= grados_libertad[:, np.newaxis]) & (fe > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terminos = np.where(usadas, (frecuencias - fe) ** 2 / fe, 0.0)
+    chi_cuadrado = np.where(total_huecos > 0, terminos.sum(axis=1), np.nan)
+
+    critico = _chi2_criticals(grados_libertad)
+    chi_critico = critico(alpha)
+    return TestResult({
+        'n': n,
+        'secuencias': secuencias,
+        'alpha': alpha,
+        'a': a,
+        'b': b,
+        'p': p,
+        'frecuencias': frecuencias,
+        'total_huecos': total_huecos,
+        'grados_libertad': grados_libertad,
+        'chi_cuadrado': chi_cuadrado,
+        'chi_critico': chi_critico,
+        'aceptado': chi_cuadrado < chi_critico,
+    }, {
+        'p_valor': lambda: _chi2_p_values(chi_cuadrado, grados_libertad),
+    }, decision=(chi_cuadrado, critico))
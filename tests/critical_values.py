@@ -0,0 +1,166 @@
+"""
+Valores críticos memorizados de las distribuciones que usan las pruebas.
+
+Cada valor se guarda con la clave (distribución, alpha, parámetro) y SciPy
+solo se importa la primera vez que se pide un valor que no está guardado. Al
+importar el módulo la tabla se precarga desde critical_values.json con los
+valores más comunes (alpha de 0.10, 0.05 y 0.01). Para regenerar ese archivo:
+
+    python -c "from tests.critical_values import build_preloaded_table; build_preloaded_table()"
+"""
+import json
+import math
+import os
+from typing import Optional
+
+from utils.cache import cache_dir
+
+DIRECTORIO_CACHE_POR_DEFECTO = cache_dir("critical_values")
+TABLA_PRECARGADA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "critical_values.json")
+ALPHAS_COMUNES = (0.10, 0.05, 0.01)
+# Grados de libertad (chi2) y tamaños de muestra (kstwo) que se precargan
+PARAMETRO_MAXIMO_PRECARGADO = 100
+
+# (distribución, alpha, parámetro) -> valor crítico
+_VALORES: dict = {}
+
+
+def scipy_stats():
+    """Importa scipy.stats solo cuando se necesita (la primera importación tarda)."""
+    from scipy import stats
+    return stats
+
+
+def scipy_special():
+    """Importa scipy.special, bastante más ligero que scipy.stats, solo cuando se necesita."""
+    from scipy import special
+    return special
+
+
+def _quantile(distribucion: str, alpha: float, parametro):
+    """Calcula con SciPy el valor crítico que se guarda para la clave dada."""
+    stats = scipy_stats()
+    if distribucion == "chi2":
+        return float(stats.chi2.ppf(1 - alpha, parametro))
+    if distribucion == "norm":
+        return float(stats.norm.ppf(1 - alpha / 2))
+    if distribucion == "kstwo":
+        return float(stats.kstwo.ppf(1 - alpha, parametro))
+    raise ValueError(f"Distribución no soportada: {distribucion}")
+
+
+def critical_value(distribucion: str, alpha: float, parametro=None) -> float:
+    """
+    Devuelve el valor crítico memorizado, calculándolo la primera vez.
+
+    Args:
+        distribucion (str): "chi2" (cola derecha), "norm" (dos colas) o "kstwo" (cola derecha)
+        alpha (float): Nivel de significancia
+        parametro: Grados de libertad (chi2), tamaño de muestra (kstwo) o None (norm)
+
+    Returns:
+        float: Valor crítico
+    """
+    clave = (distribucion, float(alpha), None if parametro is None else int(parametro))
+    valor = _VALORES.get(clave)
+    if valor is None:
+        valor = _VALORES[clave] = _quantile(*clave)
+    return valor
+
+
+def chi2_critical(alpha: float, grados_libertad: int) -> float:
+    """Valor de chi-cuadrada que deja alpha a la derecha."""
+    return critical_value("chi2", alpha, grados_libertad)
+
+
+def norm_critical(alpha: float) -> float:
+    """Valor Z de dos colas, ppf(1 - alpha/2) de la normal estándar."""
+    return critical_value("norm", alpha)
+
+
+def ks_critical(alpha: float, n: int) -> float:
+    """Valor crítico de D de Kolmogorov-Smirnov para una muestra de tamaño n."""
+    return critical_value("kstwo", alpha, n)
+
+
+def chi2_p_value(chi_cuadrado: float, grados_libertad: int) -> float:
+    """Probabilidad de una chi-cuadrada de `grados_libertad` mayor o igual al estadístico."""
+    if grados_libertad <= 0:
+        return float("nan")
+    return float(scipy_special().chdtrc(grados_libertad, chi_cuadrado))
+
+
+def norm_p_value(z: float) -> float:
+    """Valor p de dos colas de un estadístico Z normal estándar: P(|Z| >= |z|)."""
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def ks_p_value(D: float, n: int) -> float:
+    """Probabilidad de que D de Kolmogorov-Smirnov sea mayor o igual al observado para n números."""
+    return float(scipy_stats().kstwo.sf(D, n))
+
+
+def cache_path(directorio: Optional[str] = None) -> str:
+    """Ruta del archivo de la tabla persistida."""
+    return os.path.join(directorio or DIRECTORIO_CACHE_POR_DEFECTO, "critical_values.json")
+
+
+def load_cache(ruta: Optional[str] = None) -> int:
+    """
+    Agrega a la tabla los valores guardados en disco, si el archivo existe.
+
+    Args:
+        ruta (str): Archivo JSON (default: ~/.cache/proyecto_simulacion/critical_values/critical_values.json)
+
+    Returns:
+        int: Cantidad de valores leídos
+    """
+    ruta = ruta or cache_path()
+    if not os.path.exists(ruta):
+        return 0
+    with open(ruta, encoding="utf-8") as archivo:
+        registros = json.load(archivo)
+    for distribucion, alpha, parametro, valor in registros:
+        _VALORES[(distribucion, float(alpha), parametro)] = float(valor)
+    return len(registros)
+
+
+def save_cache(ruta: Optional[str] = None) -> str:
+    """
+    Guarda en disco todos los valores memorizados hasta ahora.
+
+    Args:
+        ruta (str): Archivo JSON (default: ~/.cache/proyecto_simulacion/critical_values/critical_values.json)
+
+    Returns:
+        str: Ruta del archivo escrito
+    """
+    ruta = ruta or cache_path()
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    registros = [[d, a, p, v] for (d, a, p), v in sorted(_VALORES.items(), key=_sort_key)]
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        archivo.write("[\n" + ",\n".join(json.dumps(registro) for registro in registros) + "\n]\n")
+    os.replace(temporal, ruta)
+    return ruta
+
+
+def _sort_key(item) -> tuple:
+    """Ordena por distribución, alpha y parámetro (None primero)."""
+    (distribucion, alpha, parametro), _ = item
+    return distribucion, alpha, -1 if parametro is None else parametro
+
+
+def build_preloaded_table() -> int:
+    """Calcula los valores comunes, los escribe en TABLA_PRECARGADA y devuelve cuántos son."""
+    _VALORES.clear()
+    for alpha in ALPHAS_COMUNES:
+        norm_critical(alpha)
+        for parametro in range(1, PARAMETRO_MAXIMO_PRECARGADO + 1):
+            chi2_critical(alpha, parametro)
+            ks_critical(alpha, parametro)
+    save_cache(TABLA_PRECARGADA)
+    return len(_VALORES)
+
+
+load_cache(TABLA_PRECARGADA)
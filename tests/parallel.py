@@ -0,0 +1,101 @@
+""" Ejecución de la batería de pruebas sobre muchas secuencias con varios procesos. """
+from __future__ import annotations
+import math
+import os
+from typing import Optional, Sequence
+
+from utils.lazy import lazy_import
+
+from tests.tests_methods import TestMethods
+
+np = lazy_import("numpy")
+# multiprocessing tarda en importarse y solo se usa al repartir entre procesos
+futures = lazy_import("concurrent.futures")
+shared_memory = lazy_import("multiprocessing.shared_memory")
+
+# Lotes por proceso cuando no se indica el tamaño de lote, para repartir mejor la carga
+LOTES_POR_PROCESO = 4
+
+
+def battery_parallel(secuencias, alpha: float = 0.05, procesos: Optional[int] = None,
+                     tamano_lote: Optional[int] = None, alphas: Optional[Sequence[float]] = None,
+                     **opciones) -> list:
+    """
+    Ejecuta TestMethods.battery sobre muchas secuencias repartidas entre procesos.
+
+    Las secuencias se copian una sola vez a un búfer de memoria compartida;
+    cada proceso abre el búfer por nombre y prueba vistas sin copia de sus
+    secuencias. De regreso solo viajan los valores escalares de cada
+    resultado (TestResult.scalars), nunca los arreglos.
+
+    Args:
+        secuencias: Arreglo 2-D (una secuencia por renglón) o lista de arreglos 1-D
+        alpha (float): Nivel de significancia
+        procesos (int): Cantidad de procesos (default: os.cpu_count())
+        tamano_lote (int): Secuencias por tarea (default: reparte en LOTES_POR_PROCESO lotes por proceso)
+        alphas: Niveles de significancia adicionales; cada prueba agrega
+            'decisiones' = {alpha: aceptado} sin volver a calcularse
+        **opciones: intervalos, a, b, max_hueco de TestMethods.battery
+
+    Returns:
+        list: Por secuencia, {nombre de la prueba: valores escalares}, en el mismo orden
+    """
+    secuencias = [np.asarray(secuencia, dtype=np.float64).ravel() for secuencia in secuencias]
+    if not secuencias:
+        return []
+    procesos = procesos or os.cpu_count() or 1
+    tamano_lote = tamano_lote or max(1, math.ceil(len(secuencias) / (procesos * LOTES_POR_PROCESO)))
+    if tamano_lote <= 0:
+        raise ValueError("El tamaño de lote debe ser positivo")
+
+    if alphas is not None:
+        opciones = {**opciones, "alphas": tuple(alphas)}
+    if procesos == 1:
+        pruebas = TestMethods()
+        return [_scalar_battery(pruebas, secuencia, alpha, opciones) for secuencia in secuencias]
+
+    limites = np.cumsum([0] + [secuencia.size for secuencia in secuencias]).tolist()
+    total = limites[-1]
+    memoria = shared_memory.SharedMemory(create=True, size=max(total, 1) * np.dtype(np.float64).itemsize)
+    try:
+        compartido = np.ndarray((total,), dtype=np.float64, buffer=memoria.buf)
+        for secuencia, inicio, fin in zip(secuencias, limites[:-1], limites[1:]):
+            compartido[inicio:fin] = secuencia
+        del compartido
+
+        tramos = list(zip(limites[:-1], limites[1:]))
+        with futures.ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            tareas = [
+                ejecutor.submit(_run_batch, memoria.name, total, tramos[i:i + tamano_lote], alpha, opciones)
+                for i in range(0, len(tramos), tamano_lote)
+            ]
+            return [resultado for tarea in tareas for resultado in tarea.result()]
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+def _scalar_battery(pruebas: TestMethods, numeros: np.ndarray, alpha: float, opciones: dict) -> dict:
+    """Batería sobre una secuencia, reducida a los valores escalares de cada prueba."""
+    opciones = dict(opciones)
+    alphas = opciones.pop("alphas", None)
+    resultados = pruebas.battery(numeros, alpha=alpha, **opciones)
+    if alphas is None:
+        return {nombre: resultado.scalars(("p_valor",)) for nombre, resultado in resultados.items()}
+    return {
+        nombre: {**resultado.scalars(("p_valor",)), "decisiones": resultado.decisions(alphas)}
+        for nombre, resultado in resultados.items()
+    }
+
+
+def _run_batch(nombre_memoria: str, total: int, tramos: list, alpha: float, opciones: dict) -> list:
+    """Prueba las secuencias [inicio, fin) de la memoria compartida y devuelve sus escalares."""
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        compartido = np.ndarray((total,), dtype=np.float64, buffer=memoria.buf)
+        pruebas = TestMethods()
+        resultados = [_scalar_battery(pruebas, compartido[inicio:fin], alpha, opciones) for inicio, fin in tramos]
+        del compartido
+        return resultados
+    finally:
+        memoria.close()
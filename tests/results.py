@@ -0,0 +1,146 @@
+"""Resultados de las pruebas estadísticas con tablas de despliegue perezosas."""
+from collections.abc import Mapping
+from numbers import Number
+from typing import Callable, Optional
+
+from utils.instrumentation import phase
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+class TestResult(Mapping):
+    """
+    Resultado compacto de una prueba estadística.
+
+    Los estadísticos numéricos se guardan al crear el resultado. Las tablas de
+    despliegue (DataFrames con números formateados) se registran como
+    funciones y se construyen solo la primera vez que se consultan; después
+    quedan guardadas. Se usa igual que el diccionario que devolvían las
+    pruebas: resultado['chi_cuadrado'], resultado.get('tabla_frecuencias'),
+    'tabla' in resultado, o como atributo: resultado.chi_cuadrado.
+
+    Las tablas de un renglón por número se registran en `tablas` para poder
+    pedir solo algunos renglones (table_rows) sin construir la tabla completa.
+    Con `decision` el mismo estadístico se compara contra otros niveles de
+    significancia (decisions) sin volver a ejecutar la prueba.
+    """
+
+    __slots__ = ("_valores", "_perezosos", "_tablas", "_decision")
+
+    def __init__(self, valores: dict, perezosos: Optional[dict] = None, tablas: Optional[dict] = None,
+                 decision: Optional[tuple] = None) -> None:
+        """
+        Args:
+            valores: Estadísticos ya calculados
+            perezosos: {clave: función sin argumentos} para los valores que se construyen al consultarlos
+            tablas: {clave: (función(filas: slice) -> DataFrame, cantidad de renglones)};
+                resultado[clave] construye la tabla completa
+            decision: (estadístico, función(alpha) -> valor crítico); se acepta si estadístico < crítico
+        """
+        self._valores = valores
+        self._perezosos = dict(perezosos or {})
+        self._decision = decision
+        self._tablas = dict(tablas or {})
+        for clave, (construir, _) in self._tablas.items():
+            self._perezosos.setdefault(clave, construir)
+
+    def __getitem__(self, clave):
+        if clave in self._valores:
+            return self._valores[clave]
+        if clave in self._perezosos:
+            construir: Callable = self._perezosos.pop(clave)
+            with phase(f"tabla.{clave}"):
+                valor = self._valores[clave] = construir()
+            return valor
+        raise KeyError(clave)
+
+    def __contains__(self, clave) -> bool:
+        return clave in self._valores or clave in self._perezosos
+
+    def __iter__(self):
+        yield from list(self._valores)
+        yield from list(self._perezosos)
+
+    def __len__(self) -> int:
+        return len(self._valores) + len(self._perezosos)
+
+    def __getattr__(self, nombre: str):
+        if nombre.startswith("_"):
+            raise AttributeError(nombre)
+        try:
+            return self[nombre]
+        except KeyError:
+            raise AttributeError(nombre) from None
+
+    def table_length(self, clave) -> int:
+        """Cantidad de renglones de una tabla, sin construirla."""
+        if clave in self._tablas:
+            return self._tablas[clave][1]
+        return len(self[clave])
+
+    def table_rows(self, clave, inicio: int, fin: int):
+        """
+        Renglones [inicio, fin) de una tabla.
+
+        Si la tabla ya se construyó se toma una rebanada; si no, solo se
+        construyen esos renglones y la tabla completa sigue pendiente.
+        """
+        if clave in self._tablas and clave not in self._valores:
+            with phase(f"tabla.{clave}"):
+                return self._tablas[clave][0](slice(inicio, fin))
+        return self[clave].iloc[inicio:fin]
+
+    def decisions(self, alphas) -> dict:
+        """
+        Decisión de la prueba para cada nivel de significancia, con el estadístico ya calculado.
+
+        Los valores críticos están memorizados (ver critical_values), así que
+        pedir 0.10, 0.05 y 0.01 cuesta tres consultas y no tres pruebas.
+
+        Args:
+            alphas: Niveles de significancia
+
+        Returns:
+            dict: {alpha: True si se acepta la hipótesis}; en las pruebas por
+                lotes (tests.batch) cada decisión es un arreglo con una por secuencia
+        """
+        if self._decision is None:
+            # Pruebas sin estadístico (por ejemplo huecos sin aciertos): misma decisión para todo alpha
+            return {float(alpha): bool(self._valores['aceptado']) for alpha in alphas}
+        estadistico, critico = self._decision
+        decisiones = {}
+        for alpha in alphas:
+            aceptado = np.less(estadistico, critico(alpha))
+            decisiones[float(alpha)] = bool(aceptado) if aceptado.ndim == 0 else aceptado
+        return decisiones
+
+    def statistics(self) -> dict:
+        """Devuelve solo los valores ya calculados, sin construir ninguna tabla."""
+        return dict(self._valores)
+
+    def scalars(self, perezosos=()) -> dict:
+        """
+        Devuelve solo los valores escalares (números, booleanos y texto) ya calculados.
+
+        Los escalares de NumPy se convierten a tipos de Python, así que el
+        resultado es pequeño y se puede serializar o enviar entre procesos.
+
+        Args:
+            perezosos: Claves perezosas que se calculan antes, por ejemplo
+                ("p_valor",), que importa SciPy solo al pedirse
+        """
+        for clave in perezosos:
+            if clave in self:
+                self[clave]
+        escalares = {}
+        for clave, valor in self._valores.items():
+            if isinstance(valor, np.generic):
+                escalares[clave] = valor.item()
+            elif isinstance(valor, (Number, str)):
+                escalares[clave] = valor
+        return escalares
+
+    def __repr__(self) -> str:
+        pendientes = f", pendientes={list(self._perezosos)}" if self._perezosos else ""
+        return f"TestResult({self._valores!r}{pendientes})"
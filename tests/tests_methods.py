@@ -1,14 +1,43 @@
 """Módulo de pruebas estadísticas para números aleatorios."""
-import numpy as np
-import pandas as pd
+from __future__ import annotations
 from typing import Optional
-from scipy import stats
-from collections import Counter
 
+from utils.instrumentation import instrument_methods, phase
+from utils.lazy import lazy_import
+
+from tests import batch
+from tests.accumulators import (
+    ChiSquaredAccumulator, KolmogorovAccumulator, GapAccumulator,
+    INTERVALOS_KOLMOGOROV, MAX_HUECO, TAMANO_BLOQUE
+)
+from tests.critical_values import ks_critical, ks_p_value, norm_critical, norm_p_value
+from tests.results import TestResult
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+def _as_numbers(numeros):
+    """Secuencia como arreglo sin copiarla; rechaza los estados enteros sin normalizar."""
+    numeros = np.asarray(numeros)
+    if numeros.dtype.kind == "u":
+        raise ValueError("La secuencia tiene estados enteros (uint); divídalos entre su escala "
+                         "(10**longitud o m) antes de probarlos")
+    return numeros
+
+
+@instrument_methods("prueba")
 class TestMethods():
+    """
+    Pruebas estadísticas de uniformidad, aleatoriedad e independencia.
 
+    Cada prueba acepta una lista, un arreglo de NumPy en float64 o float32
+    (por ejemplo de RandomGenerators con formato="float32") o un np.memmap
+    (de load_sequence). Los arreglos se usan sin copiarse y ninguna prueba
+    modifica la secuencia.
+    """
     
-    def up_down_method(self, numeros=None, n=20, alpha=0.05, seed=None) -> dict:
+    def up_down_method(self, numeros=None, n=20, alpha=0.05, seed=None) -> TestResult:
         """
         Prueba de Corridas Arriba y Abajo
         
@@ -22,7 +51,7 @@ class TestMethods():
             seed: int - Semilla para reproducibilidad (opcional)
         
         Returns:
-            dict: con todos los resultados de la prueba
+            TestResult: con todos los resultados de la prueba (las tablas se construyen al consultarlas)
         """
         
         if numeros is None:
@@ -30,21 +59,37 @@ class TestMethods():
                 np.random.seed(seed)
             numeros = np.random.uniform(0, 1, n)
         else:
-            numeros = np.array(numeros)
-            n = len(numeros)
-        
-        simbolos = []
-        for i in range(1, n):
-            if numeros[i] > numeros[i-1]:
-                simbolos.append('+')  
-            else:
-                simbolos.append('-')  
-        
-        # Contar corridas
-        Co = 1  
-        for i in range(1, len(simbolos)):
-            if simbolos[i] != simbolos[i-1]:
-                Co += 1
+            numeros = _as_numbers(numeros)
+        
+        return self._up_down_result(numeros, np.diff(numeros), alpha)
+    
+    def up_down_average(self, numeros=None, n=20, alpha=0.05, seed=None) -> TestResult:
+        """
+        Prueba de Corridas Arriba y Abajo de la Media
+        
+        Args:
+            numeros: Lista de números a probar (opcional)
+            n: int - Cantidad de números a generar si numeros es None
+            alpha: float - Nivel de significancia (default: 0.05)
+            seed: int - Semilla para reproducibilidad (opcional)
+        
+        Returns:
+            TestResult: con todos los resultados de la prueba (las tablas se construyen al consultarlas)
+        """
+        
+        if numeros is None:
+            if seed is not None:
+                np.random.seed(seed)
+            numeros = np.random.uniform(0, 1, n)
+        else:
+            numeros = _as_numbers(numeros)
+        
+        return self._up_down_average_result(numeros, np.mean(numeros), alpha)
+    
+    def _up_down_result(self, numeros, diferencias, alpha) -> TestResult:
+        """Corridas arriba y abajo a partir de las diferencias consecutivas ya calculadas."""
+        n = len(numeros)
+        sube, Co, corrida_ids = self._up_down_runs(diferencias)
         
         mu_Co = (2 * n - 1) / 3
         varianza_Co = (16 * n - 29) / 90
@@ -52,7 +97,8 @@ class TestMethods():
         
         Z0 = abs(Co - mu_Co) / sigma_Co
         
-        Z_critico = stats.norm.ppf(1 - alpha/2)
+        Z_critico = norm_critical(alpha)
+        p_valor = norm_p_value(Z0)
         
         if abs(Z0) < Z_critico:
             resultado = "Se acepta hipótesis"
@@ -63,82 +109,62 @@ class TestMethods():
             conclusion = "Los números no son aleatorios"
             aceptado = False
         
-        df_numeros = pd.DataFrame({
-            'i': range(1, n+1),
-            'Número (ri)': [f"{num:.6f}" for num in numeros]
-        })
-        
-        comparaciones = []
-        for i in range(1, n):
-            if numeros[i] > numeros[i-1]:
-                comparaciones.append(f"{numeros[i]:.4f} > {numeros[i-1]:.4f}")
-            else:
-                comparaciones.append(f"{numeros[i]:.4f} ≤ {numeros[i-1]:.4f}")
-        
-        df_simbolos = pd.DataFrame({
-            'i': range(2, n+1),
-            'Comparación': comparaciones,
-            'Símbolo': simbolos
-        })
-        
-        corridas = ['Corrida 1']
-        corrida_actual = 1
-        for i in range(1, len(simbolos)):
-            if simbolos[i] != simbolos[i-1]:
-                corrida_actual += 1
-            corridas.append(f'Corrida {corrida_actual}')
-        df_simbolos['Corrida'] = corridas
-        
-        return {
+        def tabla_numeros(filas=slice(None)):
+            return pd.DataFrame({
+                'i': range(1, n+1)[filas],
+                'Número (ri)': [f"{num:.6f}" for num in numeros[filas].tolist()]
+            })
+        
+        def tabla_simbolos(filas=slice(None)):
+            sube_filas = sube[filas]
+            simbolos = np.where(sube_filas, '+', '-')
+            anteriores, actuales = numeros[:-1][filas].tolist(), numeros[1:][filas].tolist()
+            comparaciones = [
+                f"{actual:.4f} > {anterior:.4f}" if s else f"{actual:.4f} ≤ {anterior:.4f}"
+                for actual, anterior, s in zip(actuales, anteriores, sube_filas.tolist())
+            ]
+            
+            df_simbolos = pd.DataFrame({
+                'i': range(2, n+1)[filas],
+                'Comparación': comparaciones,
+                'Símbolo': simbolos
+            })
+            df_simbolos['Corrida'] = [f'Corrida {k}' for k in corrida_ids[filas].tolist()]
+            return df_simbolos
+        
+        return TestResult({
             'numeros': numeros,
             'n': n,
-            'simbolos': simbolos,
+            'sube': sube,
             'Co': Co,
             'mu_Co': mu_Co,
             'varianza_Co': varianza_Co,
             'sigma_Co': sigma_Co,
             'Z0': Z0,
             'Z_critico': Z_critico,
+            'p_valor': p_valor,
             'alpha': alpha,
             'aceptado': aceptado,
             'conclusion': conclusion,
             'resultado': resultado,
-            'tabla_numeros': df_numeros,
-            'tabla_simbolos': df_simbolos
-        }
+        }, {
+            'simbolos': lambda: np.where(sube, '+', '-'),
+        }, {
+            'tabla_numeros': (tabla_numeros, n),
+            'tabla_simbolos': (tabla_simbolos, n - 1),
+        }, decision=(abs(Z0), norm_critical))
     
-    def up_down_average(self, numeros=None, n=20, alpha=0.05, seed=None) -> dict:
-        """
-        Prueba de Corridas Arriba y Abajo de la Media
-        
-        Args:
-            numeros: Lista de números a probar (opcional)
-            n: int - Cantidad de números a generar si numeros es None
-            alpha: float - Nivel de significancia (default: 0.05)
-            seed: int - Semilla para reproducibilidad (opcional)
-        
-        Returns:
-            dict: con todos los resultados de la prueba
-        """
-        
-        if numeros is None:
-            if seed is not None:
-                np.random.seed(seed)
-            numeros = np.random.uniform(0, 1, n)
-        else:
-            numeros = np.array(numeros)
-            n = len(numeros)
-        
-        media = np.mean(numeros)        
-        S = (numeros >= media).astype(int)
-        
-        n0 = np.sum(S == 0)  # Números debajo de la media
-        n1 = np.sum(S == 1)  # Números arriba de la media
-        
-        Co = 1  # Primera corrida
-        for i in range(1, n):
-            if S[i] != S[i-1]:
-                Co += 1
+    def _up_down_average_result(self, numeros, media, alpha) -> TestResult:
+        """Corridas arriba y abajo de la media a partir de la media ya calculada."""
+        n = len(numeros)
+        if n < 2:
+            # La varianza divide entre n - 1
+            raise ValueError("Se necesitan al menos 2 números para la prueba de corridas de la media")
+        S, Co, corrida_ids = self._above_below_runs(numeros, media)
+        
+        # Enteros de Python: 2 * n0 * n1 * (2 * n0 * n1 - n) desborda int64 desde n ~ 10^5
+        n1 = int(np.count_nonzero(S))  # Números arriba de la media
+        n0 = n - n1  # Números debajo de la media
                 
         mu_Co = (2 * n0 * n1) / n + 0.5
         varianza_Co = (2 * n0 * n1 * (2 * n0 * n1 - n)) / (n**2 * (n - 1))
@@ -146,7 +172,8 @@ class TestMethods():
         
         Z0 = abs(Co - mu_Co) / sigma_Co
         
-        Z_critico = stats.norm.ppf(1 - alpha/2)
+        Z_critico = norm_critical(alpha)
+        p_valor = norm_p_value(Z0)
         
         if abs(Z0) < Z_critico:
             resultado = "Se acepta hipótesis"
@@ -157,22 +184,18 @@ class TestMethods():
             conclusion = "Los números no son aleatorios"
             aceptado = False
         
-        df = pd.DataFrame({
-            'i': range(1, n+1),
-            'Número (ri)': [f"{num:.6f}" for num in numeros],
-            'S': S,
-            'Posición': ['Debajo' if s == 0 else 'Arriba' for s in S]
-        })
-        
-        corridas = ['Corrida 1']
-        corrida_actual = 1
-        for i in range(1, n):
-            if S[i] != S[i-1]:
-                corrida_actual += 1
-            corridas.append(f'Corrida {corrida_actual}')
-        df['Corrida'] = corridas
-        
-        return {
+        def tabla(filas=slice(None)):
+            S_filas = S[filas]
+            df = pd.DataFrame({
+                'i': range(1, n+1)[filas],
+                'Número (ri)': [f"{num:.6f}" for num in numeros[filas].tolist()],
+                'S': S_filas,
+                'Posición': ['Debajo' if s == 0 else 'Arriba' for s in S_filas.tolist()]
+            })
+            df['Corrida'] = [f'Corrida {k}' for k in corrida_ids[filas].tolist()]
+            return df
+        
+        return TestResult({
             'numeros': numeros,
             'n': n,
             'media': media,
@@ -185,64 +208,70 @@ class TestMethods():
             'sigma_Co': sigma_Co,
             'Z0': Z0,
             'Z_critico': Z_critico,
+            'p_valor': p_valor,
             'alpha': alpha,
             'aceptado': aceptado,
             'conclusion': conclusion,
             'resultado': resultado,
-            'tabla': df
-        }
+        }, None, {
+            'tabla': (tabla, n)
+        }, decision=(abs(Z0), norm_critical))
     
-    def kolgomorov_method(self, numeros=None, alpha=0.05, n=20) -> dict:
+    def kolgomorov_method(self, numeros=None, alpha=0.05, n=20) -> TestResult:
         """
         Realiza la prueba de Kolmogorov-Smirnov para uniformidad en [0,1].
 
+        El valor crítico y el valor p salen de la distribución de D para el n
+        dado (scipy.stats.kstwo: exacta para n pequeño y asintótica para n
+        grande), así que se acepta cualquier n y cualquier alpha.
+
         Args:
             numeros: Lista de números a probar (opcional)
             alpha: float - Nivel de significancia
             n: int - Cantidad de números a generar si numeros es None
             
         Returns:
-            dict: con todos los resultados de la prueba
+            TestResult: con todos los resultados de la prueba (las tablas se construyen al consultarlas)
         """
         
         if numeros is None:
             numeros = np.random.uniform(0, 1, n)
         else:
-            numeros = np.array(numeros)
-            n = len(numeros)
-            
-        num_ordenados = np.sort(numeros)
+            numeros = _as_numbers(numeros)
+        
+        return self._kolmogorov_result(numeros, np.sort(numeros), alpha)
+    
+    def _kolmogorov_result(self, numeros, num_ordenados, alpha) -> TestResult:
+        """Kolmogorov-Smirnov a partir de la secuencia ya ordenada."""
+        n = len(numeros)
 
         i_n = np.arange(1, n + 1) / n
-        i_n_1 = np.arange(0, n) / n
         
         D_plus = np.max(i_n - num_ordenados)
-        D_minus = np.max(num_ordenados - i_n_1)  
+        D_minus = np.max(num_ordenados - np.arange(0, n) / n)
         D = max(D_plus, D_minus) 
 
-        valores_criticos = {
-            0.10: 1.22 / np.sqrt(n),
-            0.05: 1.36 / np.sqrt(n),
-            0.01: 1.63 / np.sqrt(n)
-        }
-        D_critico = valores_criticos[alpha]
+        D_critico = ks_critical(alpha, n)
         
         aceptado = D < D_critico
         conclusion = "Los números son uniformes" if aceptado else "Los números no son uniformes"
         
-        tabla = pd.DataFrame({
-            'i': range(1, n + 1),
-            'ri': [f"{num:.6f}" for num in numeros],
-            'ri ordenado': [f"{num:.6f}" for num in num_ordenados],
-            'i/n': [f"{val:.6f}" for val in i_n],
-            '(i-1)/n': [f"{val:.6f}" for val in i_n_1]
-        })
+        def i_n_1():
+            return np.arange(0, n) / n
+
+        def tabla(filas=slice(None)):
+            return pd.DataFrame({
+                'i': range(1, n + 1)[filas],
+                'ri': [f"{num:.6f}" for num in numeros[filas].tolist()],
+                'ri ordenado': [f"{num:.6f}" for num in num_ordenados[filas].tolist()],
+                'i/n': [f"{val:.6f}" for val in i_n[filas].tolist()],
+                '(i-1)/n': [f"{val:.6f}" for val in (np.asarray(range(n)[filas]) / n).tolist()]
+            })
 
-        return {
+        return TestResult({
             "numeros_generados": numeros,
             "numeros_ordenados": num_ordenados,
             "i_n": i_n,
-            "i_n_1": i_n_1,
             "D_plus": D_plus,
             "D_minus": D_minus,
             "D": D,
@@ -251,10 +280,36 @@ class TestMethods():
             "n": n,
             "aceptado": aceptado,
             "conclusion": conclusion,
-            "tabla_completa": tabla
-        }
+        }, {
+            "i_n_1": i_n_1,
+            "p_valor": lambda: ks_p_value(D, n),
+        }, {
+            "tabla_completa": (tabla, n),
+        }, decision=(D, lambda nivel: ks_critical(nivel, n)))
+
+    def kolgomorov_stream(self, bloques, alpha=0.05, intervalos=INTERVALOS_KOLMOGOROV) -> TestResult:
+        """
+        Prueba de Kolmogorov-Smirnov aproximada sobre una secuencia que llega por bloques
+        
+        Sirve para secuencias demasiado grandes para ordenarlas en memoria
+        (por ejemplo 10^8 números de RandomGenerators.stream). D se obtiene de
+        una función de distribución por intervalos fijos y se reportan sus
+        cotas; con los 2^20 intervalos por defecto el error es del orden de 10^-6.
+        
+        Args:
+            bloques: Iterable de arreglos de números
+            alpha: float - Nivel de significancia
+            intervalos: int - Número de intervalos fijos de [0, 1]
+            
+        Returns:
+            TestResult: con D_inferior, D_superior, cota_error, D, D_critico, p_valor y la decisión
+        """
+        acumulador = KolmogorovAccumulator(intervalos)
+        for bloque in bloques:
+            acumulador.update(bloque)
+        return acumulador.finalize(alpha)
     
-    def chi_squared_test(self, numeros=None, n=20, alpha=0.05, intervalos=None) -> dict:
+    def chi_squared_test(self, numeros=None, n=20, alpha=0.05, intervalos=None) -> TestResult:
         """
         Prueba Chi-Cuadrada para uniformidad
         
@@ -265,14 +320,18 @@ class TestMethods():
             intervalos: int - Número de intervalos (opcional).
             
         Returns:
-            dict: con todos los resultados de la prueba
+            TestResult: con todos los resultados de la prueba (las tablas se construyen al consultarlas)
         """
         if numeros is None:
             numeros = np.random.uniform(0, 1, n)
         else:
-            numeros = np.array(numeros)
-            n = len(numeros)
+            numeros = _as_numbers(numeros)
         
+        return self._chi_squared_result(numeros, None, alpha, intervalos)
+    
+    def _chi_squared_result(self, numeros, ordenados, alpha, intervalos) -> TestResult:
+        """Chi-Cuadrada; si se da la secuencia ordenada las frecuencias salen de búsquedas binarias."""
+        n = len(numeros)
         if intervalos is None:
             # Usar la regla de la raíz cuadrada del tamaño de muestra
             intervalos = max(5, int(np.ceil(np.sqrt(n))))
@@ -284,47 +343,46 @@ class TestMethods():
             intervalos = max(5, min(n, int(np.ceil(np.sqrt(n)))))
             print(f"Advertencia: Ajustando número de intervalos a {intervalos} debido al tamaño de muestra")
         
-        fe = n / intervalos  # Ahora intervalos siempre será > 0 y <= n
-        
-        bins = np.linspace(0, 1, intervalos + 1)
-        fo, _ = np.histogram(numeros, bins=bins)
-        
-        chi_cuadrado = np.sum(((fo - fe) ** 2) / fe)
-        
-        grados_libertad = intervalos - 1
-        
-        chi_critico = stats.chi2.ppf(1 - alpha, grados_libertad)
+        acumulador = ChiSquaredAccumulator(intervalos)  # Ahora intervalos siempre será > 0 y <= n
+        if ordenados is None:
+            # Por bloques: con un np.memmap solo se lee un bloque a la vez
+            for inicio in range(0, n, TAMANO_BLOQUE):
+                acumulador.update(numeros[inicio:inicio + TAMANO_BLOQUE])
+        else:
+            acumulador.update_sorted(ordenados)
+        return acumulador.finalize(alpha, numeros)
+    
+    def chi_squared_stream(self, bloques, alpha=0.05, intervalos=None, n=None) -> TestResult:
+        """
+        Prueba Chi-Cuadrada para uniformidad sobre una secuencia que llega por bloques
         
-        aceptado = chi_cuadrado < chi_critico
-        conclusion = "Los números son uniformes" if aceptado else "Los números no son uniformes"
+        Los bloques se procesan uno a uno (por ejemplo los de RandomGenerators.stream
+        o los leídos de disco), así que la secuencia nunca se materializa completa.
         
-        tabla_freq = pd.DataFrame({
-            'Intervalo': [f"[{bins[i]:.2f}, {bins[i+1]:.2f})" for i in range(intervalos)],
-            'FO (Observada)': fo,
-            'FE (Esperada)': [fe] * intervalos,
-            '(FO-FE)²/FE': [((o - fe) ** 2) / fe for o in fo]
-        })
+        Args:
+            bloques: Iterable de arreglos de números
+            alpha: float - Nivel de significancia
+            intervalos: int - Número de intervalos (opcional si se da n)
+            n: int - Tamaño esperado de la secuencia, para la regla de la raíz cuadrada
+            
+        Returns:
+            TestResult: con los mismos campos que chi_squared_test (sin 'numeros')
+        """
+        if intervalos is None:
+            if n is None:
+                raise ValueError("Se necesita el número de intervalos o el tamaño esperado n")
+            intervalos = max(5, int(np.ceil(np.sqrt(n))))
         
-        return {
-            'numeros': numeros,
-            'n': n,
-            'intervalos': intervalos,
-            'chi_cuadrado': chi_cuadrado,
-            'chi_critico': chi_critico,
-            'grados_libertad': grados_libertad,
-            'alpha': alpha,
-            'aceptado': aceptado,
-            'conclusion': conclusion,
-            'tabla_frecuencias': tabla_freq,
-            'fo': fo,
-            'fe': fe
-        }
+        acumulador = ChiSquaredAccumulator(intervalos)
+        for bloque in bloques:
+            acumulador.update(bloque)
+        return acumulador.finalize(alpha)
     
-    def gap_test(self, numeros=None, n=20, alpha=0.05, a=0.3, b=0.7) -> dict:
+    def gap_test(self, numeros=None, n=20, alpha=0.05, a=0.3, b=0.7, max_hueco=MAX_HUECO) -> TestResult:
         """
         Prueba de Huecos (Gap Test)
         
-        Mide la longitud de huecos entre números que caen en un intervalo [a, b]
+        Mide la longitud de huecos entre números que caen en un intervalo [a, b)
         
         Args:
             numeros: Lista de números a probar (opcional)
@@ -332,110 +390,227 @@ class TestMethods():
             alpha: float - Nivel de significancia
             a: float - Límite inferior del intervalo (default: 0.3)
             b: float - Límite superior del intervalo (default: 0.7)
+            max_hueco: int - Los huecos de esta longitud o más forman la categoría "≥max_hueco" (default: 4)
             
         Returns:
-            dict: con todos los resultados de la prueba
+            TestResult: con todos los resultados de la prueba (las tablas se construyen al consultarlas)
         """
         
         if numeros is None:
             numeros = np.random.uniform(0, 1, n)
         else:
-            numeros = np.array(numeros)
-            n = len(numeros)
-        
-        # Probabilidad de estar en el intervalo
-        p = b - a
-        
-        huecos = []
-        hueco_actual = 0
-        
-        for num in numeros:
-            if a <= num < b:
-                huecos.append(hueco_actual)
-                hueco_actual = 0
-            else:
-                hueco_actual += 1
-        
-        if len(huecos) == 0:
-            return {
-                'numeros': numeros,
-                'n': n,
-                'alpha': alpha,
-                'aceptado': False,
-                'conclusion': "No se encontraron suficientes huecos para la prueba",
-                'a': a,
-                'b': b,
-                'p': p,
-                'total_huecos': 0
-            }
-        
-        contador_huecos = Counter(huecos)
-        max_hueco = max(contador_huecos.keys()) if contador_huecos else 0
-        
-        # Agrupar huecos grandes en una categoría "≥4"
-        categorias_num = list(range(min(4, max_hueco + 1)))
-        if max_hueco >= 4:
-            categorias_num.append(4)  # 4 para los cálculos de ≥4
-        
-        categorias_str = [str(i) for i in categorias_num]
-        if max_hueco >= 4:
-            categorias_str[-1] = "≥4"
-        
-        fo = []
-        fe = []
-        for (cat_num, cat_str) in enumerate(zip(categorias_num, categorias_str)):
-            if cat_str == "≥4":
-                fo_val = sum(count for gap, count in contador_huecos.items() if gap >= 4)
-                fe_val = len(huecos) * ((1 - p) ** 4)
-            else:
-                fo_val = contador_huecos.get(cat_num, 0)
-                fe_val = len(huecos) * p * ((1 - p) ** cat_num)
+            numeros = _as_numbers(numeros)
+        
+        return self._gap_result(numeros, None, alpha, a, b, max_hueco)
+    
+    def _gap_result(self, numeros, dentro, alpha, a, b, max_hueco) -> TestResult:
+        """Prueba de huecos; `dentro` es la máscara a <= x < b si ya se calculó."""
+        acumulador = GapAccumulator([(a, b)], max_hueco)
+        if dentro is None:
+            for inicio in range(0, len(numeros), TAMANO_BLOQUE):
+                acumulador.update(numeros[inicio:inicio + TAMANO_BLOQUE])
+        else:
+            acumulador.update_mask(dentro[np.newaxis])
+        return acumulador.finalize(alpha, numeros)[0]
+    
+    def gap_test_intervals(self, numeros=None, n=20, alpha=0.05, intervalos=((0.3, 0.7),),
+                           max_hueco=MAX_HUECO) -> list:
+        """
+        Prueba de Huecos para varios intervalos [a, b) en una sola pasada
+        
+        La secuencia se recorre una vez, por bloques, comparando cada bloque
+        contra todos los intervalos.
+        
+        Args:
+            numeros: Lista de números a probar (opcional)
+            n: int - Cantidad de números a generar si numeros es None
+            alpha: float - Nivel de significancia
+            intervalos: Lista de pares (a, b)
+            max_hueco: int - Los huecos de esta longitud o más se agrupan
             
-            fo.append(fo_val)
-            fe.append(fe_val)
+        Returns:
+            list: Un TestResult por intervalo, en el mismo orden
+        """
+        if numeros is None:
+            numeros = np.random.uniform(0, 1, n)
+        else:
+            numeros = _as_numbers(numeros)
         
-        chi_cuadrado, chi_critico, grados_libertad, aceptado = self._compute_chi_square(fo, fe, alpha)
-        conclusion = "Los números son independientes" if aceptado else "Los números no son independientes"
+        acumulador = GapAccumulator(intervalos, max_hueco)
+        for inicio in range(0, len(numeros), TAMANO_BLOQUE):
+            acumulador.update(numeros[inicio:inicio + TAMANO_BLOQUE])
+        return acumulador.finalize(alpha, numeros)
+    
+    def gap_stream(self, bloques, alpha=0.05, intervalos=((0.3, 0.7),), max_hueco=MAX_HUECO) -> list:
+        """
+        Prueba de Huecos para varios intervalos sobre una secuencia que llega por bloques
         
-        tabla = pd.DataFrame({
-            'Longitud Hueco': categorias_str,
-            'FO (Observada)': fo,
-            'FE (Esperada)': [f"{e:.4f}" for e in fe],
-            '(FO-FE)²/FE': [f"{((o - e) ** 2) / e if e > 0 else 0:.4f}" for o, e in zip(fo, fe)]
-        })
+        Args:
+            bloques: Iterable de arreglos de números
+            alpha: float - Nivel de significancia
+            intervalos: Lista de pares (a, b)
+            max_hueco: int - Los huecos de esta longitud o más se agrupan
+            
+        Returns:
+            list: Un TestResult por intervalo (sin 'numeros' ni 'huecos')
+        """
+        acumulador = GapAccumulator(intervalos, max_hueco)
+        for bloque in bloques:
+            acumulador.update(bloque)
+        return acumulador.finalize(alpha)
+    
+    def chi_squared_batch(self, numeros, alpha=0.05, intervalos=None) -> TestResult:
+        """
+        Chi-Cuadrada sobre muchas secuencias a la vez (ver tests.batch)
         
-        return {
-            'numeros': numeros,
-            'n': n,
-            'alpha': alpha,
-            'a': a,
-            'b': b,
-            'p': p,
-            'huecos': huecos,
-            'total_huecos': len(huecos),
-            'chi_cuadrado': chi_cuadrado,
-            'chi_critico': chi_critico,
-            'grados_libertad': grados_libertad,
-            'aceptado': aceptado,
-            'conclusion': conclusion,
-            'tabla_huecos': tabla
+        Args:
+            numeros: Arreglo 2-D con una secuencia por renglón (secuencias × n)
+            alpha: float - Nivel de significancia
+            intervalos: int - Número de intervalos (opcional)
+            
+        Returns:
+            TestResult: con arreglos de estadísticos, valores p y decisiones (uno por secuencia)
+        """
+        return batch.chi_squared_batch(_as_numbers(numeros), alpha, intervalos)
+    
+    def kolgomorov_batch(self, numeros, alpha=0.05) -> TestResult:
+        """
+        Kolmogorov-Smirnov sobre muchas secuencias a la vez (ver tests.batch)
+        
+        Args:
+            numeros: Arreglo 2-D con una secuencia por renglón (secuencias × n)
+            alpha: float - Nivel de significancia
+            
+        Returns:
+            TestResult: con arreglos de estadísticos, valores p y decisiones (uno por secuencia)
+        """
+        return batch.kolgomorov_batch(_as_numbers(numeros), alpha)
+    
+    def up_down_batch(self, numeros, alpha=0.05) -> TestResult:
+        """
+        Corridas arriba y abajo sobre muchas secuencias a la vez (ver tests.batch)
+        
+        Args:
+            numeros: Arreglo 2-D con una secuencia por renglón (secuencias × n)
+            alpha: float - Nivel de significancia
+            
+        Returns:
+            TestResult: con arreglos de estadísticos, valores p y decisiones (uno por secuencia)
+        """
+        return batch.up_down_batch(_as_numbers(numeros), alpha)
+    
+    def up_down_average_batch(self, numeros, alpha=0.05) -> TestResult:
+        """
+        Corridas arriba y abajo de la media sobre muchas secuencias a la vez (ver tests.batch)
+        
+        Args:
+            numeros: Arreglo 2-D con una secuencia por renglón (secuencias × n)
+            alpha: float - Nivel de significancia
+            
+        Returns:
+            TestResult: con arreglos de estadísticos, valores p y decisiones (uno por secuencia)
+        """
+        return batch.up_down_average_batch(_as_numbers(numeros), alpha)
+    
+    def gap_batch(self, numeros, alpha=0.05, a=0.3, b=0.7, max_hueco=MAX_HUECO) -> TestResult:
+        """
+        Prueba de Huecos sobre muchas secuencias a la vez (ver tests.batch)
+        
+        Args:
+            numeros: Arreglo 2-D con una secuencia por renglón (secuencias × n)
+            alpha: float - Nivel de significancia
+            a: float - Límite inferior del intervalo
+            b: float - Límite superior del intervalo
+            max_hueco: int - Los huecos de esta longitud o más se agrupan
+            
+        Returns:
+            TestResult: con arreglos de estadísticos, valores p y decisiones (uno por secuencia)
+        """
+        return batch.gap_batch(_as_numbers(numeros), alpha, a, b, max_hueco)
+    
+    def battery(self, numeros=None, n=20, alpha=0.05, intervalos=None, a=0.3, b=0.7,
+                max_hueco=MAX_HUECO) -> dict:
+        """
+        Ejecuta las cinco pruebas sobre la misma secuencia
+        
+        La secuencia se convierte a arreglo una sola vez y los cálculos
+        intermedios se comparten: el arreglo ordenado (Kolmogorov-Smirnov y
+        las frecuencias de Chi-Cuadrada por búsqueda binaria), las diferencias
+        consecutivas, la media y la máscara del intervalo de huecos.
+        
+        Args:
+            numeros: Lista de números a probar (opcional)
+            n: int - Cantidad de números a generar si numeros es None
+            alpha: float - Nivel de significancia
+            intervalos: int - Número de intervalos de Chi-Cuadrada (opcional)
+            a: float - Límite inferior del intervalo de huecos
+            b: float - Límite superior del intervalo de huecos
+            max_hueco: int - Los huecos de esta longitud o más se agrupan
+            
+        Returns:
+            dict: {nombre de la prueba: TestResult}, con los mismos resultados
+                que llamar a cada prueba por separado
+        """
+        if numeros is None:
+            numeros = np.random.uniform(0, 1, n)
+        else:
+            numeros = _as_numbers(numeros)
+        
+        with phase("prueba.battery.intermedios"):
+            ordenados = np.sort(numeros)
+            diferencias = np.diff(numeros)
+            media = np.mean(numeros)
+            dentro = (numeros >= a) & (numeros < b)
+        
+        pruebas = {
+            "Chi-Cuadrada": lambda: self._chi_squared_result(numeros, ordenados, alpha, intervalos),
+            "Kolmogorov-Smirnov": lambda: self._kolmogorov_result(numeros, ordenados, alpha),
+            "Corridas Arriba y Abajo": lambda: self._up_down_result(numeros, diferencias, alpha),
+            "Corridas Arriba y Abajo de la Media": lambda: self._up_down_average_result(numeros, media, alpha),
+            "Huecos": lambda: self._gap_result(numeros, dentro, alpha, a, b, max_hueco),
         }
+        resultados = {}
+        for nombre, prueba in pruebas.items():
+            with phase(f"prueba.battery.{nombre}"):
+                resultados[nombre] = prueba()
+        return resultados
     
-    def _compute_chi_square(self, fo, fe, alpha=0.05):
+    def _up_down_runs(self, diferencias):
         """
-        Calcula el estadístico chi-cuadrado, grados de libertad y el valor crítico.
+        Calcula en forma vectorizada los símbolos y corridas de la prueba arriba y abajo.
 
         Args:
-            fo: lista/array de frecuencias observadas
-            fe: lista/array de frecuencias esperadas
-            alpha: nivel de significancia
+            diferencias: np.ndarray con np.diff(numeros)
 
         Returns:
-            tuple: (chi_cuadrado, chi_critico, grados_libertad, aceptado)
-        """
-        # Asegurar listas numéricas
-        chi_cuadrado = sum(((o - e) ** 2) / e if e > 0 else 0 for o, e in zip(fo, fe))
-        grados_libertad = len(fo) - 1
-        chi_critico = stats.chi2.ppf(1 - alpha, grados_libertad)
-        aceptado = chi_cuadrado < chi_critico
-        return chi_cuadrado, chi_critico, grados_libertad, aceptado
\ No newline at end of file
+            tuple: (sube, Co, corrida_ids) donde sube[i] indica numeros[i+1] > numeros[i]
+                y corrida_ids[i] es el número de corrida (desde 1) de cada símbolo
+        """
+        sube = diferencias > 0
+        cambios = sube[1:] != sube[:-1]
+        Co = 1 + np.count_nonzero(cambios)
+        corrida_ids = np.empty(sube.size, dtype=np.int64)
+        corrida_ids[:1] = 1
+        np.cumsum(cambios, out=corrida_ids[1:])
+        corrida_ids[1:] += 1
+        return sube, Co, corrida_ids
+
+    def _above_below_runs(self, numeros, media):
+        """
+        Calcula en forma vectorizada las corridas arriba y abajo de la media.
+
+        Args:
+            numeros: np.ndarray con los números a probar
+            media: float - Media de los números
+
+        Returns:
+            tuple: (S, Co, corrida_ids) donde S[i] es 1 si numeros[i] >= media y 0 si no
+        """
+        S = (numeros >= media).astype(np.int8)
+        cambios = S[1:] != S[:-1]
+        Co = 1 + np.count_nonzero(cambios)
+        corrida_ids = np.empty(S.size, dtype=np.int64)
+        corrida_ids[:1] = 1
+        np.cumsum(cambios, out=corrida_ids[1:])
+        corrida_ids[1:] += 1
+        return S, Co, corrida_ids
@@ -3,9 +3,14 @@ from .utils import (
     get_alpha, 
     clear_screen,
     show_generator_table,
+    show_lcg_period,
     show_test_results,
     get_n,
-    get_n_kolgomorov
+    get_n_kolgomorov,
+    show_table,
+    page_table,
+    write_table,
+    summary_statistics
 )
 
 __all__ = [
@@ -13,7 +18,12 @@ __all__ = [
     'get_alpha', 
     'clear_screen',
     'show_generator_table',
+    'show_lcg_period',
     'show_test_results',
     'get_n',
-    'get_n_kolgomorov'
+    'get_n_kolgomorov',
+    'show_table',
+    'page_table',
+    'write_table',
+    'summary_statistics'
 ]
\ No newline at end of file
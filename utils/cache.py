@@ -0,0 +1,17 @@
+"""Carpeta de caché del proyecto, compartida por todos los archivos que se guardan en disco."""
+import os
+
+DIRECTORIO_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "proyecto_simulacion")
+
+
+def cache_dir(subcarpeta: str) -> str:
+    """
+    Devuelve la carpeta de una caché dentro de la carpeta del proyecto.
+
+    Args:
+        subcarpeta (str): Nombre de la caché (p. ej. "critical_values")
+
+    Returns:
+        str: Ruta ~/.cache/proyecto_simulacion/<subcarpeta> (no se crea aquí)
+    """
+    return os.path.join(DIRECTORIO_CACHE, subcarpeta)
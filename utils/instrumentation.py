@@ -0,0 +1,261 @@
+"""
+Medición opcional por fases: generación, pruebas, construcción de tablas y despliegue.
+
+Desactivada por omisión; en ese caso `phase` devuelve un contexto vacío
+compartido y los métodos instrumentados solo revisan una bandera antes de
+llamar a la función original, así que el costo es de unos cientos de
+nanosegundos por llamada.
+
+Uso:
+    from utils import instrumentation
+    instrumentation.enable(memoria=True)
+    ...                                   # usar generadores, pruebas y tablas
+    print(instrumentation.get_metrics().summary())
+    instrumentation.get_metrics().to_json("metricas.json")
+
+    with instrumentation.profile("corrida.prof"):   # cProfile solo para esta corrida
+        ...
+"""
+import contextlib
+import functools
+import io
+import json
+import sys
+import time
+from typing import Optional
+
+from utils.lazy import lazy_import
+
+# tracemalloc y cProfile solo se necesitan con la medición activa
+tracemalloc = lazy_import("tracemalloc")
+cProfile = lazy_import("cProfile")
+pstats = lazy_import("pstats")
+
+_NULO = contextlib.nullcontext()
+_activo = False
+_memoria = False
+# Fases abiertas: [pico de memoria visto desde que empezó la fase, ...] para las fases anidadas
+_pila = []
+
+
+class Metrics:
+    """
+    Métricas acumuladas por fase.
+
+    Cada fase guarda la cantidad de llamadas, el tiempo total y máximo (el de
+    una fase incluye el de las fases anidadas), el cambio neto de bloques
+    reservados por Python (sys.getallocatedblocks) y, si se mide memoria, el
+    cambio neto y el pico de memoria reservada según tracemalloc (incluye los
+    arreglos de NumPy).
+    """
+
+    def __init__(self) -> None:
+        self.fases = {}
+        self.perfil = None
+
+    def record(self, nombre: str, tiempo: float, bloques: int, memoria_neta: Optional[int] = None,
+               pico_memoria: Optional[int] = None) -> None:
+        """Suma una llamada de la fase `nombre`."""
+        fase = self.fases.get(nombre)
+        if fase is None:
+            fase = self.fases[nombre] = {"llamadas": 0, "tiempo_total": 0.0, "tiempo_max": 0.0, "bloques_netos": 0}
+        fase["llamadas"] += 1
+        fase["tiempo_total"] += tiempo
+        fase["tiempo_max"] = max(fase["tiempo_max"], tiempo)
+        fase["bloques_netos"] += bloques
+        if pico_memoria is not None:
+            fase["memoria_neta"] = fase.get("memoria_neta", 0) + memoria_neta
+            fase["pico_memoria"] = max(fase.get("pico_memoria", 0), pico_memoria)
+
+    def reset(self) -> None:
+        """Borra todas las fases y el perfil."""
+        self.fases.clear()
+        self.perfil = None
+
+    def to_dict(self) -> dict:
+        """Fases y perfil en un diccionario serializable."""
+        datos = {"fases": {nombre: dict(fase) for nombre, fase in self.fases.items()}}
+        if self.perfil is not None:
+            datos["perfil"] = self.perfil
+        return datos
+
+    def to_json(self, ruta: Optional[str] = None) -> str:
+        """
+        Args:
+            ruta (str): Si se indica, también se escribe el JSON en este archivo
+
+        Returns:
+            str: Las métricas en JSON
+        """
+        texto = json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        if ruta is not None:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto + "\n")
+        return texto
+
+    def summary(self) -> str:
+        """Tabla de texto con las fases ordenadas por tiempo total."""
+        ancho = max([len(nombre) for nombre in self.fases] + [4]) + 2
+        renglones = [f"{'fase':<{ancho}}{'llamadas':>10}{'total (s)':>12}{'máx. (s)':>12}{'pico (MB)':>12}"]
+        for nombre, fase in sorted(self.fases.items(), key=lambda item: -item[1]["tiempo_total"]):
+            pico = f"{fase['pico_memoria'] / 2 ** 20:.1f}" if "pico_memoria" in fase else "—"
+            renglones.append(f"{nombre:<{ancho}}{fase['llamadas']:>10}{fase['tiempo_total']:>12.4f}"
+                             f"{fase['tiempo_max']:>12.4f}{pico:>12}")
+        return "\n".join(renglones)
+
+
+_METRICAS = Metrics()
+
+
+def enable(memoria: bool = True) -> Metrics:
+    """
+    Activa la medición por fases.
+
+    Args:
+        memoria (bool): Si es True también se mide el pico de memoria con
+            tracemalloc, que hace más lentas las reservas de memoria
+
+    Returns:
+        Metrics: Las métricas donde se acumulan las fases
+    """
+    global _activo, _memoria
+    _activo, _memoria = True, memoria
+    if memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return _METRICAS
+
+
+def disable() -> None:
+    """Desactiva la medición; las métricas acumuladas se conservan."""
+    global _activo, _memoria
+    if _memoria and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _activo = _memoria = False
+
+
+def is_enabled() -> bool:
+    return _activo
+
+
+def get_metrics() -> Metrics:
+    return _METRICAS
+
+
+class _Phase:
+    """Contexto que mide una fase y la suma a las métricas al salir."""
+
+    __slots__ = ("nombre", "inicio", "bloques", "memoria")
+
+    def __init__(self, nombre: str) -> None:
+        self.nombre = nombre
+        self.memoria = None
+
+    def __enter__(self):
+        if _memoria:
+            actual, pico = tracemalloc.get_traced_memory()
+            if _pila:
+                # El pico de la fase que contiene a esta se conserva antes de reiniciarlo
+                _pila[-1] = max(_pila[-1], pico)
+            tracemalloc.reset_peak()
+            self.memoria = actual
+            _pila.append(actual)
+        self.bloques = sys.getallocatedblocks()
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *error):
+        tiempo = time.perf_counter() - self.inicio
+        bloques = sys.getallocatedblocks() - self.bloques
+        if self.memoria is None or not tracemalloc.is_tracing():
+            _METRICAS.record(self.nombre, tiempo, bloques)
+            return False
+        actual, pico = tracemalloc.get_traced_memory()
+        pico = max(_pila.pop(), pico)
+        if _pila:
+            _pila[-1] = max(_pila[-1], pico)
+        _METRICAS.record(self.nombre, tiempo, bloques, actual - self.memoria, pico - self.memoria)
+        return False
+
+
+def phase(nombre: str):
+    """
+    Contexto que mide el bloque como la fase `nombre`.
+
+    Con la medición desactivada devuelve un contexto vacío compartido.
+    """
+    return _Phase(nombre) if _activo else _NULO
+
+
+def instrumented(prefijo: str):
+    """Decorador que mide cada llamada a la función como la fase 'prefijo.nombre'."""
+    def decorador(funcion):
+        nombre = f"{prefijo}.{funcion.__name__}"
+
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            if not _activo:
+                return funcion(*args, **kwargs)
+            with _Phase(nombre):
+                return funcion(*args, **kwargs)
+        return medida
+    return decorador
+
+
+def instrument_methods(prefijo: str):
+    """Decorador de clase que aplica `instrumented(prefijo)` a todos sus métodos públicos."""
+    def decorador(clase):
+        for nombre, atributo in list(vars(clase).items()):
+            if callable(atributo) and not nombre.startswith("_"):
+                setattr(clase, nombre, instrumented(prefijo)(atributo))
+        return clase
+    return decorador
+
+
+@contextlib.contextmanager
+def profile(ruta: Optional[str] = None, renglones: int = 25):
+    """
+    Captura un perfil de cProfile solo durante el bloque.
+
+    Las funciones más costosas (por tiempo acumulado) quedan como texto en
+    Metrics.perfil, así que también aparecen en to_json.
+
+    Args:
+        ruta (str): Si se indica, el perfil completo se guarda ahí (se abre con pstats o snakeviz)
+        renglones (int): Funciones que se guardan en Metrics.perfil
+    """
+    perfilador = cProfile.Profile()
+    perfilador.enable()
+    try:
+        yield perfilador
+    finally:
+        perfilador.disable()
+        if ruta is not None:
+            perfilador.dump_stats(ruta)
+        texto = io.StringIO()
+        pstats.Stats(perfilador, stream=texto).sort_stats("cumulative").print_stats(renglones)
+        _METRICAS.perfil = texto.getvalue()
+
+
+@contextlib.contextmanager
+def session(ruta_metricas: Optional[str] = None, ruta_perfil: Optional[str] = None, memoria: bool = True):
+    """
+    Mide un bloque completo (una corrida del menú o del modo por lotes).
+
+    Sin rutas no hace nada. Con ruta_metricas activa la medición por fases y
+    al terminar (aunque sea por una excepción o sys.exit) escribe el JSON;
+    con ruta_perfil además captura cProfile durante el bloque.
+
+    Args:
+        ruta_metricas (str): Archivo JSON de métricas
+        ruta_perfil (str): Archivo del perfil de cProfile
+        memoria (bool): Medir también el pico de memoria con tracemalloc
+    """
+    if ruta_metricas:
+        enable(memoria)
+    try:
+        with profile(ruta_perfil) if ruta_perfil else _NULO:
+            yield _METRICAS
+    finally:
+        if ruta_metricas:
+            disable()
+            _METRICAS.to_json(ruta_metricas)
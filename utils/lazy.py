@@ -0,0 +1,31 @@
+"""Importación diferida de los módulos pesados (numpy, pandas, tabulate)."""
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Módulo que se importa de verdad la primera vez que se consulta uno de sus atributos.
+
+    Al cargarse copia el diccionario del módulo real, así que después los
+    accesos como np.array cuestan lo mismo que con un import normal.
+    """
+
+    def __getattr__(self, atributo: str):
+        modulo = importlib.import_module(self.__name__)
+        self.__dict__.update(modulo.__dict__)
+        return getattr(modulo, atributo)
+
+
+def lazy_import(nombre: str) -> types.ModuleType:
+    """
+    Devuelve el módulo `nombre` sin importarlo todavía.
+
+    Args:
+        nombre (str): Nombre completo del módulo, por ejemplo "numpy"
+
+    Returns:
+        ModuleType: El módulo real si ya estaba importado, o un LazyModule
+    """
+    return sys.modules.get(nombre) or LazyModule(nombre)
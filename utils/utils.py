@@ -1,8 +1,29 @@
 "Utilidades para los métodos de prueba de aleatoriedad"
-import pandas as pd
+import math
 import os
-from tabulate import tabulate
-from typing import List, Union, Tuple
+from typing import Callable, List, Union, Tuple
+
+from utils.instrumentation import instrumented, phase
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+tabulate = lazy_import("tabulate")
+
+# Una tabla con más renglones que 2 * FILAS_VISTA_PREVIA muestra solo sus primeros y últimos renglones
+FILAS_VISTA_PREVIA = 10
+FILAS_POR_PAGINA = 25
+# Renglones que se formatean a la vez al guardar una tabla completa
+RENGLONES_POR_BLOQUE = 1 << 16
+# Números por bloque al calcular las estadísticas de una secuencia
+TAMANO_BLOQUE_ESTADISTICAS = 1 << 16
+# Niveles de significancia de la tabla de decisiones de cada prueba (90%, 95% y 99%)
+NIVELES_SIGNIFICANCIA = (0.10, 0.05, 0.01)
+
+def _tabulate(*args, **kwargs) -> str:
+    """tabulate.tabulate medido como la fase 'tabulate'."""
+    with phase("tabulate"):
+        return tabulate.tabulate(*args, **kwargs)
 
 def clear_screen():
     """Limpia la pantalla de la consola"""
@@ -13,12 +34,12 @@ def table_up_down(resultados: dict):
     print("\n" + "="*80)
     print("Tabla de números aleatorios usados:")
     print("="*80)
-    print(resultados['tabla_numeros'].to_string(index=False))
+    show_table(*_result_rows(resultados, 'tabla_numeros'), interactivo=False)
     
     print("\n" + "="*80)
     print("Tabla de símbolos y corridas:")
     print("="*80)
-    print(resultados['tabla_simbolos'].to_string(index=False))
+    show_table(*_result_rows(resultados, 'tabla_simbolos'), interactivo=False)
     
     print("\n" + "="*80)
     print("Resumen:")
@@ -61,14 +82,14 @@ def get_alpha() -> float:
             print("Error: Entrada inválida. Por favor ingrese un número entero entre válido.")
 
 def get_n_kolgomorov() -> int:
-    "Devuelve la cantidad de números aleatorios a generar, máximo 20 números."
+    "Devuelve la cantidad de números aleatorios a generar para Kolmogorov-Smirnov (cualquier n positivo)."
     while True:
         try:
-            n = int(input("Ingrese la cantidad de números aleatorios a generar (máximo 20): "))
-            if n > 0 and n <= 20:
+            n = int(input("Ingrese la cantidad de números aleatorios a generar: "))
+            if n > 0:
                 return n
             else:
-                print("Error: La cantidad de números debe ser mayor a 1 y menor o igual a 20.")
+                print("Error: La cantidad de números debe ser mayor a 0.")
         except ValueError:
             print("Error: Entrada inválida. Por favor ingrese un número entero válido.")
 
@@ -84,19 +105,162 @@ def get_n() -> int:
         except ValueError:
             print("Error: Entrada inválida. Por favor ingrese un número entero válido.")
 
+def show_table(filas_de: Callable, total: int, interactivo: bool = True):
+    """
+    Muestra una tabla sin formatear más renglones de los que se imprimen.
+
+    Si tiene más de 2 * FILAS_VISTA_PREVIA renglones se muestran solo los
+    primeros y los últimos; en modo interactivo después se ofrece verla por
+    páginas o guardarla completa en un CSV.
+
+    Args:
+        filas_de: Función (inicio, fin) -> DataFrame con los renglones [inicio, fin)
+        total (int): Cantidad de renglones de la tabla
+        interactivo (bool): Ofrecer paginar o guardar cuando la tabla se recorta
+    """
+    if total <= 2 * FILAS_VISTA_PREVIA:
+        print(_tabulate(filas_de(0, total), headers='keys', tablefmt='fancy_grid', showindex=False))
+        return
+
+    cabeza = filas_de(0, FILAS_VISTA_PREVIA)
+    cola = filas_de(total - FILAS_VISTA_PREVIA, total)
+    separador = pd.DataFrame([{columna: '⋮' for columna in cabeza.columns}])
+    vista = pd.concat([cabeza, separador, cola], ignore_index=True)
+    print(_tabulate(vista, headers='keys', tablefmt='fancy_grid', showindex=False))
+    print(f"Se muestran los primeros y últimos {FILAS_VISTA_PREVIA} de {total} renglones.")
+    if interactivo:
+        offer_full_table(filas_de, total)
+
+def offer_full_table(filas_de: Callable, total: int):
+    """Pregunta si se quiere recorrer por páginas o guardar en CSV una tabla recortada."""
+    while True:
+        opcion = input("[p] Ver por páginas  [g] Guardar la tabla completa en CSV  [Enter] Continuar: ").strip().lower()
+        if opcion == "":
+            return
+        if opcion == "p":
+            page_table(filas_de, total)
+        elif opcion == "g":
+            ruta = input("Ruta del archivo CSV: ").strip()
+            try:
+                write_table(ruta, filas_de, total)
+                print(f"Se guardaron {total} renglones en {ruta}")
+            except OSError as error:
+                print(f"Error: {error}")
+        else:
+            print("Error: Opción inválida.")
+
+def page_table(filas_de: Callable, total: int, filas_por_pagina: int = FILAS_POR_PAGINA):
+    """
+    Recorre una tabla página por página; solo se formatea la página que se muestra.
+
+    Args:
+        filas_de: Función (inicio, fin) -> DataFrame con los renglones [inicio, fin)
+        total (int): Cantidad de renglones de la tabla
+        filas_por_pagina (int): Renglones por página
+    """
+    paginas = max(1, math.ceil(total / filas_por_pagina))
+    pagina = 0
+    while True:
+        inicio = pagina * filas_por_pagina
+        print(_tabulate(filas_de(inicio, min(inicio + filas_por_pagina, total)),
+                        headers='keys', tablefmt='fancy_grid', showindex=False))
+        opcion = input(f"Página {pagina + 1} de {paginas}. [Enter] Siguiente  [a] Anterior  "
+                       f"[número] Ir a la página  [q] Salir: ").strip().lower()
+        if opcion == "q" or (opcion == "" and pagina == paginas - 1):
+            return
+        if opcion == "":
+            pagina += 1
+        elif opcion == "a":
+            pagina = max(pagina - 1, 0)
+        elif opcion.isdigit():
+            pagina = min(max(int(opcion) - 1, 0), paginas - 1)
+        else:
+            print("Error: Opción inválida.")
+
+def write_table(ruta: str, filas_de: Callable, total: int, renglones_por_bloque: int = RENGLONES_POR_BLOQUE) -> str:
+    """
+    Escribe una tabla completa en un CSV por bloques de renglones.
+
+    Solo un bloque está formateado en memoria a la vez, así que sirve para
+    tablas de millones de renglones.
+
+    Args:
+        ruta (str): Archivo CSV de salida
+        filas_de: Función (inicio, fin) -> DataFrame con los renglones [inicio, fin)
+        total (int): Cantidad de renglones de la tabla
+        renglones_por_bloque (int): Renglones formateados a la vez
+
+    Returns:
+        str: La ruta escrita
+    """
+    with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+        for inicio in range(0, max(total, 1), renglones_por_bloque):
+            filas_de(inicio, min(inicio + renglones_por_bloque, total)).to_csv(
+                archivo, header=inicio == 0, index=False
+            )
+    return ruta
+
+def _result_rows(resultados, clave: str) -> tuple:
+    """(filas_de, total) de una tabla de un resultado; construye solo los renglones pedidos si puede."""
+    if hasattr(resultados, 'table_rows'):
+        return (lambda inicio, fin: resultados.table_rows(clave, inicio, fin)), resultados.table_length(clave)
+    tabla = resultados[clave]
+    return (lambda inicio, fin: tabla.iloc[inicio:fin]), len(tabla)
+
+def summary_statistics(numeros) -> dict:
+    """
+    Cantidad, media, desviación estándar, mínimo y máximo en un solo recorrido.
+
+    La secuencia se procesa por bloques (media y varianza se combinan con la
+    fórmula de Chan), así que un np.memmap se lee una sola vez sin copiarlo.
+
+    Args:
+        numeros: Lista, arreglo o np.memmap con la secuencia
+
+    Returns:
+        dict: cantidad, media, desviacion, minimo, maximo
+    """
+    arreglo = np.asarray(numeros)
+    if arreglo.size == 0:
+        raise ValueError("No hay números para calcular estadísticas")
+    cantidad, media, m2 = 0, 0.0, 0.0
+    minimo, maximo = math.inf, -math.inf
+    for inicio in range(0, arreglo.size, TAMANO_BLOQUE_ESTADISTICAS):
+        bloque = np.asarray(arreglo[inicio:inicio + TAMANO_BLOQUE_ESTADISTICAS], dtype=np.float64)
+        media_bloque = float(bloque.mean())
+        m2_bloque = float(np.square(bloque - media_bloque).sum())
+        delta, total = media_bloque - media, cantidad + bloque.size
+        media += delta * bloque.size / total
+        m2 += m2_bloque + delta * delta * cantidad * bloque.size / total
+        cantidad = total
+        minimo, maximo = min(minimo, float(bloque.min())), max(maximo, float(bloque.max()))
+    return {
+        "cantidad": cantidad,
+        "media": media,
+        "desviacion": math.sqrt(m2 / (cantidad - 1)) if cantidad > 1 else 0.0,
+        "minimo": minimo,
+        "maximo": maximo,
+    }
+
+@instrumented("mostrar")
 def show_generator_table(
         numeros: List[float], 
         metodo: str, 
         semilla: Union[int, str, Tuple[int, int]], 
-        parametros: dict):
+        parametros: dict,
+        interactivo: bool = True):
     """
     Muestra los resultados de un generador en formato tabla
     
+    Con secuencias largas solo se formatean los primeros y últimos números
+    (ver show_table), así que el costo no crece con la cantidad de números.
+    
     Args:
-        numeros: Lista de números generados
+        numeros: Lista o arreglo de números generados
         metodo: Nombre del método usado
         semilla: Semilla(s) utilizada(s)
         parametros: Diccionario con parámetros adicionales
+        interactivo: Ofrecer paginar o guardar la tabla cuando se recorta
     """
     print("\n" + "=" * 80)
     print(f"Resultados - {metodo.upper()}")
@@ -109,32 +273,71 @@ def show_generator_table(
     for key, value in parametros.items():
         info.append([key, value])
     
-    print(tabulate(info, tablefmt="fancy_grid"))
+    print(_tabulate(info, tablefmt="fancy_grid", disable_numparse=True))
+    
+    arreglo = np.asarray(numeros)
+    
+    def filas_de(inicio, fin):
+        with phase("dataframe"):
+            return pd.DataFrame({
+                'i': range(inicio + 1, fin + 1),
+                'Número (ri)': [f"{num:.6f}" for num in arreglo[inicio:fin].tolist()]
+            })
     
     print("\nNúmeros generados:")
-    df = pd.DataFrame({
-        'i': range(1, len(numeros) + 1),
-        'Número (ri)': [f"{num:.6f}" for num in numeros]
-    })
-    print(tabulate(df.to_dict('records'), headers='keys', tablefmt='fancy_grid', showindex=False))
+    show_table(filas_de, len(arreglo), interactivo)
     
     print("\nEstadísticas:")
+    with phase("estadisticas"):
+        resumen = summary_statistics(arreglo)
     stats = [
-        ["Media", f"{sum(numeros)/len(numeros):.6f}"],
-        ["Mínimo", f"{min(numeros):.6f}"],
-        ["Máximo", f"{max(numeros):.6f}"],
-        ["Cantidad", len(numeros)]
+        ["Media", f"{resumen['media']:.6f}"],
+        ["Desviación estándar", f"{resumen['desviacion']:.6f}"],
+        ["Mínimo", f"{resumen['minimo']:.6f}"],
+        ["Máximo", f"{resumen['maximo']:.6f}"],
+        ["Cantidad", resumen['cantidad']]
     ]
-    print(tabulate(stats, tablefmt="fancy_grid"))
+    print(_tabulate(stats, tablefmt="fancy_grid", disable_numparse=True))
     print("=" * 80)
 
-def show_test_results(resultados: dict, nombre_prueba: str):
+@instrumented("mostrar")
+def show_lcg_period(resultado: dict):
+    """
+    Muestra el análisis de periodo del algoritmo lineal congruencial
+    
+    Args:
+        resultado: Diccionario devuelto por RandomGenerators.lcg_period
+    """
+    print("\n" + "=" * 80)
+    print("Análisis de periodo - ALGORITMO LINEAL CONGRUENCIAL")
+    print("=" * 80)
+    
+    info = [
+        ["Semilla (X0)", resultado['semilla']],
+        ["Multiplicador (a)", resultado['a']],
+        ["Incremento (c)", resultado['c']],
+        ["Módulo (m)", resultado['m']],
+        ["Periodo", resultado['periodo']],
+        ["Cola (números antes del ciclo)", resultado['cola']],
+        ["Periodo completo (m)", "Sí" if resultado['periodo_completo'] else "No"],
+        ["Método", resultado['metodo']],
+    ]
+    print(_tabulate(info, tablefmt="fancy_grid", disable_numparse=True))
+    
+    print("\nCondiciones de Hull-Dobell:")
+    condiciones = [[condicion, "Sí" if cumple else "No"] for condicion, cumple in resultado['condiciones'].items()]
+    print(_tabulate(condiciones, tablefmt="fancy_grid", disable_numparse=True))
+    print("=" * 80)
+
+@instrumented("mostrar")
+def show_test_results(resultados: dict, nombre_prueba: str, interactivo: bool = True):
     """
     Muestra los resultados de una prueba estadística
     
     Args:
         resultados: Diccionario con resultados de la prueba
         nombre_prueba: Nombre de la prueba realizada
+        interactivo: Ofrecer paginar o guardar las tablas largas (ver show_table)
     """
     print("\n" + "=" * 80)
     print(f"Resultados - Prueba de {nombre_prueba.upper()}")
@@ -145,17 +348,20 @@ def show_test_results(resultados: dict, nombre_prueba: str):
         ["Cantidad de números (n)", resultados.get('n', 'N/A')],
         ["Nivel de significancia (α)", resultados.get('alpha', 'N/A')],
     ]
-    print(tabulate(info_general, tablefmt="fancy_grid"))
+    print(_tabulate(info_general, tablefmt="fancy_grid", disable_numparse=True))
     
     # Resultados específicos según el tipo de prueba
     if nombre_prueba == "Chi-Cuadrada":
-        mostrar_chi_cuadrada(resultados)
+        mostrar_chi_cuadrada(resultados, interactivo)
     elif nombre_prueba == "Kolmogorov-Smirnov":
-        mostrar_kolmogorov(resultados)
+        mostrar_kolmogorov(resultados, interactivo)
     elif "Corridas" in nombre_prueba:
-        mostrar_corridas(resultados)
+        mostrar_corridas(resultados, interactivo)
     elif nombre_prueba == "Huecos":
-        mostrar_huecos(resultados)
+        mostrar_huecos(resultados, interactivo)
+
+    if hasattr(resultados, 'decisions'):
+        mostrar_decisiones(resultados)
     
     print("\n" + "=" * 80)
     print("Conclusión:")
@@ -171,21 +377,32 @@ def show_test_results(resultados: dict, nombre_prueba: str):
     
     print("=" * 80)
 
-def mostrar_chi_cuadrada(resultados: dict):
+def mostrar_decisiones(resultados, alphas=NIVELES_SIGNIFICANCIA):
+    """Muestra la decisión de la prueba en cada nivel de significancia, con el mismo estadístico"""
+    print(f"\nDecisión por nivel de significancia:")
+    decisiones = [
+        [f"{1 - alpha:.0%}", alpha, "Se acepta" if aceptado else "Se rechaza"]
+        for alpha, aceptado in resultados.decisions(alphas).items()
+    ]
+    print(_tabulate(decisiones, headers=["Confianza", "α", "Hipótesis"], tablefmt="fancy_grid",
+                    disable_numparse=True))
+
+def mostrar_chi_cuadrada(resultados: dict, interactivo: bool = True):
     """Muestra resultados específicos de Chi-Cuadrada"""
     print(f"\nEstadísticos:")
     stats = [
         ["Chi-cuadrado calculado (x²)", f"{resultados.get('chi_cuadrado', 0):.6f}"],
         ["Chi-cuadrado crítico", f"{resultados.get('chi_critico', 0):.6f}"],
         ["Grados de libertad", resultados.get('grados_libertad', 'N/A')],
+        ["Valor p", f"{resultados.get('p_valor', 0):.6f}"],
     ]
-    print(tabulate(stats, tablefmt="fancy_grid"))
+    print(_tabulate(stats, tablefmt="fancy_grid", disable_numparse=True))
     
     if 'tabla_frecuencias' in resultados:
         print("\nTabla de Frecuencias:")
-        print(tabulate(resultados['tabla_frecuencias'], headers='keys', tablefmt='fancy_grid', showindex=False))
+        show_table(*_result_rows(resultados, 'tabla_frecuencias'), interactivo)
 
-def mostrar_kolmogorov(resultados: dict):
+def mostrar_kolmogorov(resultados: dict, interactivo: bool = True):
     """Muestra resultados específicos de Kolmogorov-Smirnov"""
     print(f"\nEstadísticos:")
     stats = [
@@ -193,14 +410,17 @@ def mostrar_kolmogorov(resultados: dict):
         ["D- (máxima diferencia negativa)", f"{resultados.get('D_minus', 0):.6f}"],
         ["D (estadístico de prueba)", f"{resultados.get('D', 0):.6f}"],
         ["D crítico", f"{resultados.get('D_critico', 0):.6f}"],
+        ["Valor p", f"{resultados.get('p_valor', 0):.6f}"],
     ]
-    print(tabulate(stats, tablefmt="fancy_grid"))
+    if 'cota_error' in resultados:
+        stats.append(["Cota de error de D", f"{resultados['cota_error']:.2e}"])
+    print(_tabulate(stats, tablefmt="fancy_grid", disable_numparse=True))
     
     if 'tabla_completa' in resultados:
         print("\nTabla Detallada:")
-        print(tabulate(resultados['tabla_completa'], headers='keys', tablefmt='fancy_grid', showindex=False))
+        show_table(*_result_rows(resultados, 'tabla_completa'), interactivo)
 
-def mostrar_corridas(resultados: dict):
+def mostrar_corridas(resultados: dict, interactivo: bool = True):
     """Muestra resultados específicos de pruebas de corridas"""
     print(f"\nEstadísticos:")
     stats = [
@@ -209,32 +429,34 @@ def mostrar_corridas(resultados: dict):
         ["Desviación estándar", f"{resultados.get('sigma_Co', 0):.4f}"],
         ["Estadístico Z₀", f"{resultados.get('Z0', 0):.4f}"],
         ["Valor crítico Z", f"{resultados.get('Z_critico', 0):.4f}"],
+        ["Valor p", f"{resultados.get('p_valor', 0):.6f}"],
     ]
     
     if 'n0' in resultados:  # Para corridas de la media
         stats.insert(1, ["Números debajo (n₀)", resultados['n0']])
         stats.insert(2, ["Números arriba (n₁)", resultados['n1']])
     
-    print(tabulate(stats, tablefmt="fancy_grid"))
+    print(_tabulate(stats, tablefmt="fancy_grid", disable_numparse=True))
     
     if 'tabla' in resultados:
         print("\nTabla Detallada:")
-        print(tabulate(resultados['tabla'], headers='keys', tablefmt='fancy_grid', showindex=False))
+        show_table(*_result_rows(resultados, 'tabla'), interactivo)
     elif 'tabla_simbolos' in resultados:
         print("\nTabla de Símbolos:")
-        print(tabulate(resultados['tabla_simbolos'], headers='keys', tablefmt='fancy_grid', showindex=False))
+        show_table(*_result_rows(resultados, 'tabla_simbolos'), interactivo)
 
-def mostrar_huecos(resultados: dict):
+def mostrar_huecos(resultados: dict, interactivo: bool = True):
     """Muestra resultados específicos de prueba de huecos"""
     print(f"\nEstadísticos:")
     stats = [
         ["Chi-cuadrado calculado (x²)", f"{resultados.get('chi_cuadrado', 0):.6f}"],
         ["Chi-cuadrado crítico", f"{resultados.get('chi_critico', 0):.6f}"],
         ["Grados de libertad", resultados.get('grados_libertad', 'N/A')],
+        ["Valor p", f"{resultados.get('p_valor', 0):.6f}"],
         ["Total de huecos", resultados.get('total_huecos', 'N/A')],
     ]
-    print(tabulate(stats, tablefmt="fancy_grid"))
+    print(_tabulate(stats, tablefmt="fancy_grid", disable_numparse=True))
     
     if 'tabla_huecos' in resultados:
         print("\nDistribución de Huecos:")
-        print(tabulate(resultados['tabla_huecos'], headers='keys', tablefmt='fancy_grid', showindex=False))
+        show_table(*_result_rows(resultados, 'tabla_huecos'), interactivo)